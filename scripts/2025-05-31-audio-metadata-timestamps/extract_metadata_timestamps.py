@@ -1,2 +1,48 @@
-# This script will be used to extract timestamps from audio metadata.
-# It is currently empty and will be populated later.
+#!/usr/bin/env python3
+"""
+List the recording time stored in the metadata of each audio file in a directory.
+
+Prints the filename timestamp, the metadata timestamp and the mtime side by side, to see
+which source is available and how far they disagree.
+
+Usage:
+    PYTHONPATH=src python extract_metadata_timestamps.py DIRECTORY
+"""
+
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+from speechdown.infrastructure.adapters.file_timestamp_adapter import (
+    extract_timestamp_from_filename,
+)
+from speechdown.infrastructure.audio_metadata import read_recording_time
+from speechdown.infrastructure.file_walker import walk_audio_files
+
+
+def _format(value: datetime | None) -> str:
+    return value.isoformat(sep=" ") if value else "-"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("directory", type=Path, help="Directory with audio files")
+    args = parser.parse_args()
+
+    found = 0
+    total = 0
+    print(f"{'filename':<19}  {'metadata':<19}  {'mtime':<19}  path")
+    for path, stat in walk_audio_files(args.directory):
+        total += 1
+        from_metadata = read_recording_time(Path(path))
+        found += from_metadata is not None
+        print(
+            f"{_format(extract_timestamp_from_filename(Path(path).name)):<19}  "
+            f"{_format(from_metadata):<19}  "
+            f"{_format(datetime.fromtimestamp(int(stat.st_mtime))):<19}  {path}"
+        )
+    print(f"\n{found} of {total} files have a recording time in their metadata")
+
+
+if __name__ == "__main__":
+    main()
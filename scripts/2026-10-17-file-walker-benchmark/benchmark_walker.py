@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Compare the `os.scandir` walker with the previous `Path.glob("**/*")` collection.
+
+Builds a synthetic project (or uses an existing directory) and times how long each
+approach takes to find the audio files. Only the file system walk is measured; timestamp
+extraction is the same for both and left out.
+
+Usage:
+    python benchmark_walker.py [--directory DIR] [--files N] [--noise N] [--threads N]
+
+Examples:
+    python benchmark_walker.py --files 20000 --noise 50000
+    python benchmark_walker.py --directory /mnt/nas/recordings --threads 8
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from speechdown.infrastructure.file_walker import (
+    SOUND_EXTENSIONS,
+    IgnoreRules,
+    walk_audio_files,
+)
+
+FILES_PER_DIRECTORY = 50
+
+
+def glob_collect(directory: Path) -> list[Path]:
+    """The collection loop used before the walker, without timestamp extraction."""
+    return [
+        path
+        for path in directory.glob("**/*")
+        if path.is_file()
+        and path.suffix.lower() in SOUND_EXTENSIONS
+        and not path.stem.startswith(".")
+        and path.stat().st_mtime
+    ]
+
+
+def walker_collect(directory: Path, threads: int) -> list[str]:
+    rules = IgnoreRules.load(directory, [directory / "transcripts"])
+    return [path for path, _ in walk_audio_files(directory, rules, threads=threads)]
+
+
+def build_project(root: Path, audio_files: int, noise_files: int) -> None:
+    """Recordings in dated folders, plus files a project typically also contains."""
+    for i in range(audio_files):
+        directory = root / f"{2020 + i // 10000}" / f"{i // FILES_PER_DIRECTORY:04d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"memo_{i}.m4a").touch()
+    for i in range(noise_files):
+        parent = [".git/objects", "node_modules/pkg", "transcripts", ".speechdown/cache"][i % 4]
+        directory = root / parent / f"{i // FILES_PER_DIRECTORY:04d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"entry_{i}").touch()
+
+
+def measure(label: str, collect, repeat: int) -> None:
+    timings = []
+    found = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        found = len(collect())
+        timings.append(time.perf_counter() - start)
+    print(f"{label:<24} {found:>8} files  median {statistics.median(timings) * 1000:9.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--directory", type=Path, help="Existing directory to scan")
+    parser.add_argument("--files", type=int, default=10000, help="Synthetic audio files")
+    parser.add_argument("--noise", type=int, default=20000, help="Synthetic non-audio files")
+    parser.add_argument("--threads", type=int, default=8, help="Threads for the threaded walk")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directory = args.directory
+        if directory is None:
+            directory = Path(temp_dir)
+            build_project(directory, args.files, args.noise)
+        print(f"Scanning {directory} ({os.cpu_count()} CPUs)")
+        measure("Path.glob", lambda: glob_collect(directory), args.repeat)
+        measure("scandir walker", lambda: walker_collect(directory, 1), args.repeat)
+        measure(
+            f"scandir walker x{args.threads}",
+            lambda: walker_collect(directory, args.threads),
+            args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
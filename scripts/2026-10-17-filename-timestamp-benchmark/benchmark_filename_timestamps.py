@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Compare filename timestamp extraction before and after the latest-match regex rewrite.
+
+Generates realistic recorder filenames, checks that both implementations return the same
+timestamp for every name, and times them. The previous implementation tried
+`pattern.match(name[i:])` at every position from the end, once per pattern.
+
+Usage:
+    python benchmark_filename_timestamps.py [--files N] [--repeat N]
+"""
+
+import argparse
+import random
+import re
+import statistics
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from speechdown.infrastructure.adapters.file_timestamp_adapter import (
+    FILENAME_CACHE_SIZE,
+    TIMESTAMP_PATTERNS,
+    _validate_timestamp_components,
+    extract_timestamp_from_filename,
+)
+
+CONTACTS = ["John Smith", "Mom", "Office", "+380999999999", "Dr. Kowalski", "Unknown"]
+
+
+def legacy_extract(filename: str) -> Optional[datetime]:
+    """The backwards search used before, without logging."""
+    for config in TIMESTAMP_PATTERNS:
+        pattern: re.Pattern[str] = config["regex"]  # type: ignore[assignment]
+        for i in range(len(filename) - 1, -1, -1):
+            match = pattern.match(filename[i:])
+            if match:
+                break
+        else:
+            continue
+        try:
+            return datetime(
+                *_validate_timestamp_components(match.groupdict(), bool(config["is_yy"]))
+            )
+        except (ValueError, OverflowError):
+            continue
+    return None
+
+
+def random_filename(rng: random.Random) -> str:
+    """A name as written by a phone voice recorder, call recorder or field recorder."""
+    moment = datetime(2018, 1, 1) + (datetime(2026, 1, 1) - datetime(2018, 1, 1)) * rng.random()
+    kind = rng.randrange(6)
+    if kind == 0:
+        return f"Recording_{moment:%Y%m%d_%H%M%S}.m4a"
+    if kind == 1:
+        return f"{moment:%Y%m%d %H%M%S}.wav"
+    if kind == 2:
+        return f"Call recording {rng.choice(CONTACTS)}_{moment:%y%m%d_%H%M%S}.m4a"
+    if kind == 3:
+        return f"{rng.choice(CONTACTS)}_{moment:%y%m%d_%H%M%S}_{rng.randrange(99):02d}.amr"
+    if kind == 4:
+        return f"ZOOM{rng.randrange(10000):04d}_{moment:%Y%m%d_%H%M%S}_Tr1.WAV"
+    return f"Voice {rng.randrange(1000):03d} - notes about the meeting.m4a"
+
+
+def time_run(extract: Callable[[str], Optional[datetime]], names: list[str]) -> float:
+    start = time.perf_counter()
+    for name in names:
+        extract(name)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=100_000, help="Number of filenames")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    names = [random_filename(random.Random(i)) for i in range(args.files)]
+
+    mismatches = [
+        name for name in names if legacy_extract(name) != extract_timestamp_from_filename(name)
+    ]
+    print(f"{len(names)} filenames, {len(mismatches)} mismatches")
+    for name in mismatches[:10]:
+        print(f"  {name!r}")
+
+    def uncached(name: str) -> Optional[datetime]:
+        return extract_timestamp_from_filename.__wrapped__(name)
+
+    def cold(names: list[str]) -> float:
+        extract_timestamp_from_filename.cache_clear()
+        return time_run(extract_timestamp_from_filename, names)
+
+    # A run looks the same names up several times: collection, repository reads, output
+    repeated = names[:FILENAME_CACHE_SIZE]
+
+    def warm(names: list[str]) -> float:
+        cold(names)
+        return time_run(extract_timestamp_from_filename, names)
+
+    measurements = {
+        "backwards search": lambda: time_run(legacy_extract, names),
+        "latest-match regex": lambda: time_run(uncached, names),
+        "latest-match regex, cold cache": lambda: cold(names),
+        f"cached repeat of {len(repeated)} names": lambda: warm(repeated),
+    }
+    for label, measure in measurements.items():
+        seconds = statistics.median(measure() for _ in range(args.repeat))
+        print(f"{label:<34} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
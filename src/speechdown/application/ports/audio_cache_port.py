@@ -0,0 +1,13 @@
+from typing import Any, Protocol
+
+
+class AudioCachePort(Protocol):
+    """Port for decoded audio kept between runs, keyed by the content hash of the file."""
+
+    def load_audio(self, content_hash: str) -> Any | None:
+        """Return the cached samples of the file with this content, or None on a miss."""
+        ...
+
+    def store_audio(self, content_hash: str, audio: Any) -> None:
+        """Keep the decoded samples of the file with this content for later runs."""
+        ...
@@ -0,0 +1,19 @@
+from pathlib import Path
+from typing import Any, Protocol
+
+from speechdown.domain.entities import AudioFile
+
+
+class AudioFingerprintPort(Protocol):
+    """Port for recognizing near-duplicate recordings, e.g. the same note exported twice."""
+
+    def index_and_match(
+        self, audio_file: AudioFile, audio: Any, min_similarity: float
+    ) -> list[Path]:
+        """
+        Fingerprint the decoded audio, remember it for the file, and return the other
+        indexed recordings that sound the same, most similar first.
+
+        `min_similarity` is the share of fingerprint bits, between 0 and 1, that must agree.
+        """
+        ...
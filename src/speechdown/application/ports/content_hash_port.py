@@ -0,0 +1,11 @@
+from typing import Protocol
+
+from speechdown.domain.entities import AudioFile
+
+
+class ContentHashPort(Protocol):
+    """Port for hashing the contents of audio files, to recognize copies and moved files."""
+
+    def get_content_hash(self, audio_file: AudioFile) -> str | None:
+        """Return a hash of the file's bytes, or None if the file can't be read."""
+        ...
@@ -0,0 +1,22 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Protocol
+
+from speechdown.domain.entities import AudioFile
+
+
+class FileIndexPort(Protocol):
+    """Port for a persistent index of scanned audio files, used by incremental runs."""
+
+    def collect_changed_audio_files(
+        self,
+        directory: Path,
+        start_dt: datetime | None = None,
+        end_dt: datetime | None = None,
+    ) -> list[AudioFile]:
+        """Collect the audio files that are new or changed since the last `commit`."""
+        ...
+
+    def commit(self) -> None:
+        """Record the state seen by the last collect, once its files have been handled."""
+        ...
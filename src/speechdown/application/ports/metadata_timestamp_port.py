@@ -0,0 +1,17 @@
+from datetime import datetime
+import os
+from pathlib import Path
+from typing import Protocol
+
+
+class MetadataTimestampPort(Protocol):
+    """Port for recording times stored in audio file metadata."""
+
+    def get_metadata_timestamp(self, path: Path, stat: os.stat_result) -> datetime | None:
+        """
+        Return the recording time from the file's metadata, or None if it has none.
+
+        `stat` is the file's current stat result; it tells whether a remembered result
+        still applies.
+        """
+        ...
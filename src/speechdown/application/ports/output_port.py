@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Protocol
+from typing import Iterable, Protocol
 from speechdown.domain.entities import TranscriptionResult
 
 
@@ -7,3 +7,9 @@ class OutputPort(Protocol):
     def output_transcription_results(
         self, transcription_results: list[TranscriptionResult], path: Path | None = None
     ) -> None: ...
+
+    def output_transcription_stream(
+        self, transcription_results: Iterable[TranscriptionResult], path: Path | None = None
+    ) -> int:
+        """Output results as they arrive instead of all at the end; returns how many."""
+        ...
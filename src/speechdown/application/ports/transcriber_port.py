@@ -1,14 +1,48 @@
-from typing import Protocol
+from typing import Any, Protocol
 from speechdown.domain.entities import AudioFile, Transcription
 from speechdown.domain.value_objects import Language
 from speechdown.application.ports.transcription_model_port import TranscriptionModelPort
 
 
 class TranscriberPort(Protocol):
-    """Port for transcription services."""
+    """Port for transcription services.
+
+    `audio` arguments accept the result of `load_audio` so that the file is decoded once
+    per file instead of once per language attempt. When omitted, the file is read from disk.
+    """
 
     def __init__(self, model: TranscriptionModelPort): ...
 
+    def load_audio(self, audio_file: AudioFile) -> Any:
+        """Decode the audio file once so it can be shared by several attempts."""
+        ...
+
     def auto_transcribe(self, audio_file: AudioFile) -> Transcription: ...
 
-    def transcribe(self, audio_file: AudioFile, language: Language) -> Transcription: ...
+    def transcribe(
+        self, audio_file: AudioFile, language: Language, audio: Any = None
+    ) -> Transcription: ...
+
+    def transcribe_batch(
+        self, audio_files: list[AudioFile], language: Language, audios: list[Any]
+    ) -> list[Transcription]:
+        """Transcribe several files in one language, one Transcription per file in order."""
+        ...
+
+    def split_audio(
+        self, audio_file: AudioFile, chunk_seconds: float, audio: Any = None
+    ) -> list[Any]:
+        """Cut a long recording into consecutive chunks, each accepted as `audio`."""
+        ...
+
+    def stitch_transcriptions(
+        self, audio_file: AudioFile, parts: list[Transcription], chunks: list[Any]
+    ) -> Transcription:
+        """Combine the transcriptions of the chunks from `split_audio` into one."""
+        ...
+
+    def detect_language(
+        self, audio_file: AudioFile, languages: list[Language], audio: Any = None
+    ) -> dict[Language, float]:
+        """Return the probability of each candidate language, empty if unsupported."""
+        ...
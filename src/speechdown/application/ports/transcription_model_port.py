@@ -1,20 +1,36 @@
-from typing import Protocol, Dict, Any
+from typing import Protocol, Dict, Any, List
 
 
 class TranscriptionModelPort(Protocol):
-    """Port for transcription models like Whisper."""
+    """Port for transcription models like Whisper.
+
+    Audio can be passed either as a path or as samples returned by `load_audio`, so a file
+    is decoded once and reused across several transcription attempts.
+    """
 
     @property
     def name(self) -> str:
         """Return the name of the model"""
         ...
 
-    def transcribe(self, audio_path: str, language: str | None = None) -> Dict[str, Any]:
+    def load_audio(self, audio_path: str) -> Any:
         """
-        Transcribe audio file at the given path.
+        Decode an audio file into the sample format the model consumes.
 
         Args:
             audio_path: Path to the audio file
+
+        Returns:
+            Decoded audio samples (for Whisper: mono 16 kHz float32 numpy array)
+        """
+        ...
+
+    def transcribe(self, audio: str | Any, language: str | None = None) -> Dict[str, Any]:
+        """
+        Transcribe audio given as a file path or as decoded samples.
+
+        Args:
+            audio: Path to the audio file or samples returned by `load_audio`
             language: Optional language code to use for transcription
 
         Returns:
@@ -25,3 +41,37 @@ class TranscriptionModelPort(Protocol):
             - segments: List of segments with timing, confidence info, etc.
         """
         ...
+
+    def is_batchable(self, audio: Any) -> bool:
+        """Return True if the decoded samples can be part of a `transcribe_batch` call."""
+        ...
+
+    def transcribe_batch(
+        self, audios: List[Any], language: str | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe several short clips in one forward pass.
+
+        Args:
+            audios: Samples returned by `load_audio`, each accepted by `is_batchable`
+            language: Optional language code to use for every clip
+
+        Returns:
+            One result per clip, in the same format as `transcribe`
+        """
+        ...
+
+    def detect_language(
+        self, audio: str | Any, languages: List[str] | None = None
+    ) -> Dict[str, float]:
+        """
+        Detect the spoken language without transcribing the whole file.
+
+        Args:
+            audio: Path to the audio file or samples returned by `load_audio`
+            languages: Optional language codes to restrict the candidates to
+
+        Returns:
+            Mapping of language code to probability. Empty if detection is not supported.
+        """
+        ...
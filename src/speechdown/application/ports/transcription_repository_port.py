@@ -1,9 +1,14 @@
 from pathlib import Path
-from typing import Protocol, List
-from speechdown.domain.entities import CachedTranscription, Transcription
+from typing import ContextManager, Protocol, List
+from speechdown.domain.entities import AudioFile, CachedTranscription, Transcription
+from speechdown.domain.value_objects import Language
 
 
 class TranscriptionRepositoryPort(Protocol):
+    def transaction(self) -> ContextManager[None]:
+        """Unit of work: writes inside the block commit together, or not at all on error."""
+        ...
+
     def save_transcription(self, transcription: Transcription | CachedTranscription | None) -> None:
         pass
 
@@ -13,6 +18,23 @@ class TranscriptionRepositoryPort(Protocol):
     def get_best_transcription(self, path: Path) -> Transcription | None:
         pass
 
+    def get_best_transcriptions(self, audio_files: List[AudioFile]) -> dict[Path, Transcription]:
+        """Get the best transcription of each file in one pass; files without one are missing."""
+        pass
+
+    def get_best_transcriptions_by_content(
+        self, content_hashes: List[str], model_names: List[str], languages: List[Language]
+    ) -> dict[str, Transcription]:
+        """
+        Get the best transcription per content hash, made by one of `model_names` (any if
+        empty) in one of `languages`; hashes without one are missing.
+        """
+        pass
+
     def delete_transcriptions(self, path: Path) -> None:
         """Delete all transcriptions for the given audio file."""
         pass
+
+    def get_language_frequencies(self, directory: Path) -> dict[Language, int]:
+        """Count the languages of the best transcriptions of the files in `directory`."""
+        pass
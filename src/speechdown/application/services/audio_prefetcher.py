@@ -0,0 +1,78 @@
+"""Bounded read-ahead that decodes upcoming audio files while the current one is transcribed."""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import logging
+from typing import Any, Callable, Iterator
+
+from speechdown.domain.entities import AudioFile
+
+logger = logging.getLogger(__name__)
+
+
+def _buffered_size(future: Future) -> int:
+    """Size in bytes of a finished decode; running decodes aren't counted yet."""
+    if not future.done() or future.exception() is not None:
+        return 0
+    nbytes = getattr(future.result(), "nbytes", 0)
+    return nbytes if isinstance(nbytes, int) else 0
+
+
+class AudioPrefetcher:
+    """
+    Decode the next `depth` files on a thread pool, in input order.
+
+    Decoding is mostly spent waiting on the ffmpeg subprocess, so it overlaps well with
+    inference on the current file. To keep memory bounded, no new decode is started while
+    the decoded-but-not-yet-consumed audio exceeds `max_buffered_bytes`; the file being
+    transcribed and the decodes already running are not counted, so the cap is approximate.
+    """
+
+    def __init__(
+        self,
+        load_audio: Callable[[AudioFile], Any],
+        depth: int,
+        max_buffered_bytes: int,
+    ):
+        self.load_audio = load_audio
+        self.depth = depth
+        self.max_buffered_bytes = max_buffered_bytes
+
+    def iter_decoded(self, audio_files: list[AudioFile]) -> Iterator[tuple[AudioFile, Any]]:
+        """
+        Yield each file together with its decoded audio.
+
+        Decode errors are raised when the failing file is reached, as without prefetching.
+        """
+        if self.depth < 1:
+            for audio_file in audio_files:
+                yield audio_file, self.load_audio(audio_file)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=self.depth, thread_name_prefix="audio-prefetch"
+        ) as executor:
+            queue: deque[tuple[AudioFile, Future]] = deque()
+            upcoming = iter(audio_files)
+
+            def fill() -> None:
+                while len(queue) < self.depth:
+                    if queue and (
+                        sum(_buffered_size(future) for _, future in queue)
+                        >= self.max_buffered_bytes
+                    ):
+                        logger.debug("Prefetch buffer is full; waiting for the consumer")
+                        return
+                    audio_file = next(upcoming, None)
+                    if audio_file is None:
+                        return
+                    queue.append((audio_file, executor.submit(self.load_audio, audio_file)))
+
+            fill()
+            while queue:
+                audio_file, future = queue.popleft()
+                audio = future.result()
+                # Start the next decode before handing this file over for inference
+                fill()
+                yield audio_file, audio
+                del audio
@@ -0,0 +1,108 @@
+"""Long-file mode: transcribe recordings in chunks and stitch each file back together.
+
+Whisper's 30-second sliding window is serial within a file, because every window is
+conditioned on the text of the previous one. Cutting a long recording at quiet moments into
+chunks of a few minutes lets a worker pool transcribe the chunks of one file at once.
+"""
+
+from collections import deque
+from concurrent.futures import Executor, Future
+import logging
+from typing import Any, Callable, Iterator
+
+from speechdown.application.ports.transcriber_port import TranscriberPort
+from speechdown.application.services.file_transcription import (
+    select_languages,
+    with_detection_confidence,
+)
+from speechdown.application.services.parallel_transcription import (
+    select_languages_in_worker,
+    transcribe_chunk_in_worker,
+)
+from speechdown.application.services.transcription_options import TranscriptionOptions
+from speechdown.domain.entities import AudioFile, Transcription
+from speechdown.domain.value_objects import Language
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkedFileTranscriber:
+    """
+    Transcribe files chunk by chunk, on a `transcriber_pool` or in-process.
+
+    The transcriber of this process splits each file and stitches the chunk results, which
+    needs no model; language detection and chunk transcriptions run in the pool, so only
+    the workers load a model. Several files are kept in flight so the workers
+    stay busy across file boundaries, while attempts are still yielded in input order.
+    All selected languages are submitted at once, so there is no early exit here.
+    """
+
+    def __init__(
+        self,
+        transcriber: TranscriberPort,
+        languages_for: Callable[[AudioFile], list[Language]],
+        options: TranscriptionOptions,
+        executor: Executor | None = None,
+    ):
+        self.transcriber = transcriber
+        self.languages_for = languages_for
+        self.options = options
+        self.executor = executor
+
+    def iter_attempts(
+        self, decoded: Iterator[tuple[AudioFile, Any]]
+    ) -> Iterator[list[Transcription]]:
+        """Yield the attempts for each decoded file, in input order."""
+        max_pending = self.options.workers if self.executor is not None else 0
+        pending: deque[Callable[[], list[Transcription]]] = deque()
+        for audio_file, audio in decoded:
+            pending.append(self._submit_file(audio_file, audio))
+            while len(pending) > max_pending:
+                yield pending.popleft()()
+        while pending:
+            yield pending.popleft()()
+
+    def _submit_file(
+        self, audio_file: AudioFile, audio: Any
+    ) -> Callable[[], list[Transcription]]:
+        """Start every attempt for one file; the returned callable waits for and stitches them."""
+        assert self.options.chunk_seconds is not None
+        chunks = self.transcriber.split_audio(audio_file, self.options.chunk_seconds, audio=audio)
+        # Detection only looks at the first 30 seconds, which the first chunk contains
+        languages = self.languages_for(audio_file)
+        if self.executor is not None:
+            detection = self.executor.submit(
+                select_languages_in_worker, audio_file, languages, chunks[0]
+            )
+            selected, detection_probs = detection.result()
+        else:
+            selected, detection_probs = select_languages(
+                self.transcriber, audio_file, languages, self.options, audio=chunks[0]
+            )
+        submitted = [
+            (language, [self._submit_chunk(audio_file, language, chunk) for chunk in chunks])
+            for language in selected
+        ]
+
+        def collect() -> list[Transcription]:
+            attempts = []
+            for language, futures in submitted:
+                parts = [future.result() for future in futures]
+                transcription = (
+                    parts[0]
+                    if len(parts) == 1
+                    else self.transcriber.stitch_transcriptions(audio_file, parts, chunks)
+                )
+                attempts.append(with_detection_confidence(transcription, detection_probs))
+            return attempts
+
+        return collect
+
+    def _submit_chunk(
+        self, audio_file: AudioFile, language: Language, chunk: Any
+    ) -> "Future[Transcription]":
+        if self.executor is not None:
+            return self.executor.submit(transcribe_chunk_in_worker, audio_file, language, chunk)
+        future: Future[Transcription] = Future()
+        future.set_result(self.transcriber.transcribe(audio_file, language, audio=chunk))
+        return future
@@ -0,0 +1,238 @@
+"""Per-file transcription steps shared by the sequential and the multi-process paths.
+
+These functions only talk to a TranscriberPort and never touch the repository, so they can
+run in worker processes while the parent process keeps ownership of all database writes.
+"""
+
+from dataclasses import replace
+import logging
+from typing import Any, Callable, Sequence
+
+from speechdown.application.ports.transcriber_port import TranscriberPort
+from speechdown.application.services.transcription_options import TranscriptionOptions
+from speechdown.domain.entities import AudioFile, Transcription
+from speechdown.domain.value_objects import Language
+
+logger = logging.getLogger(__name__)
+
+
+def select_languages(
+    transcriber: TranscriberPort,
+    audio_file: AudioFile,
+    languages: list[Language],
+    options: TranscriptionOptions,
+    audio: Any = None,
+) -> tuple[list[Language], dict[Language, float]]:
+    """
+    Decide which configured languages get a full transcription.
+
+    Whisper's language detection scores the first audio window once; only the top
+    language and those within `language_detection_margin` of it are kept, most likely
+    first. If detection is disabled or unsupported, every configured language is tried.
+
+    Returns:
+        The languages to transcribe and the detection probability of each language
+    """
+    if not options.detect_language or len(languages) < 2:
+        return languages, {}
+
+    probs = transcriber.detect_language(audio_file, languages, audio=audio)
+    if not probs:
+        return languages, {}
+
+    ranked = sorted(languages, key=lambda language: probs.get(language, 0.0), reverse=True)
+    top_prob = probs.get(ranked[0], 0.0)
+    selected = [
+        language
+        for language in ranked
+        if probs.get(language, 0.0) >= top_prob - options.language_detection_margin
+    ]
+    logger.debug(
+        f"Detected languages for {audio_file.path}: "
+        + ", ".join(f"{language}={probs.get(language, 0.0):.2f}" for language in ranked)
+        + f"; transcribing {', '.join(str(language) for language in selected)}"
+    )
+    return selected, probs
+
+
+def transcribe_file(
+    transcriber: TranscriberPort,
+    audio_file: AudioFile,
+    languages: list[Language],
+    options: TranscriptionOptions,
+    audio: Any = None,
+    escalations: Sequence[TranscriberPort] = (),
+) -> list[Transcription]:
+    """
+    Run every transcription attempt needed for one file.
+
+    Languages are tried in the given order (or by detection probability) and the loop
+    stops early once an attempt reaches `options.early_exit_confidence`.
+
+    Args:
+        audio: Samples already decoded by `transcriber.load_audio`, e.g. by a prefetcher
+        escalations: Transcribers with larger models, tried in order while the result
+                     falls outside the quality bounds of `options`
+
+    Returns:
+        The attempts in the order they were made; the caller saves them and picks the best
+    """
+    # Decode once; every language attempt below reuses the same samples
+    if audio is None:
+        audio = transcriber.load_audio(audio_file)
+    selected, detection_probs = select_languages(
+        transcriber, audio_file, languages, options, audio=audio
+    )
+
+    attempts = []
+    for language in selected:
+        logger.debug(f"Attempting transcription in {language}")
+        transcription = transcriber.transcribe(audio_file, language, audio=audio)
+        attempts.append(with_detection_confidence(transcription, detection_probs))
+        if is_confident_enough(transcription, options):
+            logger.debug(f"Confident transcription in {language}; skipping other languages")
+            break
+    attempted = [attempt.language for attempt in attempts]
+    return attempts + escalate(
+        escalations, audio_file, attempted, detection_probs, options, attempts, audio=audio
+    )
+
+
+def is_confident_enough(transcription: Transcription, options: TranscriptionOptions) -> bool:
+    """Return True if no other language needs to be tried after this transcription."""
+    confidence = transcription.metrics.confidence
+    return (
+        options.early_exit_confidence is not None
+        and confidence is not None
+        and confidence >= options.early_exit_confidence
+    )
+
+
+def needs_escalation(transcription: Transcription | None, options: TranscriptionOptions) -> bool:
+    """Return True if a transcription is too unlikely or too repetitive to be trusted."""
+    if transcription is None or transcription.metrics.confidence is None:
+        # Nothing was recognized (e.g. silence); a larger model won't find speech either
+        return False
+    compression_ratio = transcription.metrics.compression_ratio_mean
+    return transcription.metrics.confidence < options.cascade_min_confidence or (
+        compression_ratio is not None and compression_ratio > options.cascade_max_compression_ratio
+    )
+
+
+def escalate(
+    escalations: Sequence[TranscriberPort],
+    audio_file: AudioFile,
+    languages: list[Language],
+    detection_probs: dict[Language, float],
+    options: TranscriptionOptions,
+    attempts: list[Transcription],
+    audio: Any = None,
+) -> list[Transcription]:
+    """
+    Re-run a file with the next model of the cascade while the last model's best is poor.
+
+    Each escalation transcribes the same languages as the first model, reusing the
+    language detection and the decoded audio.
+
+    Returns:
+        The additional attempts, in the order they were made
+    """
+    extra: list[Transcription] = []
+    latest = attempts
+    for transcriber in escalations:
+        if not needs_escalation(select_best_transcription(latest), options):
+            break
+        logger.info(f"Low confidence for {audio_file.path}; escalating to a larger model")
+        latest = [
+            with_detection_confidence(
+                transcriber.transcribe(audio_file, language, audio=audio), detection_probs
+            )
+            for language in languages
+        ]
+        extra.extend(latest)
+    return extra
+
+
+def transcribe_files_batched(
+    transcriber: TranscriberPort,
+    items: list[tuple[AudioFile, Any]],
+    languages_for: Callable[[AudioFile], list[Language]],
+    options: TranscriptionOptions,
+    escalations: Sequence[TranscriberPort] = (),
+) -> list[list[Transcription]]:
+    """
+    Run the attempts for several already decoded files, batching files per language.
+
+    Each file selects its languages exactly as in `transcribe_file`. Attempts are then made
+    in rounds: round N runs the N-th selected language of every file, grouping the files
+    that share that language into one `transcribe_batch` call. Per file, the attempts come
+    out in the same order as with `transcribe_file`; a file leaves the later rounds once
+    one of its attempts is confident enough. Escalations to larger models are rare and run
+    per file.
+
+    Returns:
+        The attempts for each item, in input order
+    """
+    selections = [
+        select_languages(transcriber, audio_file, languages_for(audio_file), options, audio=audio)
+        for audio_file, audio in items
+    ]
+    attempts: list[list[Transcription]] = [[] for _ in items]
+
+    rounds = max((len(selected) for selected, _ in selections), default=0)
+    for n in range(rounds):
+        by_language: dict[Language, list[int]] = {}
+        for i, (selected, _) in enumerate(selections):
+            done = any(is_confident_enough(attempt, options) for attempt in attempts[i])
+            if n < len(selected) and not done:
+                by_language.setdefault(selected[n], []).append(i)
+
+        for language, indices in by_language.items():
+            logger.debug(f"Attempting batched transcription of {len(indices)} files in {language}")
+            transcriptions = transcriber.transcribe_batch(
+                [items[i][0] for i in indices], language, [items[i][1] for i in indices]
+            )
+            for i, transcription in zip(indices, transcriptions):
+                attempts[i].append(with_detection_confidence(transcription, selections[i][1]))
+
+    for i, (audio_file, audio) in enumerate(items):
+        attempted = [attempt.language for attempt in attempts[i]]
+        attempts[i] += escalate(
+            escalations, audio_file, attempted, selections[i][1], options, attempts[i], audio=audio
+        )
+    return attempts
+
+
+def with_detection_confidence(
+    transcription: Transcription, detection_probs: dict[Language, float]
+) -> Transcription:
+    """Record the detection probability of the transcription's language in its metrics."""
+    if transcription.language not in detection_probs:
+        return transcription
+    return replace(
+        transcription,
+        metrics=replace(
+            transcription.metrics,
+            language_detection_confidence=detection_probs[transcription.language],
+        ),
+    )
+
+
+def select_best_transcription(attempts: list[Transcription]) -> Transcription | None:
+    """Return the attempt with the highest confidence; earlier attempts win ties."""
+    best_transcription = None
+    for transcription in attempts:
+        current_confidence = transcription.metrics.confidence
+        best_confidence: float | None = (
+            best_transcription.metrics.confidence if best_transcription else None
+        )
+
+        if best_transcription is None or (
+            current_confidence is not None
+            and (best_confidence is None or current_confidence > best_confidence)
+        ):
+            best_transcription = transcription
+            logger.debug(
+                f"New best transcription found (confidence: {transcription.metrics.confidence})"
+            )
+    return best_transcription
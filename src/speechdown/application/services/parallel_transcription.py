@@ -0,0 +1,110 @@
+"""Process pool that transcribes several files at once.
+
+Each worker process builds its own transcriber (and therefore its own model) through a
+picklable factory. Workers return the transcription attempts for a file; the parent process
+receives them in input order and remains the only writer to the repository.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+import logging
+import multiprocessing
+from typing import Any, Callable, Iterator, Sequence
+
+from speechdown.application.ports.transcriber_port import TranscriberPort
+from speechdown.application.services.file_transcription import select_languages, transcribe_file
+from speechdown.application.services.transcription_options import TranscriptionOptions
+from speechdown.domain.entities import AudioFile, Transcription
+from speechdown.domain.value_objects import Language
+
+logger = logging.getLogger(__name__)
+
+TranscriberFactory = Callable[[], TranscriberPort]
+
+# State of the current worker process, set once by _init_worker
+_worker_transcriber: TranscriberPort | None = None
+_worker_options = TranscriptionOptions()
+_worker_escalations: list[TranscriberPort] = []
+
+
+def _init_worker(
+    transcriber_factory: TranscriberFactory,
+    options: TranscriptionOptions,
+    escalation_factories: Sequence[TranscriberFactory] = (),
+) -> None:
+    global _worker_transcriber, _worker_options, _worker_escalations
+    _worker_transcriber = transcriber_factory()
+    _worker_options = options
+    # Models load lazily, so larger cascade models only load in workers that escalate
+    _worker_escalations = [factory() for factory in escalation_factories]
+
+
+def _transcribe_in_worker(audio_file: AudioFile, languages: list[Language]) -> list[Transcription]:
+    assert _worker_transcriber is not None, "worker was not initialized"
+    return transcribe_file(
+        _worker_transcriber,
+        audio_file,
+        languages,
+        _worker_options,
+        escalations=_worker_escalations,
+    )
+
+
+def transcribe_chunk_in_worker(
+    audio_file: AudioFile, language: Language, audio: Any
+) -> Transcription:
+    """Transcribe one chunk of `audio_file`; submitted to a `transcriber_pool`."""
+    assert _worker_transcriber is not None, "worker was not initialized"
+    return _worker_transcriber.transcribe(audio_file, language, audio=audio)
+
+
+def select_languages_in_worker(
+    audio_file: AudioFile, languages: list[Language], audio: Any
+) -> tuple[list[Language], dict[Language, float]]:
+    """Run `select_languages` with the worker's model; submitted to a `transcriber_pool`."""
+    assert _worker_transcriber is not None, "worker was not initialized"
+    return select_languages(_worker_transcriber, audio_file, languages, _worker_options, audio)
+
+
+@contextmanager
+def transcriber_pool(
+    transcriber_factory: TranscriberFactory,
+    options: TranscriptionOptions,
+    workers: int,
+    escalation_factories: Sequence[TranscriberFactory] = (),
+) -> Iterator[ProcessPoolExecutor]:
+    """Start worker processes that each build their own transcriber once."""
+    # "spawn" avoids forking a parent that may already hold torch thread pools
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(transcriber_factory, options, escalation_factories),
+    ) as executor:
+        yield executor
+
+
+def iter_parallel_attempts(
+    transcriber_factory: TranscriberFactory,
+    audio_files: list[AudioFile],
+    languages: list[list[Language]],
+    options: TranscriptionOptions,
+    workers: int,
+    escalation_factories: Sequence[TranscriberFactory] = (),
+) -> Iterator[list[Transcription]]:
+    """
+    Transcribe files in a pool of worker processes.
+
+    Args:
+        languages: The languages to try for each file, in the same order as `audio_files`
+
+    Yields:
+        The attempts for each file, in the same order as `audio_files`, as soon as they
+        are available
+    """
+    workers = min(workers, len(audio_files))
+    if workers == 0:
+        return
+    logger.debug(f"Transcribing {len(audio_files)} files with {workers} worker processes")
+    with transcriber_pool(transcriber_factory, options, workers, escalation_factories) as executor:
+        yield from executor.map(_transcribe_in_worker, audio_files, languages)
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+
+DEFAULT_LANGUAGE_DETECTION_MARGIN = 0.2
+DEFAULT_PREFETCH_MAX_BYTES = 512 * 1024 * 1024
+# Whisper's own thresholds for falling back to a higher decoding temperature
+DEFAULT_CASCADE_MIN_CONFIDENCE = -1.0
+DEFAULT_CASCADE_MAX_COMPRESSION_RATIO = 2.4
+DEFAULT_EARLY_EXIT_CONFIDENCE = -0.4
+# Share of equal fingerprint bits: re-encoded copies measure 0.85 to 0.9, unrelated audio 0.5
+DEFAULT_NEAR_DUPLICATE_SIMILARITY = 0.75
+
+
+@dataclass(frozen=True)
+class TranscriptionOptions:
+    """Settings that control how TranscriptionService spends inference time."""
+
+    # Run language identification first and fully transcribe only the likely languages;
+    # off by default, so every configured language is transcribed as before
+    detect_language: bool = False
+    # Languages whose detection probability is within this margin of the top language
+    # are transcribed as well, so ambiguous recordings still get compared by confidence
+    language_detection_margin: float = DEFAULT_LANGUAGE_DETECTION_MARGIN
+    # Number of worker processes, each with its own model; 1 transcribes in-process
+    workers: int = 1
+    # Number of upcoming files decoded in the background while the current one is
+    # transcribed (sequential mode only); 0 disables prefetching
+    prefetch: int = 2
+    # Stop prefetching while this much decoded audio is waiting to be transcribed
+    prefetch_max_bytes: int = DEFAULT_PREFETCH_MAX_BYTES
+    # Number of short clips decoded together in one forward pass (sequential mode only);
+    # 1 transcribes every file on its own
+    batch_size: int = 1
+    # Long-file mode: split recordings into chunks of about this many seconds at quiet
+    # moments and transcribe the chunks concurrently (across `workers`); None disables
+    chunk_seconds: float | None = None
+    # With a model cascade, a file is re-run with the next model while its best attempt
+    # has a lower confidence or a higher compression ratio (repetitive text) than these
+    cascade_min_confidence: float = DEFAULT_CASCADE_MIN_CONFIDENCE
+    cascade_max_compression_ratio: float = DEFAULT_CASCADE_MAX_COMPRESSION_RATIO
+    # Stop trying further languages once an attempt reaches this confidence; languages are
+    # tried in order of how often they won in the file's directory. None tries them all
+    early_exit_confidence: float | None = None
+    # Models whose stored results are reused for copies of a file found by content hash;
+    # empty accepts results of any model
+    model_names: tuple[str, ...] = ()
+    # Reuse the stored transcription of a recording whose audio fingerprint agrees with the
+    # file's in at least this share of bits, e.g. an m4a and a wav export of the same note
+    # (not with parallel workers or in long-file mode); None disables the lookup
+    near_duplicate_similarity: float | None = None
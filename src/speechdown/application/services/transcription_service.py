@@ -1,15 +1,34 @@
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
 import logging
-from typing import List
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List
 from pathlib import Path
 from datetime import datetime
 from speechdown.application.ports.audio_file_port import AudioFilePort
+from speechdown.application.ports.audio_fingerprint_port import AudioFingerprintPort
 from speechdown.application.ports.output_port import OutputPort
-from speechdown.domain.entities import AudioFile, TranscriptionResult
+from speechdown.domain.entities import AudioFile, Transcription, TranscriptionResult
+from speechdown.domain.value_objects import Language
 from speechdown.application.ports.transcriber_port import TranscriberPort
 from speechdown.application.ports.transcription_repository_port import TranscriptionRepositoryPort
 from speechdown.application.ports.config_port import ConfigPort
+from speechdown.application.ports.content_hash_port import ContentHashPort
+from speechdown.application.ports.file_index_port import FileIndexPort
 from speechdown.application.ports.timestamp_port import TimestampPort
+from speechdown.application.services.audio_prefetcher import AudioPrefetcher
+from speechdown.application.services.chunked_transcription import ChunkedFileTranscriber
+from speechdown.application.services.file_transcription import (
+    select_best_transcription,
+    transcribe_file,
+    transcribe_files_batched,
+)
+from speechdown.application.services.parallel_transcription import (
+    TranscriberFactory,
+    iter_parallel_attempts,
+    transcriber_pool,
+)
+from speechdown.application.services.transcription_options import TranscriptionOptions
 
 logger = logging.getLogger(__name__)
 
@@ -22,71 +41,355 @@ class TranscriptionService:
     repository_port: TranscriptionRepositoryPort
     transcriber_port: TranscriberPort
     timestamp_port: TimestampPort
+    options: TranscriptionOptions = field(default_factory=TranscriptionOptions)
+    # Builds a transcriber inside each worker process when options.workers > 1
+    transcriber_factory: TranscriberFactory | None = None
+    # Model cascade: transcribers with increasingly larger models, tried in order when a
+    # file's result falls outside the quality bounds of `options`
+    escalation_factories: list[TranscriberFactory] = field(default_factory=list)
+    # Persistent scan index for incremental runs
+    file_index_port: FileIndexPort | None = None
+    # Hashes file contents, so copies and moved files reuse stored transcriptions
+    content_hash_port: ContentHashPort | None = None
+    # Fingerprints decoded audio, so re-encoded or trimmed copies reuse stored transcriptions
+    fingerprint_port: AudioFingerprintPort | None = None
+    _escalations: list[TranscriberPort] | None = field(default=None, init=False, repr=False)
 
     def collect_audio_files(
         self,
         directory: Path,
         start_dt: datetime | None = None,
         end_dt: datetime | None = None,
+        incremental: bool = False,
     ) -> List[AudioFile]:
+        """
+        Collect the audio files in `directory`.
+
+        With `incremental`, only files that are new or changed since the last committed
+        scan are returned; call `commit_scan` once they have been handled.
+        """
         logger.debug(
             f"Collecting audio files from directory: {directory} between {start_dt} and {end_dt}"
         )
-        audio_files = self.audio_file_port.collect_audio_files(
-            directory, start_dt=start_dt, end_dt=end_dt
-        )
+        if incremental:
+            if self.file_index_port is None:
+                raise ValueError("Incremental collection requires a file_index_port")
+            audio_files = self.file_index_port.collect_changed_audio_files(
+                directory, start_dt=start_dt, end_dt=end_dt
+            )
+        else:
+            audio_files = self.audio_file_port.collect_audio_files(
+                directory, start_dt=start_dt, end_dt=end_dt
+            )
         logger.debug(f"Found {len(audio_files)} audio files")
         return audio_files
 
+    def get_audio_files(self, paths: Iterable[Path]) -> List[AudioFile]:
+        """Build AudioFiles for known paths without scanning any directory."""
+        return [self.audio_file_port.get_audio_file(path) for path in paths]
+
+    def commit_scan(self) -> None:
+        """Record the last incremental scan, so its files are skipped from now on."""
+        if self.file_index_port is not None:
+            self.file_index_port.commit()
+
     def transcribe_audio_files(
         self, audio_files: List[AudioFile], ignore_existing: bool = False
     ) -> List[TranscriptionResult]:
-        transcriptions: list[TranscriptionResult] = []
-        for i, audio_file in enumerate(audio_files, 1):
-            logger.debug(f"Transcribing file {i}/{len(audio_files)}: {audio_file.path}")
-
-            if not ignore_existing:
-                # Try to get existing transcription first
-                existing = self.repository_port.get_best_transcription(audio_file.path)
-                if existing:
-                    file_mtime = datetime.fromtimestamp(audio_file.path.stat().st_mtime)
-                    if (
-                        existing.transcription_started_at
-                        and existing.transcription_started_at < file_mtime
-                    ):
-                        self.repository_port.delete_transcriptions(audio_file.path)
-                    else:
-                        transcriptions.append(existing)
-                        logger.debug(f"Using existing transcription for {audio_file.path}")
-                        continue
-
-            # If no existing transcription or ignore_existing=True, perform transcription
-            best_transcription = None
-            for language in self.config_port.get_languages():
-                logger.debug(f"Attempting transcription in {language}")
-                transcription = self.transcriber_port.transcribe(audio_file, language)
-                # Save each transcription attempt to the database
-                self.repository_port.save_transcription(transcription)
-
-                current_confidence = transcription.metrics.confidence
-                best_confidence: float | None = (
-                    best_transcription.metrics.confidence if best_transcription else None
+        """Transcribe the files and return their results in input order."""
+        results: list[TranscriptionResult | None] = [None] * len(audio_files)
+        for i, result in self._iter_indexed_results(audio_files, ignore_existing):
+            results[i] = result
+        return [result for result in results if result is not None]
+
+    def iter_transcribe_audio_files(
+        self, audio_files: List[AudioFile], ignore_existing: bool = False
+    ) -> Iterator[TranscriptionResult]:
+        """
+        Yield each result as soon as it is available.
+
+        Results already in the repository come first, followed by new transcriptions in
+        input order. Nothing is accumulated, so a consumer that writes results as they
+        arrive keeps memory bounded and loses little work if the run is interrupted.
+        """
+        for _, result in self._iter_indexed_results(audio_files, ignore_existing):
+            yield result
+
+    def _iter_indexed_results(
+        self, audio_files: List[AudioFile], ignore_existing: bool
+    ) -> Iterator[tuple[int, TranscriptionResult]]:
+        """Yield `(index in audio_files, result)` pairs, stored results first."""
+        # Serve what we can from the repository before any inference, in one lookup
+        stored = {}
+        if not ignore_existing:
+            stored = self.repository_port.get_best_transcriptions(audio_files)
+        reused: list[tuple[int, Transcription]] = []
+        pending: list[int] = []
+        # Stale transcriptions of modified files are deleted in one transaction
+        with self.repository_port.transaction():
+            for i, audio_file in enumerate(audio_files):
+                existing = self._check_existing_transcription(
+                    audio_file, stored.get(audio_file.path)
                 )
+                if existing is not None:
+                    reused.append((i, existing))
+                else:
+                    pending.append(i)
+        for i, existing in reused:
+            logger.debug(f"Using existing transcription for {audio_files[i].path}")
+            yield i, existing
 
-                if best_transcription is None or (
-                    current_confidence is not None
-                    and (best_confidence is None or current_confidence > best_confidence)
-                ):
-                    best_transcription = transcription
-                    logger.debug(
-                        f"New best transcription found (confidence: {transcription.metrics.confidence})"
-                    )
+        self._set_content_hashes([audio_files[i] for i in pending])
+        if not ignore_existing:
+            copies = self._reuse_by_content([audio_files[i] for i in pending])
+            for i in pending:
+                if audio_files[i].path in copies:
+                    logger.debug(f"Using transcription of a copy for {audio_files[i].path}")
+                    yield i, copies[audio_files[i].path]
+            pending = [i for i in pending if audio_files[i].path not in copies]
+
+        # Files with the same content in this run are transcribed once
+        duplicates: dict[int, list[int]] = defaultdict(list)
+        first_with_hash: dict[str, int] = {}
+        unique: list[int] = []
+        for i in pending:
+            content_hash = audio_files[i].content_hash
+            if content_hash is not None and content_hash in first_with_hash:
+                duplicates[first_with_hash[content_hash]].append(i)
+                continue
+            if content_hash is not None:
+                first_with_hash[content_hash] = i
+            unique.append(i)
 
-            if best_transcription is not None:
-                transcriptions.append(best_transcription)
+        pending_files = [audio_files[i] for i in unique]
+        languages_for = self._language_order(self.config_port.get_languages())
+        attempts_per_file = self._iter_attempts(
+            pending_files, languages_for, reuse_near_duplicates=not ignore_existing
+        )
+        for n, (i, attempts) in enumerate(zip(unique, attempts_per_file), 1):
+            logger.debug(f"Transcribed file {n}/{len(unique)}: {audio_files[i].path}")
+            best = select_best_transcription(attempts)
+            duplicate_copies = [
+                (duplicate, self._copy_transcription(best, audio_files[duplicate]))
+                for duplicate in duplicates[i]
+                if best is not None
+            ]
+            # Save all transcription attempts of the file in one commit
+            with self.repository_port.transaction():
+                for transcription in attempts:
+                    self.repository_port.save_transcription(transcription)
+                for _, copy in duplicate_copies:
+                    self.repository_port.save_transcription(copy)
+            if best is not None:
+                yield i, best
+            yield from duplicate_copies
 
         logger.debug(f"Transcription complete for all {len(audio_files)} files")
-        return transcriptions
+
+    def _set_content_hashes(self, audio_files: list[AudioFile]) -> None:
+        """Hash the files that need a transcription; the hash is saved along with it."""
+        if self.content_hash_port is None:
+            return
+        for audio_file in audio_files:
+            if audio_file.content_hash is None:
+                audio_file.content_hash = self.content_hash_port.get_content_hash(audio_file)
+
+    def _reuse_by_content(self, audio_files: list[AudioFile]) -> dict[Path, Transcription]:
+        """
+        Copy stored transcriptions of files with the same content, e.g. moved or synced.
+
+        The copies are saved under the new paths in one transaction, so later runs find
+        them by path.
+        """
+        content_hashes = [f.content_hash for f in audio_files if f.content_hash is not None]
+        if not content_hashes:
+            return {}
+        stored = self.repository_port.get_best_transcriptions_by_content(
+            content_hashes, list(self.options.model_names), self.config_port.get_languages()
+        )
+        copies: dict[Path, Transcription] = {}
+        with self.repository_port.transaction():
+            for audio_file in audio_files:
+                original = stored.get(audio_file.content_hash or "")
+                if original is not None:
+                    copy = self._copy_transcription(original, audio_file)
+                    self.repository_port.save_transcription(copy)
+                    copies[audio_file.path] = copy
+        return copies
+
+    def _copy_transcription(
+        self, transcription: Transcription, audio_file: AudioFile
+    ) -> Transcription:
+        """
+        The transcription for another file with the same content.
+
+        It counts as made now: a copy is usually newer than the original transcription,
+        which would otherwise be discarded as stale by the next run.
+        """
+        return replace(
+            transcription, audio_file=audio_file, transcription_started_at=datetime.now()
+        )
+
+    def _check_existing_transcription(
+        self, audio_file: AudioFile, existing: Transcription | None
+    ) -> Transcription | None:
+        """Return the stored best transcription, discarding it if the file changed since."""
+        if existing is None:
+            return None
+        mtime = audio_file.file_mtime
+        if mtime is None:
+            mtime = audio_file.path.stat().st_mtime
+        file_mtime = datetime.fromtimestamp(mtime)
+        if existing.transcription_started_at and existing.transcription_started_at < file_mtime:
+            self.repository_port.delete_transcriptions(audio_file.path)
+            return None
+        return existing
+
+    def _reuse_near_duplicate(self, audio_file: AudioFile, audio: Any) -> Transcription | None:
+        """
+        Copy the stored transcription of a recording that sounds the same as the file, e.g.
+        the wav export of an m4a note, if it was made by an accepted model and language.
+
+        The file's fingerprint is indexed either way, so later copies can find it.
+        """
+        min_similarity = self.options.near_duplicate_similarity
+        if self.fingerprint_port is None or min_similarity is None:
+            return None
+        languages = self.config_port.get_languages()
+        for path in self.fingerprint_port.index_and_match(audio_file, audio, min_similarity):
+            original = self.repository_port.get_best_transcription(path)
+            if original is None or original.language not in languages:
+                continue
+            model_names = self.options.model_names
+            if model_names and original.metrics.model_name not in model_names:
+                continue
+            logger.debug(f"Using transcription of near-duplicate {path} for {audio_file.path}")
+            return self._copy_transcription(original, audio_file)
+        return None
+
+    def _language_order(
+        self, languages: list[Language]
+    ) -> Callable[[AudioFile], list[Language]]:
+        """
+        Order the configured languages per file by how often each one won in its directory.
+
+        Frequencies come from the best stored transcriptions and are read once per
+        directory; ties keep the configured order. The order only matters when early exit
+        can skip the later languages, so without it the configured order is used as is.
+        """
+        if self.options.early_exit_confidence is None:
+            return lambda audio_file: languages
+
+        frequencies: dict[Path, dict[Language, int]] = {}
+
+        def languages_for(audio_file: AudioFile) -> list[Language]:
+            directory = audio_file.path.parent
+            if directory not in frequencies:
+                frequencies[directory] = self.repository_port.get_language_frequencies(directory)
+            counts = frequencies[directory]
+            return sorted(languages, key=lambda language: counts.get(language, 0), reverse=True)
+
+        return languages_for
+
+    def _iter_attempts(
+        self,
+        audio_files: list[AudioFile],
+        languages_for: Callable[[AudioFile], list[Language]],
+        reuse_near_duplicates: bool = False,
+    ) -> Iterator[list[Transcription]]:
+        """
+        Yield the transcription attempts for each file, in input order.
+
+        With `reuse_near_duplicates`, sequential mode yields a file's near-duplicate copy
+        as its only attempt instead of transcribing it.
+        """
+        if self.options.chunk_seconds is not None:
+            yield from self._iter_chunked_attempts(audio_files, languages_for)
+            return
+        if self.options.workers > 1 and len(audio_files) > 1:
+            yield from iter_parallel_attempts(
+                self._require_transcriber_factory(),
+                audio_files,
+                [languages_for(audio_file) for audio_file in audio_files],
+                self.options,
+                self.options.workers,
+                escalation_factories=self.escalation_factories,
+            )
+            return
+        decoded = self._iter_decoded(audio_files)
+        escalations = self._get_escalations()
+
+        def near_duplicate(audio_file: AudioFile, audio: Any) -> Transcription | None:
+            if not reuse_near_duplicates:
+                return None
+            return self._reuse_near_duplicate(audio_file, audio)
+
+        if self.options.batch_size > 1:
+            while batch := list(islice(decoded, self.options.batch_size)):
+                copies = [near_duplicate(audio_file, audio) for audio_file, audio in batch]
+                transcribed = iter(
+                    transcribe_files_batched(
+                        self.transcriber_port,
+                        [item for item, copy in zip(batch, copies) if copy is None],
+                        languages_for,
+                        self.options,
+                        escalations=escalations,
+                    )
+                )
+                for copy in copies:
+                    yield [copy] if copy is not None else next(transcribed)
+            return
+        for audio_file, audio in decoded:
+            copy = near_duplicate(audio_file, audio)
+            if copy is not None:
+                yield [copy]
+                continue
+            yield transcribe_file(
+                self.transcriber_port,
+                audio_file,
+                languages_for(audio_file),
+                self.options,
+                audio=audio,
+                escalations=escalations,
+            )
+
+    def _get_escalations(self) -> list[TranscriberPort]:
+        """Build the cascade transcribers once, so a daemon keeps their models warm too."""
+        if self._escalations is None:
+            self._escalations = [factory() for factory in self.escalation_factories]
+        return self._escalations
+
+    def _iter_chunked_attempts(
+        self,
+        audio_files: list[AudioFile],
+        languages_for: Callable[[AudioFile], list[Language]],
+    ) -> Iterator[list[Transcription]]:
+        """Long-file mode: split files into chunks and transcribe the chunks concurrently."""
+        decoded = self._iter_decoded(audio_files)
+        if self.options.workers == 1:
+            chunked = ChunkedFileTranscriber(self.transcriber_port, languages_for, self.options)
+            yield from chunked.iter_attempts(decoded)
+            return
+        with transcriber_pool(
+            self._require_transcriber_factory(), self.options, self.options.workers
+        ) as executor:
+            chunked = ChunkedFileTranscriber(
+                self.transcriber_port, languages_for, self.options, executor=executor
+            )
+            yield from chunked.iter_attempts(decoded)
+
+    def _iter_decoded(self, audio_files: list[AudioFile]) -> Iterator[tuple[AudioFile, Any]]:
+        prefetcher = AudioPrefetcher(
+            self.transcriber_port.load_audio,
+            depth=self.options.prefetch,
+            max_buffered_bytes=self.options.prefetch_max_bytes,
+        )
+        return prefetcher.iter_decoded(audio_files)
+
+    def _require_transcriber_factory(self) -> TranscriberFactory:
+        if self.transcriber_factory is None:
+            raise ValueError("Parallel transcription requires a transcriber_factory")
+        return self.transcriber_factory
 
     def get_file_timestamp(self, path: Path) -> datetime:
         logger.debug(f"Getting timestamp for file: {path}")
@@ -98,3 +401,9 @@ class TranscriptionService:
         self, transcriptions: list[TranscriptionResult], path: Path | None = None
     ):
         self.output_port.output_transcription_results(transcriptions, path)
+
+    def output_transcription_stream(
+        self, transcriptions: Iterable[TranscriptionResult], path: Path | None = None
+    ) -> int:
+        """Write results while they are produced; returns the number of results written."""
+        return self.output_port.output_transcription_stream(transcriptions, path)
@@ -10,6 +10,11 @@ from speechdown.domain.value_objects import Language, Timestamp, TranscriptionMe
 class AudioFile:
     path: Path
     timestamp: Timestamp
+    # Size and modification time when the file was collected, if known
+    file_size: int | None = None
+    file_mtime: float | None = None
+    # Hash of the file's bytes, set before transcription if a content hash port is used
+    content_hash: str | None = None
 
 
 @dataclass
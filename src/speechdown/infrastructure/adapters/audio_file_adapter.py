@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
@@ -6,6 +6,7 @@ from speechdown.application.ports.audio_file_port import AudioFilePort
 from speechdown.domain.entities import AudioFile
 from speechdown.domain.value_objects import Timestamp
 from speechdown.application.ports.timestamp_port import TimestampPort
+from speechdown.infrastructure.file_walker import IgnoreRules, walk_audio_files
 
 
 # TODO(AD): Consider renaming this class to AudioFileCollector or AudioFileFinder
@@ -17,34 +18,48 @@ from speechdown.application.ports.timestamp_port import TimestampPort
 @dataclass
 class AudioFileAdapter(AudioFilePort):
     timestamp_port: TimestampPort
+    # Pruned while collecting, e.g. the transcripts output directory
+    excluded_directories: list[Path] = field(default_factory=list)
+    # Directories listed concurrently; more than one helps on network mounts
+    scan_threads: int = 1
 
     def get_audio_file(self, path: Path) -> AudioFile:
         dt = self.timestamp_port.get_timestamp(path)
-        return AudioFile(path=path, timestamp=Timestamp(value=dt))
+        stat = path.stat()
+        return AudioFile(
+            path=path,
+            timestamp=Timestamp(value=dt),
+            file_size=stat.st_size,
+            file_mtime=stat.st_mtime,
+        )
 
     def collect_audio_files(
         self, directory: Path, start_dt: datetime | None = None, end_dt: datetime | None = None
     ) -> list[AudioFile]:
-        SOUND_EXTENSIONS = {".mp3", ".wav", ".ogg", ".m4a", ".flac", ".webm"}
-        audio_files = []
         directory = Path(directory)
-        for path in directory.glob("**/*"):
-            if (
-                path.is_file()
-                and path.suffix.lower() in SOUND_EXTENSIONS
-                and not path.stem.startswith(".")
-                and self._is_modified_between(start_dt, end_dt, path)
-            ):
-                audio_files.append(self.get_audio_file(path))
+        rules = IgnoreRules.load(directory, self.excluded_directories)
+        audio_files = []
+        for path, stat in walk_audio_files(directory, rules, threads=self.scan_threads):
+            if self._is_modified_between(start_dt, end_dt, stat.st_mtime):
+                file_path = Path(path)
+                audio_files.append(
+                    AudioFile(
+                        path=file_path,
+                        timestamp=Timestamp(value=self._get_file_timestamp(file_path)),
+                        file_size=stat.st_size,
+                        file_mtime=stat.st_mtime,
+                    )
+                )
+        audio_files.sort(key=lambda audio_file: audio_file.path)
         return audio_files
 
     def _get_file_timestamp(self, path: Path) -> datetime:
         return self.timestamp_port.get_timestamp(path)
 
     def _is_modified_between(
-        self, start_dt: datetime | None, end_dt: datetime | None, path: Path
+        self, start_dt: datetime | None, end_dt: datetime | None, mtime: float
     ) -> bool:
-        mod_time = datetime.fromtimestamp(path.stat().st_mtime)
+        mod_time = datetime.fromtimestamp(mtime)
 
         if start_dt is None and end_dt is None:
             return True
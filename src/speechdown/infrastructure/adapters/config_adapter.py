@@ -2,12 +2,22 @@ from dataclasses import dataclass
 import json
 from pathlib import Path
 from speechdown.application.ports.config_port import ConfigPort
+from speechdown.application.services.transcription_options import (
+    DEFAULT_CASCADE_MAX_COMPRESSION_RATIO,
+    DEFAULT_CASCADE_MIN_CONFIDENCE,
+    DEFAULT_EARLY_EXIT_CONFIDENCE,
+    DEFAULT_LANGUAGE_DETECTION_MARGIN,
+    DEFAULT_NEAR_DUPLICATE_SIMILARITY,
+)
 from speechdown.domain.value_objects import Language
 
 
 DEFAULT_LANGUAGES = [Language("en"), Language("uk"), Language("ru")]
 DEFAULT_OUTPUT_DIR = "transcripts"
 DEFAULT_MODEL_NAME = "tiny"
+# The decoded audio cache is off until a size is configured; 16 kHz float32 audio takes
+# 64 KB per second, so 2048 MB holds about 9 hours
+DEFAULT_AUDIO_CACHE_MB = 0
 
 
 @dataclass
@@ -16,6 +26,18 @@ class ConfigAdapter(ConfigPort):
     path: Path
     output_dir: Path | str | None = None
     model_name: str | None = None
+    language_detection: bool | None = None
+    language_detection_margin: float | None = None
+    trim_silence: bool | None = None
+    model_cascade: list[str] | None = None
+    cascade_min_confidence: float | None = None
+    cascade_max_compression_ratio: float | None = None
+    early_exit: bool | None = None
+    early_exit_confidence: float | None = None
+    near_duplicates: bool | None = None
+    near_duplicate_similarity: float | None = None
+    scan_threads: int | None = None
+    audio_cache_mb: int | None = None
 
     # --- Getters and Setters ---
     def get_languages(self) -> list[Language]:
@@ -45,6 +67,113 @@ class ConfigAdapter(ConfigPort):
         self.model_name = model_name
         self._save_config()
 
+    def get_language_detection(self) -> bool:
+        if self.language_detection is None:
+            return False
+        return self.language_detection
+
+    def set_language_detection(self, language_detection: bool | None) -> None:
+        self.language_detection = language_detection
+        self._save_config()
+
+    def get_language_detection_margin(self) -> float:
+        if self.language_detection_margin is None:
+            return DEFAULT_LANGUAGE_DETECTION_MARGIN
+        return self.language_detection_margin
+
+    def set_language_detection_margin(self, margin: float | None) -> None:
+        self.language_detection_margin = margin
+        self._save_config()
+
+    def get_trim_silence(self) -> bool:
+        if self.trim_silence is None:
+            return False
+        return self.trim_silence
+
+    def set_trim_silence(self, trim_silence: bool | None) -> None:
+        self.trim_silence = trim_silence
+        self._save_config()
+
+    def get_model_cascade(self) -> list[str]:
+        """Models to try from cheapest to largest; empty if a single model is used."""
+        return list(self.model_cascade or [])
+
+    def set_model_cascade(self, model_cascade: list[str] | None) -> None:
+        self.model_cascade = model_cascade or None
+        self._save_config()
+
+    def get_cascade_min_confidence(self) -> float:
+        if self.cascade_min_confidence is None:
+            return DEFAULT_CASCADE_MIN_CONFIDENCE
+        return self.cascade_min_confidence
+
+    def set_cascade_min_confidence(self, min_confidence: float | None) -> None:
+        self.cascade_min_confidence = min_confidence
+        self._save_config()
+
+    def get_cascade_max_compression_ratio(self) -> float:
+        if self.cascade_max_compression_ratio is None:
+            return DEFAULT_CASCADE_MAX_COMPRESSION_RATIO
+        return self.cascade_max_compression_ratio
+
+    def set_cascade_max_compression_ratio(self, max_compression_ratio: float | None) -> None:
+        self.cascade_max_compression_ratio = max_compression_ratio
+        self._save_config()
+
+    def get_early_exit(self) -> bool:
+        if self.early_exit is None:
+            return False
+        return self.early_exit
+
+    def set_early_exit(self, early_exit: bool | None) -> None:
+        self.early_exit = early_exit
+        self._save_config()
+
+    def get_early_exit_confidence(self) -> float:
+        if self.early_exit_confidence is None:
+            return DEFAULT_EARLY_EXIT_CONFIDENCE
+        return self.early_exit_confidence
+
+    def set_early_exit_confidence(self, confidence: float | None) -> None:
+        self.early_exit_confidence = confidence
+        self._save_config()
+
+    def get_near_duplicates(self) -> bool:
+        if self.near_duplicates is None:
+            return False
+        return self.near_duplicates
+
+    def set_near_duplicates(self, near_duplicates: bool | None) -> None:
+        self.near_duplicates = near_duplicates
+        self._save_config()
+
+    def get_near_duplicate_similarity(self) -> float:
+        if self.near_duplicate_similarity is None:
+            return DEFAULT_NEAR_DUPLICATE_SIMILARITY
+        return self.near_duplicate_similarity
+
+    def set_near_duplicate_similarity(self, similarity: float | None) -> None:
+        self.near_duplicate_similarity = similarity
+        self._save_config()
+
+    def get_scan_threads(self) -> int:
+        if self.scan_threads is None:
+            return 1
+        return self.scan_threads
+
+    def set_scan_threads(self, scan_threads: int | None) -> None:
+        self.scan_threads = scan_threads
+        self._save_config()
+
+    def get_audio_cache_mb(self) -> int:
+        if self.audio_cache_mb is None:
+            return DEFAULT_AUDIO_CACHE_MB
+        return self.audio_cache_mb
+
+    def set_audio_cache_mb(self, audio_cache_mb: int | None) -> None:
+        self.audio_cache_mb = audio_cache_mb
+        self._save_config()
+
     # --- Default Setters ---
     def set_default_languages_if_not_set(self):
         if not self.languages:
@@ -65,7 +194,7 @@ class ConfigAdapter(ConfigPort):
     def _save_config(self) -> None:
         """Save current configuration to the config file."""
         with self.path.open("w") as file:
-            config_data: dict[str, list[str] | str | int | bool] = {
+            config_data: dict[str, list[str] | str | int | float | bool] = {
                 "languages": [language.code for language in self.languages],
             }
             if self.output_dir is not None:
@@ -75,6 +204,30 @@ class ConfigAdapter(ConfigPort):
                 config_data["output_dir"] = output_dir_str
             if self.model_name is not None:
                 config_data["model_name"] = self.model_name
+            if self.language_detection is not None:
+                config_data["language_detection"] = self.language_detection
+            if self.language_detection_margin is not None:
+                config_data["language_detection_margin"] = self.language_detection_margin
+            if self.trim_silence is not None:
+                config_data["trim_silence"] = self.trim_silence
+            if self.model_cascade is not None:
+                config_data["model_cascade"] = self.model_cascade
+            if self.cascade_min_confidence is not None:
+                config_data["cascade_min_confidence"] = self.cascade_min_confidence
+            if self.cascade_max_compression_ratio is not None:
+                config_data["cascade_max_compression_ratio"] = self.cascade_max_compression_ratio
+            if self.early_exit is not None:
+                config_data["early_exit"] = self.early_exit
+            if self.early_exit_confidence is not None:
+                config_data["early_exit_confidence"] = self.early_exit_confidence
+            if self.near_duplicates is not None:
+                config_data["near_duplicates"] = self.near_duplicates
+            if self.near_duplicate_similarity is not None:
+                config_data["near_duplicate_similarity"] = self.near_duplicate_similarity
+            if self.scan_threads is not None:
+                config_data["scan_threads"] = self.scan_threads
+            if self.audio_cache_mb is not None:
+                config_data["audio_cache_mb"] = self.audio_cache_mb
             json.dump(config_data, file)
 
     @classmethod
@@ -101,4 +254,16 @@ class ConfigAdapter(ConfigPort):
             path=path,
             output_dir=output_dir,
             model_name=model_name,
+            language_detection=config_data.get("language_detection"),
+            language_detection_margin=config_data.get("language_detection_margin"),
+            trim_silence=config_data.get("trim_silence"),
+            model_cascade=config_data.get("model_cascade"),
+            cascade_min_confidence=config_data.get("cascade_min_confidence"),
+            cascade_max_compression_ratio=config_data.get("cascade_max_compression_ratio"),
+            early_exit=config_data.get("early_exit"),
+            early_exit_confidence=config_data.get("early_exit_confidence"),
+            near_duplicates=config_data.get("near_duplicates"),
+            near_duplicate_similarity=config_data.get("near_duplicate_similarity"),
+            scan_threads=config_data.get("scan_threads"),
+            audio_cache_mb=config_data.get("audio_cache_mb"),
         )
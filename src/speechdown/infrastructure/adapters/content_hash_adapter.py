@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from functools import partial
+import hashlib
+import logging
+
+from speechdown.application.ports.content_hash_port import ContentHashPort
+from speechdown.domain.entities import AudioFile
+
+logger = logging.getLogger(__name__)
+
+# 160-bit BLAKE2b digests: collisions are out of reach and the hex string stays short
+DIGEST_SIZE = 20
+
+
+@dataclass
+class Blake2ContentHashAdapter(ContentHashPort):
+    """
+    BLAKE2b over the bytes of the audio file, read in a streaming fashion.
+
+    Hashing runs at hundreds of MB/s, so a recording costs a fraction of a second to hash
+    and minutes less than transcribing it again.
+    """
+
+    def get_content_hash(self, audio_file: AudioFile) -> str | None:
+        try:
+            with open(audio_file.path, "rb") as f:
+                digest = hashlib.file_digest(f, partial(hashlib.blake2b, digest_size=DIGEST_SIZE))
+        except OSError as e:
+            logger.warning(f"Could not hash {audio_file.path}: {e}")
+            return None
+        return digest.hexdigest()
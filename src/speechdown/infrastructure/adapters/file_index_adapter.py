@@ -0,0 +1,214 @@
+"""
+Persistent index of scanned directories and audio files, for incremental runs.
+
+Adding, removing or renaming an entry changes the mtime of its directory, so a directory
+whose mtime matches the index is not listed again; its subdirectories are taken from the
+index and checked the same way. A file rewritten in place keeps its directory's mtime, so
+recently modified files from the index are also stat'ed, which catches recordings that
+were still growing during the last run.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import time
+
+from speechdown.application.ports.file_index_port import FileIndexPort
+from speechdown.application.ports.timestamp_port import TimestampPort
+from speechdown.domain.entities import AudioFile
+from speechdown.domain.value_objects import Timestamp
+from speechdown.infrastructure.database import Database, migrate
+from speechdown.infrastructure.file_walker import IgnoreRules, list_directory
+
+logger = logging.getLogger(__name__)
+
+# Files modified this recently are stat'ed even when their directory is unchanged
+RECENT_FILE_SECONDS = 24 * 60 * 60
+# A directory mtime this close to the scan is not recorded: an entry added within the same
+# clock tick would not change it again
+RACY_MTIME_SECONDS = 2
+
+FileState = tuple[int, int, int]  # size, mtime_ns, inode
+
+
+@dataclass
+class _PendingScan:
+    """What a collect saw, written to the index by `commit`."""
+
+    # Listed directory -> (parent, mtime_ns or None to list it again next time)
+    directories: dict[str, tuple[str | None, int | None]] = field(default_factory=dict)
+    # Listed directory -> its audio files
+    files: dict[str, dict[str, FileState]] = field(default_factory=dict)
+    # Files re-checked in unchanged directories -> (directory, state)
+    updated_files: dict[str, tuple[str, FileState]] = field(default_factory=dict)
+    removed_directories: set[str] = field(default_factory=set)
+
+
+def _is_modified_between(
+    mtime: float, start_dt: datetime | None, end_dt: datetime | None
+) -> bool:
+    modified = datetime.fromtimestamp(mtime)
+    return (start_dt is None or start_dt <= modified) and (end_dt is None or modified <= end_dt)
+
+
+@dataclass
+class SQLiteFileIndexAdapter(FileIndexPort):
+    """File index kept in the `scan_directories` and `scan_files` tables of the project DB."""
+
+    database: Database
+    timestamp_port: TimestampPort
+    # Pruned while scanning, like in AudioFileAdapter
+    excluded_directories: list[Path] = field(default_factory=list)
+    _pending: _PendingScan | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        migrate(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        return self.database.connection()
+
+    def close(self) -> None:
+        self.database.close()
+
+    def collect_changed_audio_files(
+        self,
+        directory: Path,
+        start_dt: datetime | None = None,
+        end_dt: datetime | None = None,
+    ) -> list[AudioFile]:
+        """
+        Collect audio files that are new, or whose size, mtime or inode changed.
+
+        Files outside the time range are not recorded, so a later run without the range
+        still picks them up.
+        """
+        conn = self._connect()
+        known_mtimes: dict[str, int | None] = {}
+        children: dict[str, list[str]] = defaultdict(list)
+        for row in conn.execute("SELECT path, parent, mtime_ns FROM scan_directories"):
+            known_mtimes[row["path"]] = row["mtime_ns"]
+            if row["parent"] is not None:
+                children[row["parent"]].append(row["path"])
+
+        pending = _PendingScan()
+        changed: dict[str, os.stat_result] = {}
+        visited: set[str] = set()
+        racy_after_ns = time.time_ns() - RACY_MTIME_SECONDS * 1_000_000_000
+        root = Path(directory)
+        rules = IgnoreRules.load(root, self.excluded_directories)
+        # Record the real parent, so a later scan of an enclosing directory still finds it
+        root_parent = None if root.parent == root else str(root.parent)
+        stack: list[tuple[str, str | None]] = [(str(root), root_parent)]
+        while stack:
+            path, parent = stack.pop()
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                pending.removed_directories.add(path)
+                continue
+            visited.add(path)
+            if known_mtimes.get(path) == mtime_ns:
+                stack.extend((child, path) for child in children[path])
+                continue
+
+            stored = {
+                row["path"]: (row["size"], row["mtime_ns"], row["inode"])
+                for row in conn.execute(
+                    "SELECT path, size, mtime_ns, inode FROM scan_files WHERE directory = ?",
+                    (path,),
+                )
+            }
+            subdirectories, files = list_directory(path, rules)
+            current: dict[str, FileState] = {}
+            complete = mtime_ns < racy_after_ns
+            for file_path, stat in files:
+                if not _is_modified_between(stat.st_mtime, start_dt, end_dt):
+                    complete = False
+                    continue
+                current[file_path] = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+                if stored.get(file_path) != current[file_path]:
+                    changed[file_path] = stat
+
+            pending.removed_directories.update(set(children[path]) - set(subdirectories))
+            pending.directories[path] = (parent, mtime_ns if complete else None)
+            pending.files[path] = current
+            stack.extend((subdirectory, path) for subdirectory in subdirectories)
+
+        recent_ns = time.time_ns() - RECENT_FILE_SECONDS * 1_000_000_000
+        for row in conn.execute(
+            "SELECT path, directory, size, mtime_ns, inode FROM scan_files WHERE mtime_ns >= ?",
+            (recent_ns,),
+        ):
+            if row["directory"] not in visited or row["directory"] in pending.files:
+                continue
+            try:
+                stat = os.stat(row["path"])
+            except OSError:
+                continue
+            state = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+            if state != (row["size"], row["mtime_ns"], row["inode"]) and _is_modified_between(
+                stat.st_mtime, start_dt, end_dt
+            ):
+                changed[row["path"]] = stat
+                pending.updated_files[row["path"]] = (row["directory"], state)
+
+        self._pending = pending
+        logger.debug(
+            f"Listed {len(pending.directories)} of {len(visited)} directories; "
+            f"{len(changed)} new or changed audio files"
+        )
+        return [self._to_audio_file(path, stat) for path, stat in sorted(changed.items())]
+
+    def _to_audio_file(self, path: str, stat: os.stat_result) -> AudioFile:
+        file_path = Path(path)
+        return AudioFile(
+            path=file_path,
+            timestamp=Timestamp(self.timestamp_port.get_timestamp(file_path)),
+            file_size=stat.st_size,
+            file_mtime=stat.st_mtime,
+        )
+
+    def commit(self) -> None:
+        """Write what the last collect saw to the index, in one transaction."""
+        pending = self._pending
+        if pending is None:
+            return
+        conn = self._connect()
+        with self.database.transaction():
+            for path in pending.removed_directories:
+                prefix = path + os.sep
+                conn.execute(
+                    "DELETE FROM scan_directories "
+                    "WHERE path = ? OR substr(path, 1, length(?)) = ?",
+                    (path, prefix, prefix),
+                )
+                conn.execute(
+                    "DELETE FROM scan_files "
+                    "WHERE directory = ? OR substr(directory, 1, length(?)) = ?",
+                    (path, prefix, prefix),
+                )
+            for path, (parent, mtime_ns) in pending.directories.items():
+                conn.execute(
+                    "INSERT OR REPLACE INTO scan_directories (path, parent, mtime_ns) "
+                    "VALUES (?, ?, ?)",
+                    (path, parent, mtime_ns),
+                )
+                conn.execute("DELETE FROM scan_files WHERE directory = ?", (path,))
+                conn.executemany(
+                    "INSERT INTO scan_files (path, directory, size, mtime_ns, inode) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    ((file_path, path, *state) for file_path, state in pending.files[path].items()),
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO scan_files (path, directory, size, mtime_ns, inode) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    (path, directory, *state)
+                    for path, (directory, state) in pending.updated_files.items()
+                ),
+            )
+        self._pending = None
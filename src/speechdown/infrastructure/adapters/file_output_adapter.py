@@ -1,8 +1,9 @@
 import logging
 import os
 import datetime
+import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, List
 
 from speechdown.domain.value_objects import Timestamp
 
@@ -13,11 +14,24 @@ from .markdown_merger import MarkdownMerger
 
 logger = logging.getLogger(__name__)
 
+# Streaming output flushes after this many results or this many seconds, whichever is first
+FLUSH_EVERY_RESULTS = 10
+FLUSH_EVERY_SECONDS = 30.0
+
 
 class FileOutputAdapter(OutputPort):
-    def __init__(self, config_port: ConfigPort):
+    def __init__(
+        self,
+        config_port: ConfigPort,
+        flush_every_results: int = FLUSH_EVERY_RESULTS,
+        flush_every_seconds: float = FLUSH_EVERY_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.config_port = config_port
         self.markdown_merger = MarkdownMerger()
+        self.flush_every_results = flush_every_results
+        self.flush_every_seconds = flush_every_seconds
+        self.clock = clock
 
     def output_transcription_results(
         self,
@@ -66,6 +80,51 @@ class FileOutputAdapter(OutputPort):
                 timestamp=timestamp,
             )
 
+    def output_transcription_stream(
+        self,
+        transcription_results: Iterable[TranscriptionResult],
+        path: Path | None = None,
+    ) -> int:
+        """
+        Output results while they are being produced, in small batches.
+
+        Each batch is merged into the day files it affects, so only a batch of results is
+        held in memory and an interrupted run keeps everything flushed before it. Merging
+        is keyed by section header, so flushing a day file several times is safe.
+
+        Batching only pays off while results arrive faster than the flush rate, as stored
+        results do. A result that took longer than that to produce, typically a new
+        transcription, is written right away: the next one may be minutes away.
+
+        Args:
+            transcription_results: Results, typically a generator fed by transcription
+            path: Optional output directory path (overrides config)
+
+        Returns:
+            Number of results written
+        """
+        slow_result_seconds = self.flush_every_seconds / self.flush_every_results
+        written = 0
+        batch: list[TranscriptionResult] = []
+        last_flush = waiting_since = self.clock()
+        for result in transcription_results:
+            now = self.clock()
+            batch.append(result)
+            if (
+                len(batch) >= self.flush_every_results
+                or now - last_flush >= self.flush_every_seconds
+                or now - waiting_since >= slow_result_seconds
+            ):
+                self.output_transcription_results(batch, path)
+                written += len(batch)
+                batch = []
+                last_flush = self.clock()
+            waiting_since = self.clock()
+        if batch:
+            self.output_transcription_results(batch, path)
+            written += len(batch)
+        return written
+
     def _get_output_directory(self, path: Path | None) -> Path | None:
         """Get the output directory from the config or use the provided path."""
         if path:
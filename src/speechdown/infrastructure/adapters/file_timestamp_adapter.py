@@ -1,10 +1,13 @@
 import re
 import logging
+import os
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict
 
+from speechdown.application.ports.metadata_timestamp_port import MetadataTimestampPort
 from speechdown.application.ports.timestamp_port import TimestampPort
 
 
@@ -33,14 +36,99 @@ TIMESTAMP_PATTERNS = [
 ]
 
 VALID_YEAR_RANGE = (2000, 2099)
+# Distinct filenames whose extracted timestamp is remembered
+FILENAME_CACHE_SIZE = 16384
+
+
+def _latest_match_regex(pattern: re.Pattern[str]) -> re.Pattern[str]:
+    """
+    Wrap a pattern so that `match` finds its occurrence that starts latest in the string.
+
+    The greedy `.*` backtracks from the end of the string, so the first position where the
+    pattern matches is the latest one; the whole search is one call into the regex engine
+    instead of a slice and a match per position.
+    """
+    return re.compile(f".*(?:{pattern.pattern})", re.DOTALL)
+
+
+LATEST_MATCH_PATTERNS = [
+    (_latest_match_regex(config["regex"]), bool(config["is_yy"]))  # type: ignore[arg-type]
+    for config in TIMESTAMP_PATTERNS
+]
+
+
+@lru_cache(maxsize=FILENAME_CACHE_SIZE)
+def extract_timestamp_from_filename(filename: str) -> Optional[datetime]:
+    """
+    Extract a timestamp from a filename, or None if it contains no valid one.
+
+    Patterns are tried in the order of TIMESTAMP_PATTERNS, each with its match that starts
+    latest in the filename; a match with invalid components falls through to the next
+    pattern.
+    """
+    for pattern, is_yy in LATEST_MATCH_PATTERNS:
+        match = pattern.match(filename)
+        if not match:
+            continue
+        try:
+            year, month, day, hour, minute, second = _validate_timestamp_components(
+                match.groupdict(), is_yy
+            )
+            return datetime(year, month, day, hour, minute, second)
+        except (ValueError, OverflowError) as e:
+            logging.getLogger(__name__).debug("Invalid date components in %s: %s", filename, e)
+    return None
+
+
+def _validate_timestamp_components(
+    parts: Dict[str, str], is_yy_format: bool
+) -> tuple[int, int, int, int, int, int]:
+    year_str = parts["year"]
+    if is_yy_format:
+        if not (0 <= int(year_str) <= 99):
+            raise ValueError(f"2-digit year '{year_str}' out of 00-99 range.")
+        year = int("20" + year_str)
+    else:
+        if not (1900 <= int(year_str) <= 2099):
+            raise ValueError(f"4-digit year '{year_str}' out of 1900-2099 range.")
+        year = int(year_str)
+
+    if not (VALID_YEAR_RANGE[0] <= year <= VALID_YEAR_RANGE[1]):
+        raise ValueError(f"Year {year} not in valid range {VALID_YEAR_RANGE}")
+
+    month = int(parts["month"])
+    day = int(parts["day"])
+    hour = int(parts["hour"])
+    minute = int(parts["minute"])
+    second = int(parts["second"])
+
+    if not (1 <= month <= 12):
+        raise ValueError(f"Month {month} not in range 1-12")
+    if not (1 <= day <= 31):
+        raise ValueError(f"Day {day} not in range 1-31")
+    if not (0 <= hour <= 23):
+        raise ValueError(f"Hour {hour} not in range 0-23")
+    if not (0 <= minute <= 59):
+        raise ValueError(f"Minute {minute} not in range 0-59")
+    if not (0 <= second <= 59):
+        raise ValueError(f"Second {second} not in range 0-59")
+
+    return year, month, day, hour, minute, second
 
 
 @dataclass
 class FileTimestampAdapter(TimestampPort):
-    """Adapter for extracting timestamps from filenames with fallbacks."""
+    """
+    Adapter for extracting timestamps from filenames with fallbacks.
+
+    Files without a timestamp in their name get the recording time from their metadata,
+    if a metadata port is given, and otherwise their modification time.
+    """
+
+    metadata_port: MetadataTimestampPort | None = None
 
     def get_timestamp(self, path: Path) -> datetime:
-        """Return timestamp extracted from filename or fallback to file mtime."""
+        """Return timestamp extracted from filename or metadata, or fallback to file mtime."""
         logger = logging.getLogger(__name__)
 
         extracted = self._extract_from_filename(path.name)
@@ -48,72 +136,25 @@ class FileTimestampAdapter(TimestampPort):
             logger.debug("Extracted timestamp from filename %s: %s", path.name, extracted)
             return extracted
 
-        fallback = self._get_file_fallback_time(path)
+        stat = path.stat()
+        from_metadata = self._get_metadata_timestamp(path, stat)
+        if from_metadata:
+            logger.debug("Extracted timestamp from metadata of %s: %s", path.name, from_metadata)
+            return from_metadata
+
+        fallback = datetime.fromtimestamp(stat.st_mtime)
         logger.debug("Using fallback modification time for %s: %s", path.name, fallback)
         return fallback
 
     def _extract_from_filename(self, filename: str) -> Optional[datetime]:
-        """Extract a timestamp from the filename using backwards search."""
-        for config in TIMESTAMP_PATTERNS:
-            pattern: re.Pattern[str] = config["regex"]  # type: ignore[assignment]
-            is_yy = bool(config["is_yy"])
-            match = self._search_pattern_backwards(filename, pattern)
-            if match:
-                try:
-                    year, month, day, hour, minute, second = self._validate_timestamp_components(
-                        match, is_yy
-                    )
-                    return datetime(year, month, day, hour, minute, second)
-                except (ValueError, OverflowError) as e:
-                    logging.getLogger(__name__).debug(
-                        "Invalid date components in %s: %s", filename, e
-                    )
-                    continue
+        """Extract a timestamp from the filename, searching from its end."""
+        return extract_timestamp_from_filename(filename)
+
+    def _get_metadata_timestamp(self, path: Path, stat: os.stat_result) -> Optional[datetime]:
+        """Return the recording time from metadata if it lies within VALID_YEAR_RANGE."""
+        if self.metadata_port is None:
+            return None
+        timestamp = self.metadata_port.get_metadata_timestamp(path, stat)
+        if timestamp and VALID_YEAR_RANGE[0] <= timestamp.year <= VALID_YEAR_RANGE[1]:
+            return timestamp
         return None
-
-    def _search_pattern_backwards(self, text: str, pattern: re.Pattern) -> Optional[Dict[str, str]]:
-        """Search for pattern from the end of the string backwards."""
-        for i in range(len(text) - 1, -1, -1):
-            match = pattern.match(text[i:])
-            if match:
-                return match.groupdict()
-        return None
-
-    def _validate_timestamp_components(
-        self, parts: Dict[str, str], is_yy_format: bool
-    ) -> tuple[int, int, int, int, int, int]:
-        year_str = parts["year"]
-        if is_yy_format:
-            if not (0 <= int(year_str) <= 99):
-                raise ValueError(f"2-digit year '{year_str}' out of 00-99 range.")
-            year = int("20" + year_str)
-        else:
-            if not (1900 <= int(year_str) <= 2099):
-                raise ValueError(f"4-digit year '{year_str}' out of 1900-2099 range.")
-            year = int(year_str)
-
-        if not (VALID_YEAR_RANGE[0] <= year <= VALID_YEAR_RANGE[1]):
-            raise ValueError(f"Year {year} not in valid range {VALID_YEAR_RANGE}")
-
-        month = int(parts["month"])
-        day = int(parts["day"])
-        hour = int(parts["hour"])
-        minute = int(parts["minute"])
-        second = int(parts["second"])
-
-        if not (1 <= month <= 12):
-            raise ValueError(f"Month {month} not in range 1-12")
-        if not (1 <= day <= 31):
-            raise ValueError(f"Day {day} not in range 1-31")
-        if not (0 <= hour <= 23):
-            raise ValueError(f"Hour {hour} not in range 0-23")
-        if not (0 <= minute <= 59):
-            raise ValueError(f"Minute {minute} not in range 0-59")
-        if not (0 <= second <= 59):
-            raise ValueError(f"Second {second} not in range 0-59")
-
-        return year, month, day, hour, minute, second
-
-    def _get_file_fallback_time(self, path: Path) -> datetime:
-        """Return the file modification time."""
-        return datetime.fromtimestamp(path.stat().st_mtime)
@@ -0,0 +1,153 @@
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import sqlite3
+from typing import Any, Iterator
+
+from speechdown.application.ports.audio_fingerprint_port import AudioFingerprintPort
+from speechdown.domain.entities import AudioFile
+from speechdown.infrastructure.audio_fingerprint import (
+    HOP_LENGTH,
+    SAMPLE_RATE,
+    AudioFingerprint,
+    compute_fingerprint,
+    fingerprint_similarity,
+    values_from_bytes,
+    values_to_bytes,
+)
+from speechdown.infrastructure.database import Database, migrate
+
+logger = logging.getLogger(__name__)
+
+FRAMES_PER_SECOND = SAMPLE_RATE / HOP_LENGTH
+# Terms are indexed for every fourth frame of the first 30 seconds of each recording
+INDEX_FRAMES = int(30 * FRAMES_PER_SECOND)
+INDEX_STRIDE = 4
+# A new recording is looked up with all frames of its first 60 seconds, so copies with up
+# to 30 seconds trimmed from, or added to, the start still share indexed terms
+QUERY_FRAMES = int(60 * FRAMES_PER_SECOND)
+# Each 32-bit value is indexed as two 16-bit terms: a lossy copy with one bit in six
+# flipped keeps few whole values intact, but still a few percent of its halves
+HALF_BITS = 16
+HALF_MASK = (1 << HALF_BITS) - 1
+# Silence and clipping give all-equal bits, which say nothing about the recording
+UNINFORMATIVE_HALVES = (0, HALF_MASK)
+# Equal terms at the same relative offset that make a recording worth comparing in full
+MIN_VOTES = 2
+MAX_CANDIDATES = 8
+
+
+@dataclass
+class SQLiteFingerprintIndexAdapter(AudioFingerprintPort):
+    """
+    Audio fingerprints in the `audio_fingerprints` table, indexed by `fingerprint_terms`.
+
+    Fingerprints of re-encoded copies differ in some bits but still share exact 16-bit
+    halves of their values with the original, at a constant offset between the two
+    recordings. A lookup finds the stored halves equal to those of the new recording with
+    one indexed query, counts them per recording and offset, and compares only the
+    best-voted candidates bit by bit.
+    """
+
+    database: Database
+
+    def __post_init__(self) -> None:
+        migrate(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        return self.database.connection()
+
+    def close(self) -> None:
+        self.database.close()
+
+    def index_and_match(
+        self, audio_file: AudioFile, audio: Any, min_similarity: float
+    ) -> list[Path]:
+        fingerprint = compute_fingerprint(audio)
+        if fingerprint is None:
+            return []
+        try:
+            matches = self._find_matches(audio_file.path, fingerprint, min_similarity)
+            self._save(audio_file.path, fingerprint)
+        except sqlite3.Error as e:
+            logger.error(f"Error using the fingerprint index: {e}")
+            return []
+        return matches
+
+    def _find_matches(
+        self, path: Path, fingerprint: AudioFingerprint, min_similarity: float
+    ) -> list[Path]:
+        positions: dict[int, list[int]] = defaultdict(list)
+        for term, position in _terms(fingerprint.values[:QUERY_FRAMES].tolist(), 1):
+            positions[term].append(position)
+        if not positions:
+            return []
+
+        conn = self._connect()
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS query_terms (term INTEGER PRIMARY KEY)")
+        conn.execute("DELETE FROM query_terms")
+        conn.executemany("INSERT INTO query_terms (term) VALUES (?)", ((t,) for t in positions))
+        votes: Counter[tuple[int, int]] = Counter()
+        # CROSS JOIN keeps query_terms as the outer loop, so each term is one index lookup
+        # instead of a scan of fingerprint_terms
+        for row in conn.execute(
+            """
+            SELECT fingerprint_terms.term, fingerprint_id, position
+            FROM query_terms
+            CROSS JOIN fingerprint_terms ON fingerprint_terms.term = query_terms.term
+            JOIN audio_fingerprints ON audio_fingerprints.id = fingerprint_id
+            WHERE audio_fingerprints.path != ?
+            """,
+            (str(path),),
+        ):
+            for query_position in positions[row["term"]]:
+                votes[(row["fingerprint_id"], row["position"] - query_position)] += 1
+
+        similarities: dict[Path, float] = {}
+        for (fingerprint_id, offset), count in votes.most_common(MAX_CANDIDATES):
+            if count < MIN_VOTES:
+                break
+            row = conn.execute(
+                "SELECT path, duration, fingerprint FROM audio_fingerprints WHERE id = ?",
+                (fingerprint_id,),
+            ).fetchone()
+            stored = AudioFingerprint(values_from_bytes(row["fingerprint"]), row["duration"])
+            similarity = fingerprint_similarity(fingerprint, stored, offset)
+            candidate = Path(row["path"])
+            if similarity >= max(min_similarity, similarities.get(candidate, 0.0)):
+                similarities[candidate] = similarity
+        return sorted(similarities, key=lambda candidate: similarities[candidate], reverse=True)
+
+    def _save(self, path: Path, fingerprint: AudioFingerprint) -> None:
+        """Replace the file's fingerprint and its indexed terms in one transaction."""
+        conn = self._connect()
+        with self.database.transaction():
+            conn.execute(
+                "DELETE FROM fingerprint_terms WHERE fingerprint_id IN "
+                "(SELECT id FROM audio_fingerprints WHERE path = ?)",
+                (str(path),),
+            )
+            conn.execute("DELETE FROM audio_fingerprints WHERE path = ?", (str(path),))
+            cursor = conn.execute(
+                "INSERT INTO audio_fingerprints (path, duration, fingerprint) VALUES (?, ?, ?)",
+                (str(path), fingerprint.duration_seconds, values_to_bytes(fingerprint.values)),
+            )
+            fingerprint_id = cursor.lastrowid
+            terms = _terms(fingerprint.values[:INDEX_FRAMES].tolist(), INDEX_STRIDE)
+            conn.executemany(
+                "INSERT INTO fingerprint_terms (term, fingerprint_id, position) VALUES (?, ?, ?)",
+                ((term, fingerprint_id, position) for term, position in terms),
+            )
+
+
+def _terms(values: list[int], stride: int) -> Iterator[tuple[int, int]]:
+    """
+    Yield `(term, position)` for every `stride`-th value: its low half as is and its high
+    half offset by 2**16, so that equal halves only match in the same place.
+    """
+    for position in range(0, len(values), stride):
+        value = values[position]
+        for term, half in ((value & HALF_MASK, 0), (value >> HALF_BITS, 1)):
+            if term not in UNINFORMATIVE_HALVES:
+                yield term + (half << HALF_BITS), position
@@ -0,0 +1,68 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+import os
+from pathlib import Path
+import sqlite3
+
+from speechdown.application.ports.metadata_timestamp_port import MetadataTimestampPort
+from speechdown.infrastructure.audio_metadata import read_recording_time
+from speechdown.infrastructure.database import Database, migrate
+
+logger = logging.getLogger(__name__)
+
+# Cached entry: size, mtime_ns and the ISO timestamp, or None if the file has none
+CachedTimestamp = tuple[int, int, str | None]
+
+
+@dataclass
+class SQLiteMetadataTimestampAdapter(MetadataTimestampPort):
+    """
+    Recording times from audio file headers, cached in the `metadata_timestamps` table.
+
+    The whole table is read with one query on first use, so a run over many files costs one
+    lookup in memory per file; headers are only parsed for files that are new or whose size
+    or mtime changed. New results are deferred, so they are written with the next
+    transaction on the database instead of committing once per file.
+    """
+
+    database: Database
+    _cache: dict[str, CachedTimestamp] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        migrate(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        return self.database.connection()
+
+    def close(self) -> None:
+        self.database.close()
+
+    def get_metadata_timestamp(self, path: Path, stat: os.stat_result) -> datetime | None:
+        cache = self._load_cache()
+        key = str(path)
+        cached = cache.get(key)
+        if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return datetime.fromisoformat(cached[2]) if cached[2] else None
+
+        timestamp = read_recording_time(path)
+        stored = timestamp.isoformat() if timestamp else None
+        cache[key] = (stat.st_size, stat.st_mtime_ns, stored)
+        self.database.defer(
+            "INSERT OR REPLACE INTO metadata_timestamps (path, size, mtime_ns, timestamp) "
+            "VALUES (?, ?, ?, ?)",
+            (key, stat.st_size, stat.st_mtime_ns, stored),
+        )
+        return timestamp
+
+    def _load_cache(self) -> dict[str, CachedTimestamp]:
+        if self._cache is None:
+            self._cache = {}
+            try:
+                for row in self._connect().execute(
+                    "SELECT path, size, mtime_ns, timestamp FROM metadata_timestamps"
+                ):
+                    self._cache[row["path"]] = (row["size"], row["mtime_ns"], row["timestamp"])
+            except sqlite3.Error as e:
+                logger.error(f"Error reading metadata timestamps: {e}")
+        return self._cache
@@ -0,0 +1,134 @@
+try:  # pragma: no cover - installed together with openai-whisper
+    import numpy as np  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    np = None  # type: ignore
+from dataclasses import dataclass, field
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import Any
+
+from speechdown.application.ports.audio_cache_port import AudioCachePort
+
+logger = logging.getLogger(__name__)
+
+SUFFIX = ".npy"
+
+
+@dataclass
+class NpyAudioCacheAdapter(AudioCachePort):
+    """
+    Decoded 16 kHz mono float32 samples in `.npy` files under `directory`, one per content
+    hash, so re-transcribing a file (with a new model or `--ignore-existing`) skips ffmpeg.
+
+    Hits are memory-mapped copy-on-write: the samples are paged in from the page cache as
+    Whisper reads them, nothing is copied up front, and the array stays writable, which
+    torch expects, without ever changing the file. Recency is the file's mtime, refreshed
+    on every hit; once the files exceed `max_bytes`, the least recently used are deleted.
+
+    Stores may come from several threads, e.g. the prefetcher's; the byte count and the
+    eviction are guarded by a lock, which each process unpickling the adapter recreates.
+    """
+
+    directory: Path
+    max_bytes: int
+    # Bytes used by the cache as of the last scan plus what this process stored since
+    _total_bytes: int | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _path(self, content_hash: str) -> Path:
+        return self.directory / f"{content_hash}{SUFFIX}"
+
+    def load_audio(self, content_hash: str) -> Any | None:
+        if np is None:
+            return None
+        path = self._path(content_hash)
+        try:
+            audio = np.load(path, mmap_mode="c")
+            if audio.dtype != np.float32 or audio.ndim != 1:
+                raise ValueError(f"unexpected {audio.dtype} array of shape {audio.shape}")
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cached audio {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        return audio
+
+    def store_audio(self, content_hash: str, audio: Any) -> None:
+        if np is None:
+            return
+        audio = np.asarray(audio, dtype=np.float32)
+        if audio.nbytes > self.max_bytes:
+            return
+        path = self._path(content_hash)
+        # Written under a temporary name and renamed, so readers never see a partial file
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(temporary, "wb") as f:
+                np.save(f, audio)
+            os.replace(temporary, path)
+            size = path.stat().st_size
+        except OSError as e:
+            logger.warning(f"Could not cache decoded audio for {content_hash}: {e}")
+            temporary.unlink(missing_ok=True)
+            return
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            else:
+                self._total_bytes += size
+            if self._total_bytes > self.max_bytes:
+                self._evict(keep=path)
+
+    def _scan_total_bytes(self) -> int:
+        return sum(size for _, size, _ in self._scan())
+
+    def _scan(self) -> list[tuple[Path, int, int]]:
+        """Return `(path, size, mtime_ns)` of the cached files."""
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(SUFFIX):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:  # evicted by another process
+                        continue
+                    entries.append((Path(entry.path), stat.st_size, stat.st_mtime_ns))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _evict(self, keep: Path) -> None:
+        """
+        Delete the least recently used files until the cache fits in `max_bytes`.
+
+        Called with `_lock` held.
+        """
+        entries = sorted(self._scan(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.debug(f"Evicted cached audio {path.name}")
+        self._total_bytes = total
@@ -1,5 +1,6 @@
 import logging
 from pathlib import Path
+from typing import Iterable
 
 from speechdown.domain.entities import TranscriptionResult, Transcription, CachedTranscription
 from speechdown.application.ports.output_port import OutputPort
@@ -41,3 +42,11 @@ class MarkdownOutputAdapter(OutputPort):
             logger.info(f"Transcription results written to {path}")
         else:
             print(output_text)
+
+    def output_transcription_stream(
+        self, transcription_results: Iterable[TranscriptionResult], path: Path | None = None
+    ) -> int:
+        # The whole document is rewritten on every output, so collect everything first
+        results = list(transcription_results)
+        self.output_transcription_results(results, path)
+        return len(results)
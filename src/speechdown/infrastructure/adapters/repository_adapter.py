@@ -2,13 +2,13 @@ import sqlite3
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import ContextManager, Dict, List, Optional
 from datetime import datetime
 
 from speechdown.application.ports.transcription_repository_port import TranscriptionRepositoryPort
-from speechdown.domain.entities import CachedTranscription, Transcription
+from speechdown.domain.entities import AudioFile, CachedTranscription, Transcription
 from speechdown.domain.value_objects import Language, Timestamp, TranscriptionMetrics, MetricSource
-from speechdown.infrastructure.schema import SCHEMA
+from speechdown.infrastructure.database import Database, migrate
 from speechdown.application.ports.timestamp_port import TimestampPort
 
 logger = logging.getLogger(__name__)
@@ -16,9 +16,15 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class SQLiteRepositoryAdapter(TranscriptionRepositoryPort):
-    """SQLite implementation of the TranscriptionRepositoryPort."""
+    """
+    SQLite implementation of the TranscriptionRepositoryPort.
 
-    db_path: Path
+    The adapter uses the process's shared connection to the project database, in WAL mode
+    so readers such as a concurrent `sd transcribe` don't block the writer. Outside
+    `transaction()` every write commits on its own.
+    """
+
+    database: Database
     timestamp_port: TimestampPort
 
     def __post_init__(self) -> None:
@@ -26,19 +32,28 @@ class SQLiteRepositoryAdapter(TranscriptionRepositoryPort):
         self.create_transcription_table()
 
     def create_transcription_table(self) -> None:
-        """Create the transcription table if it doesn't exist."""
-        conn: sqlite3.Connection | None = None
+        """Create the transcription table, or upgrade an older database in place."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.executescript(SCHEMA)
-            conn.commit()
-            logger.debug(f"Initialized transcription table in {self.db_path}")
+            migrate(self._connect())
+            logger.debug(f"Initialized transcription table in {self.database.path}")
         except sqlite3.Error as e:
             logger.error(f"Error creating transcription table: {e}")
-        finally:
-            if conn:
-                conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return self.database.connection()
+
+    def close(self) -> None:
+        """Close the shared connection; the next call opens a new one."""
+        self.database.close()
+
+    def transaction(self) -> ContextManager[None]:
+        """
+        Group writes into one unit of work that commits once, or not at all on error.
+
+        Nested calls join the outermost transaction, also when it was opened by another
+        adapter on the same database.
+        """
+        return self.database.transaction()
 
     def save_transcription(
         self, transcription: Optional[Transcription | CachedTranscription]
@@ -57,13 +72,13 @@ class SQLiteRepositoryAdapter(TranscriptionRepositoryPort):
             logger.debug("Skipping CachedTranscription - no metrics to save")
             return
 
-        conn: sqlite3.Connection | None = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            cursor = self._connect().cursor()
 
             # Extract metrics
             metrics = transcription.metrics
+            audio_file = transcription.audio_file
+            file_size, file_mtime = self._get_file_fingerprint(audio_file)
 
             # Insert transcription into database
             cursor.execute(
@@ -72,11 +87,12 @@ class SQLiteRepositoryAdapter(TranscriptionRepositoryPort):
                     path, transcribed_text, language_code, confidence,
                     avg_logprob_mean, compression_ratio_mean, no_speech_prob_mean,
                     audio_duration_seconds, word_count, words_per_second,
-                    model_name, transcription_time_seconds, transcription_started_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    model_name, transcription_time_seconds, transcription_started_at,
+                    audio_timestamp, file_size, file_mtime, content_hash, directory
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
-                    str(transcription.audio_file.path),
+                    str(audio_file.path),
                     transcription.text,
                     transcription.language.code,
                     metrics.confidence,
@@ -89,31 +105,35 @@ class SQLiteRepositoryAdapter(TranscriptionRepositoryPort):
                     metrics.model_name,
                     metrics.transcription_time_seconds,
                     transcription.transcription_started_at,
+                    audio_file.timestamp.value.isoformat(),
+                    file_size,
+                    file_mtime,
+                    audio_file.content_hash,
+                    str(audio_file.path.parent),
                 ),
             )
 
-            conn.commit()
-            logger.debug(f"Saved transcription for {transcription.audio_file.path}")
+            logger.debug(f"Saved transcription for {audio_file.path}")
         except sqlite3.Error as e:
             logger.error(f"Error saving transcription: {e}")
-        finally:
-            if conn:
-                conn.close()
+
+    def _get_file_fingerprint(self, audio_file: AudioFile) -> tuple[int | None, float | None]:
+        """Size and mtime of the audio file, from collection time or from the file itself."""
+        if audio_file.file_size is not None and audio_file.file_mtime is not None:
+            return audio_file.file_size, audio_file.file_mtime
+        try:
+            stat = audio_file.path.stat()
+        except OSError:
+            return None, None
+        return stat.st_size, stat.st_mtime
 
     def delete_transcriptions(self, path: Path) -> None:
         """Delete all transcriptions for a given audio file."""
-        conn: sqlite3.Connection | None = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM transcriptions WHERE path = ?", (str(path),))
-            conn.commit()
+            self._connect().execute("DELETE FROM transcriptions WHERE path = ?", (str(path),))
             logger.debug(f"Deleted transcriptions for {path}")
         except sqlite3.Error as e:
             logger.error(f"Error deleting transcriptions: {e}")
-        finally:
-            if conn:
-                conn.close()
 
     def get_transcriptions(self, path: Path) -> List[Transcription]:
         """
@@ -127,11 +147,8 @@ class SQLiteRepositoryAdapter(TranscriptionRepositoryPort):
         """
         transcriptions = []
 
-        conn: sqlite3.Connection | None = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Enable row factory for named columns
-            cursor = conn.cursor()
+            cursor = self._connect().cursor()
 
             cursor.execute(
                 """
@@ -142,51 +159,14 @@ class SQLiteRepositoryAdapter(TranscriptionRepositoryPort):
                 (str(path),),
             )
 
-            rows = cursor.fetchall()
-
-            for row in rows:
-                # Create domain objects from database rows
-                metrics = TranscriptionMetrics(
-                    confidence=row["confidence"],
-                    avg_logprob_mean=row["avg_logprob_mean"],
-                    compression_ratio_mean=row["compression_ratio_mean"],
-                    no_speech_prob_mean=row["no_speech_prob_mean"],
-                    audio_duration_seconds=row["audio_duration_seconds"],
-                    word_count=row["word_count"],
-                    words_per_second=row["words_per_second"],
-                    model_name=row["model_name"],
-                    transcription_time_seconds=row["transcription_time_seconds"],
-                    source=MetricSource.WHISPER,
-                )
-
-                # Create AudioFile with path and extract timestamp from file
-                from speechdown.domain.entities import AudioFile
-
-                file_path = Path(row["path"])
-                timestamp = Timestamp(self._get_file_timestamp(file_path))
-                audio_file = AudioFile(path=file_path, timestamp=timestamp)
-
-                transcription_started_at = (
-                    datetime.fromisoformat(row["transcription_started_at"])
-                    if row["transcription_started_at"]
-                    else None
-                )
-
-                transcription = Transcription(
-                    audio_file=audio_file,
-                    text=row["transcribed_text"],
-                    language=Language(row["language_code"]),
-                    metrics=metrics,
-                    transcription_started_at=transcription_started_at,
-                )
-
-                transcriptions.append(transcription)
+            extracted: Dict[str, Timestamp] = {}
+            for row in cursor.fetchall():
+                audio_file = self._row_to_audio_file(row, extracted)
+                transcriptions.append(self._row_to_transcription(row, audio_file))
+            self._store_audio_timestamps(extracted)
 
         except sqlite3.Error as e:
             logger.error(f"Error retrieving transcriptions: {e}")
-        finally:
-            if conn:
-                conn.close()
 
         return transcriptions
 
@@ -200,11 +180,8 @@ class SQLiteRepositoryAdapter(TranscriptionRepositoryPort):
         Returns:
             The best Transcription if available, otherwise None
         """
-        conn: sqlite3.Connection | None = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = self._connect().cursor()
 
             cursor.execute(
                 """
@@ -217,50 +194,247 @@ class SQLiteRepositoryAdapter(TranscriptionRepositoryPort):
             )
 
             row = cursor.fetchone()
-
             if row:
-                metrics = TranscriptionMetrics(
-                    confidence=row["confidence"],
-                    avg_logprob_mean=row["avg_logprob_mean"],
-                    compression_ratio_mean=row["compression_ratio_mean"],
-                    no_speech_prob_mean=row["no_speech_prob_mean"],
-                    audio_duration_seconds=row["audio_duration_seconds"],
-                    word_count=row["word_count"],
-                    words_per_second=row["words_per_second"],
-                    model_name=row["model_name"],
-                    transcription_time_seconds=row["transcription_time_seconds"],
-                    source=MetricSource.WHISPER,
+                extracted: Dict[str, Timestamp] = {}
+                audio_file = self._row_to_audio_file(row, extracted)
+                self._store_audio_timestamps(extracted)
+                return self._row_to_transcription(row, audio_file)
+            return None
+
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving best transcription: {e}")
+            return None
+
+    def _row_to_audio_file(
+        self, row: sqlite3.Row, extracted: Dict[str, Timestamp]
+    ) -> AudioFile:
+        """
+        Create the AudioFile of a `transcriptions` row from the stored columns.
+
+        Rows saved before schema version 3 have no audio timestamp; it is extracted from the
+        file and added to `extracted` by path, for `_store_audio_timestamps` to write back.
+        """
+        file_path = Path(row["path"])
+        if row["audio_timestamp"]:
+            timestamp = Timestamp.from_isoformat(row["audio_timestamp"])
+        elif row["path"] in extracted:
+            timestamp = extracted[row["path"]]
+        else:
+            timestamp = Timestamp(self._get_file_timestamp(file_path))
+            extracted[row["path"]] = timestamp
+        return AudioFile(
+            path=file_path,
+            timestamp=timestamp,
+            file_size=row["file_size"],
+            file_mtime=row["file_mtime"],
+            content_hash=row["content_hash"],
+        )
+
+    def _store_audio_timestamps(self, extracted: Dict[str, Timestamp]) -> None:
+        """
+        Store the timestamps extracted for legacy rows in one transaction, so later reads
+        don't touch their audio files again. Failing to store them doesn't fail the read.
+        """
+        if not extracted:
+            return
+        try:
+            with self.transaction():
+                self._connect().executemany(
+                    "UPDATE transcriptions SET audio_timestamp = ? "
+                    "WHERE path = ? AND audio_timestamp IS NULL",
+                    (
+                        (timestamp.value.isoformat(), path)
+                        for path, timestamp in extracted.items()
+                    ),
                 )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not store extracted audio timestamps: {e}")
+
+    def get_best_transcriptions(self, audio_files: List[AudioFile]) -> Dict[Path, Transcription]:
+        """
+        Get the best transcription of many audio files in a single query.
 
-                # Create AudioFile with path and extract timestamp from file
-                from speechdown.domain.entities import AudioFile
+        The requested paths go into a temporary table that is joined with `transcriptions`;
+        a window function keeps the most confident row per path. The given AudioFile objects
+        are reused, so no timestamps are extracted again.
 
-                file_path = Path(row["path"])
-                timestamp = Timestamp(self._get_file_timestamp(file_path))
-                audio_file = AudioFile(path=file_path, timestamp=timestamp)
+        Args:
+            audio_files: The audio files to look up
+
+        Returns:
+            Mapping of audio file path to its best Transcription; files without any
+            stored transcription are missing
+        """
+        audio_files_by_path = {str(audio_file.path): audio_file for audio_file in audio_files}
+        best: Dict[Path, Transcription] = {}
+        if not audio_files_by_path:
+            return best
+
+        try:
+            cursor = self._connect().cursor()
 
-                transcription_started_at = (
-                    datetime.fromisoformat(row["transcription_started_at"])
-                    if row["transcription_started_at"]
-                    else None
+            # The temporary table lives as long as the connection, so clear earlier requests
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS requested_paths (path TEXT PRIMARY KEY)"
+            )
+            cursor.execute("DELETE FROM requested_paths")
+            cursor.executemany(
+                "INSERT INTO requested_paths (path) VALUES (?)",
+                ((path,) for path in audio_files_by_path),
+            )
+            cursor.execute(
+                """
+                SELECT * FROM (
+                    SELECT transcriptions.*, ROW_NUMBER() OVER (
+                        PARTITION BY transcriptions.path ORDER BY confidence DESC
+                    ) AS rank
+                    FROM transcriptions
+                    JOIN requested_paths ON requested_paths.path = transcriptions.path
                 )
+                WHERE rank = 1
+                """
+            )
+
+            for row in cursor.fetchall():
+                audio_file = audio_files_by_path[row["path"]]
+                best[audio_file.path] = self._row_to_transcription(row, audio_file)
+
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving best transcriptions: {e}")
+
+        return best
+
+    def get_best_transcriptions_by_content(
+        self,
+        content_hashes: List[str],
+        model_names: List[str],
+        languages: List[Language],
+    ) -> Dict[str, Transcription]:
+        """
+        Get the best transcription of each file content, wherever the file was stored.
+
+        Like `get_best_transcriptions`, but rows are matched on `content_hash` and only
+        those made by one of `model_names` (any model if empty) in one of `languages` count.
+        The returned transcriptions keep the AudioFile of the row they were read from.
+
+        Returns:
+            Mapping of content hash to the best Transcription with that hash
+        """
+        best: Dict[str, Transcription] = {}
+        if not content_hashes or not languages:
+            return best
+
+        conditions = [f"language_code IN ({', '.join('?' * len(languages))})"]
+        parameters: list[str] = [language.code for language in languages]
+        if model_names:
+            conditions.append(f"model_name IN ({', '.join('?' * len(model_names))})")
+            parameters.extend(model_names)
+
+        try:
+            cursor = self._connect().cursor()
 
-                return Transcription(
-                    audio_file=audio_file,
-                    text=row["transcribed_text"],
-                    language=Language(row["language_code"]),
-                    metrics=metrics,
-                    transcription_started_at=transcription_started_at,
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS requested_hashes (content_hash TEXT PRIMARY KEY)"
+            )
+            cursor.execute("DELETE FROM requested_hashes")
+            cursor.executemany(
+                "INSERT OR IGNORE INTO requested_hashes (content_hash) VALUES (?)",
+                ((content_hash,) for content_hash in content_hashes),
+            )
+            cursor.execute(
+                f"""
+                SELECT * FROM (
+                    SELECT transcriptions.*, ROW_NUMBER() OVER (
+                        PARTITION BY transcriptions.content_hash ORDER BY confidence DESC
+                    ) AS rank
+                    FROM transcriptions
+                    JOIN requested_hashes
+                    ON requested_hashes.content_hash = transcriptions.content_hash
+                    WHERE {" AND ".join(conditions)}
                 )
+                WHERE rank = 1
+                """,
+                parameters,
+            )
 
-            return None
+            extracted: Dict[str, Timestamp] = {}
+            for row in cursor.fetchall():
+                best[row["content_hash"]] = self._row_to_transcription(
+                    row, self._row_to_audio_file(row, extracted)
+                )
+            self._store_audio_timestamps(extracted)
 
         except sqlite3.Error as e:
-            logger.error(f"Error retrieving best transcription: {e}")
-            return None
-        finally:
-            if conn:
-                conn.close()
+            logger.error(f"Error retrieving transcriptions by content: {e}")
+
+        return best
+
+    def _row_to_transcription(self, row: sqlite3.Row, audio_file: AudioFile) -> Transcription:
+        """Create a Transcription for `audio_file` from a `transcriptions` row."""
+        metrics = TranscriptionMetrics(
+            confidence=row["confidence"],
+            avg_logprob_mean=row["avg_logprob_mean"],
+            compression_ratio_mean=row["compression_ratio_mean"],
+            no_speech_prob_mean=row["no_speech_prob_mean"],
+            audio_duration_seconds=row["audio_duration_seconds"],
+            word_count=row["word_count"],
+            words_per_second=row["words_per_second"],
+            model_name=row["model_name"],
+            transcription_time_seconds=row["transcription_time_seconds"],
+            source=MetricSource.WHISPER,
+        )
+        transcription_started_at = (
+            datetime.fromisoformat(row["transcription_started_at"])
+            if row["transcription_started_at"]
+            else None
+        )
+        return Transcription(
+            audio_file=audio_file,
+            text=row["transcribed_text"],
+            language=Language(row["language_code"]),
+            metrics=metrics,
+            transcription_started_at=transcription_started_at,
+        )
+
+    def get_language_frequencies(self, directory: Path) -> Dict[Language, int]:
+        """
+        Count the languages of the best transcriptions of the files in a directory.
+
+        Only files directly inside `directory` are counted, not those in subdirectories.
+
+        Args:
+            directory: Directory of the audio files, as it appears in their stored paths
+
+        Returns:
+            Mapping of language to the number of files whose best transcription is in it
+        """
+        frequencies: Dict[Language, int] = {}
+
+        try:
+            cursor = self._connect().cursor()
+
+            cursor.execute(
+                """
+                SELECT language_code, COUNT(*) AS files FROM (
+                    SELECT language_code, ROW_NUMBER() OVER (
+                        PARTITION BY path ORDER BY confidence DESC
+                    ) AS rank
+                    FROM transcriptions
+                    WHERE directory = ?
+                )
+                WHERE rank = 1 AND language_code IS NOT NULL
+                GROUP BY language_code
+                """,
+                (str(directory),),
+            )
+
+            for row in cursor.fetchall():
+                frequencies[Language(row["language_code"])] = row["files"]
+
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving language frequencies: {e}")
+
+        return frequencies
 
     def _get_file_timestamp(self, path: Path):
         """Get timestamp from file using the timestamp port."""
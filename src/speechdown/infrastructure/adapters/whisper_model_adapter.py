@@ -2,31 +2,79 @@ try:  # pragma: no cover - optional dependency may not be installed in tests
     import whisper  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover - handled in __init__
     whisper = None  # type: ignore
-from typing import Dict, Any, Optional, Union
+try:  # pragma: no cover - installed together with openai-whisper
+    import torch  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    torch = None  # type: ignore
+import logging
+from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 
 from speechdown.application.ports.transcription_model_port import TranscriptionModelPort
 
+logger = logging.getLogger(__name__)
+
+# Whisper works on 16 kHz audio in fixed 30-second windows
+SAMPLE_RATE = 16000
+WINDOW_SECONDS = 30
+
+# Defaults of whisper.transcribe, applied to batched decoding results as well
+COMPRESSION_RATIO_THRESHOLD = 2.4
+LOGPROB_THRESHOLD = -1.0
+NO_SPEECH_THRESHOLD = 0.6
+
 
 class WhisperModelAdapter(TranscriptionModelPort):
     """Whisper model adapter implementing the TranscriptionModelPort."""
 
-    def __init__(self, model_name: str = "tiny"):
+    def __init__(self, model_name: str = "tiny", num_threads: int | None = None):
         """
         Initialize with specified Whisper model.
 
+        The model weights are not loaded here: loading takes seconds and hundreds of MB,
+        so it is deferred until the first transcription actually needs the model.
+
         See https://github.com/openai/whisper
 
         Args:
             model_name: Name of Whisper model to load ("tiny", "base", "small", "medium", "large", "turbo")
+            num_threads: Optional number of torch intra-op threads, used to share the CPU
+                         between several worker processes
         """
         if whisper is None:
             raise ImportError("openai-whisper is required for transcription but is not installed")
         self._model_name = model_name
-        self._model = whisper.load_model(model_name)
+        self._num_threads = num_threads
+        self._model: Any = None
+        # Number of times the model was loaded; stays 0 when every file was served from the DB
+        self.load_count = 0
+
+    @property
+    def model(self) -> Any:
+        """Return the underlying Whisper model, loading it on first access."""
+        if self._model is None:
+            logger.debug(f"Loading Whisper model '{self._model_name}'")
+            if self._num_threads and torch is not None:
+                torch.set_num_threads(self._num_threads)
+            self._model = whisper.load_model(self._model_name)
+            self.load_count += 1
+        return self._model
+
+    @property
+    def is_loaded(self) -> bool:
+        """Return True if the model weights have been loaded into memory."""
+        return self._model is not None
+
+    def load_audio(self, audio_path: Union[str, Path]) -> Any:
+        """
+        Decode an audio file with ffmpeg into a mono 16 kHz float32 numpy array.
+
+        This doesn't need the model, so it never triggers a model load.
+        """
+        return whisper.load_audio(str(audio_path))
 
     def transcribe(
-        self, audio_path: Union[str, Path], language: Optional[str] = None, **kwargs
+        self, audio: Union[str, Path, Any], language: Optional[str] = None, **kwargs
     ) -> Dict[str, Any]:
         """
         Transcribe audio file using Whisper.
@@ -34,7 +82,8 @@ class WhisperModelAdapter(TranscriptionModelPort):
         See https://github.com/openai/whisper/blob/main/whisper/transcribe.py
 
         Args:
-            audio_path: Path to audio file
+            audio: Path to audio file or samples returned by `load_audio`. Passing samples
+                   skips the ffmpeg decode that Whisper otherwise runs on every call.
             language: Optional language code
             **kwargs: Additional parameters passed to Whisper's transcribe method,
                       key parameters include:
@@ -95,7 +144,124 @@ class WhisperModelAdapter(TranscriptionModelPort):
         if language:
             kwargs["language"] = language
 
-        return self._model.transcribe(str(audio_path), **kwargs)
+        return self.model.transcribe(self._as_model_input(audio), **kwargs)
+
+    def detect_language(
+        self, audio: Union[str, Path, Any], languages: Optional[List[str]] = None
+    ) -> Dict[str, float]:
+        """
+        Score the first 30-second window of the audio with Whisper's language detection.
+
+        This runs the encoder once plus a single decoder step, which is far cheaper than a
+        full transcription per candidate language.
+
+        Args:
+            audio: Path to audio file or samples returned by `load_audio`
+            languages: Optional language codes to restrict the result to; the returned
+                       probabilities are renormalized over these languages
+
+        Returns:
+            Mapping of language code to probability, empty if the model can't detect
+            languages (English-only models)
+        """
+        model = self.model
+        if not getattr(model, "is_multilingual", True):
+            return {}
+
+        if isinstance(audio, (str, Path)):
+            audio = self.load_audio(audio)
+        mel = whisper.log_mel_spectrogram(whisper.pad_or_trim(audio), model.dims.n_mels)
+        _, probs = model.detect_language(mel.to(model.device))
+
+        if languages:
+            probs = {code: probs.get(code, 0.0) for code in languages}
+        total = sum(probs.values())
+        if total <= 0:
+            return {}
+        return {code: prob / total for code, prob in probs.items()}
+
+    def is_batchable(self, audio: Any) -> bool:
+        """Return True if decoded samples fit into a single 30-second Whisper window."""
+        return not isinstance(audio, (str, Path)) and len(audio) <= SAMPLE_RATE * WINDOW_SECONDS
+
+    def transcribe_batch(
+        self, audios: List[Any], language: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe several short clips with one batched encoder and greedy decoder pass.
+
+        Each clip is padded to a 30-second mel window and the windows are decoded together,
+        so the batch dimension is no longer always 1. Clips whose result would trigger
+        Whisper's temperature fallback (too repetitive or too unlikely) are transcribed
+        again individually with `transcribe`, keeping its quality safeguards.
+
+        Args:
+            audios: Decoded samples, each accepted by `is_batchable`
+            language: Optional language code used for every clip
+
+        Returns:
+            One result per clip, in the same format as `transcribe`. Batched clips get a
+            single segment spanning the whole clip.
+        """
+        if not audios:
+            return []
+        model = self.model
+        mel = torch.stack(
+            [
+                whisper.log_mel_spectrogram(whisper.pad_or_trim(audio), model.dims.n_mels)
+                for audio in audios
+            ]
+        ).to(model.device)
+        options = whisper.DecodingOptions(language=language, fp16=False, without_timestamps=True)
+        decoded = whisper.decode(model, mel, options)
+
+        results = []
+        for audio, decoding in zip(audios, decoded):
+            is_silent = (
+                decoding.no_speech_prob > NO_SPEECH_THRESHOLD
+                and decoding.avg_logprob < LOGPROB_THRESHOLD
+            )
+            needs_fallback = (
+                decoding.compression_ratio > COMPRESSION_RATIO_THRESHOLD
+                or decoding.avg_logprob < LOGPROB_THRESHOLD
+            )
+            if is_silent:
+                results.append({"text": "", "language": decoding.language, "segments": []})
+            elif needs_fallback:
+                logger.debug("Batched result failed quality thresholds; transcribing alone")
+                results.append(self.transcribe(audio, language=language))
+            else:
+                results.append(self._single_segment_result(audio, decoding))
+        return results
+
+    @staticmethod
+    def _single_segment_result(audio: Any, decoding: Any) -> Dict[str, Any]:
+        """Shape a whisper DecodingResult like the output of whisper.transcribe."""
+        return {
+            "text": decoding.text,
+            "language": decoding.language,
+            "segments": [
+                {
+                    "id": 0,
+                    "seek": 0,
+                    "start": 0.0,
+                    "end": len(audio) / SAMPLE_RATE,
+                    "text": decoding.text,
+                    "tokens": decoding.tokens,
+                    "temperature": decoding.temperature,
+                    "avg_logprob": decoding.avg_logprob,
+                    "compression_ratio": decoding.compression_ratio,
+                    "no_speech_prob": decoding.no_speech_prob,
+                }
+            ],
+        }
+
+    @staticmethod
+    def _as_model_input(audio: Union[str, Path, Any]) -> Any:
+        """Whisper accepts path strings and sample arrays, but not Path objects."""
+        if isinstance(audio, Path):
+            return str(audio)
+        return audio
 
     @property
     def name(self) -> str:
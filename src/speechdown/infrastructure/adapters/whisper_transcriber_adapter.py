@@ -1,11 +1,20 @@
+from dataclasses import replace
+import logging
 from typing import Dict, Any, List
 import statistics
 from datetime import datetime
 
+from speechdown.application.ports.audio_cache_port import AudioCachePort
 from speechdown.application.ports.transcriber_port import TranscriberPort
 from speechdown.domain.entities import AudioFile, Transcription
 from speechdown.domain.value_objects import Language, TranscriptionMetrics, MetricSource
-from speechdown.infrastructure.adapters.whisper_model_adapter import WhisperModelAdapter
+from speechdown.infrastructure.adapters.whisper_model_adapter import (
+    SAMPLE_RATE,
+    WhisperModelAdapter,
+)
+from speechdown.infrastructure.vad import TrimmedAudio, split_on_silence, trim_silence
+
+logger = logging.getLogger(__name__)
 
 
 class WhisperTranscriberAdapter(TranscriberPort):
@@ -38,10 +47,43 @@ class WhisperTranscriberAdapter(TranscriberPort):
 
     The adapter extracts metrics from this output and creates a Transcription object
     with relevant metrics for later processing and comparison.
+
+    With `trim_silence` enabled, non-speech regions are removed before the audio reaches
+    the model; segment timestamps are mapped back to the original file and the removed
+    duration is recorded as `additional_metrics["trimmed_seconds"]`.
+
+    With an `audio_cache`, files with a content hash are decoded once across runs.
     """
 
-    def __init__(self, model: WhisperModelAdapter):
+    def __init__(
+        self,
+        model: WhisperModelAdapter,
+        trim_silence: bool = False,
+        audio_cache: AudioCachePort | None = None,
+    ):
         self.model = model
+        self.trim_silence = trim_silence
+        self.audio_cache = audio_cache
+
+    @classmethod
+    def from_model_name(
+        cls,
+        model_name: str,
+        num_threads: int | None = None,
+        trim_silence: bool = False,
+        audio_cache: AudioCachePort | None = None,
+    ) -> "WhisperTranscriberAdapter":
+        """
+        Create an adapter with its own Whisper model.
+
+        Used through `functools.partial` as the picklable transcriber factory for worker
+        processes.
+        """
+        return cls(
+            WhisperModelAdapter(model_name=model_name, num_threads=num_threads),
+            trim_silence=trim_silence,
+            audio_cache=audio_cache,
+        )
 
     def _calculate_confidence(
         self, segments: List[Dict[str, Any]], avg_logprobs: List[float]
@@ -77,12 +119,15 @@ class WhisperTranscriberAdapter(TranscriberPort):
         #         return sum(prob * dur for prob, dur in zip(avg_logprobs, durations)) / total_duration
         # return None
 
-    def _extract_metrics_from_result(self, result: Dict[str, Any]) -> TranscriptionMetrics:
+    def _extract_metrics_from_result(
+        self, result: Dict[str, Any], trimmed: TrimmedAudio | None = None
+    ) -> TranscriptionMetrics:
         """
         Extract metrics from Whisper transcription result.
 
         Args:
             result: The dictionary returned by Whisper's transcribe method
+            trimmed: The silence trimming applied before transcription, if any
 
         Returns:
             A TranscriptionMetrics object containing extracted metrics
@@ -128,10 +173,33 @@ class WhisperTranscriberAdapter(TranscriberPort):
                 "temperature": segments[0].get("temperature") if segments else None,
             },
         )
+        if trimmed is not None:
+            metrics.additional_metrics["trimmed_seconds"] = trimmed.trimmed_seconds
 
         return metrics
 
-    def transcribe(self, audio_file: AudioFile, language: Language) -> Transcription:
+    def load_audio(self, audio_file: AudioFile) -> Any:
+        """
+        Decode the audio file once so several language attempts can share it.
+
+        Args:
+            audio_file: The audio file to decode
+
+        Returns:
+            Decoded samples to pass as `audio` to `transcribe` and `detect_language`
+        """
+        content_hash = audio_file.content_hash
+        if self.audio_cache is None or content_hash is None:
+            return self.model.load_audio(str(audio_file.path))
+        audio = self.audio_cache.load_audio(content_hash)
+        if audio is None:
+            audio = self.model.load_audio(str(audio_file.path))
+            self.audio_cache.store_audio(content_hash, audio)
+        return audio
+
+    def transcribe(
+        self, audio_file: AudioFile, language: Language, audio: Any = None
+    ) -> Transcription:
         """
         Transcribe an audio file with a specified language.
 
@@ -142,6 +210,7 @@ class WhisperTranscriberAdapter(TranscriberPort):
         Args:
             audio_file: The audio file to transcribe
             language: The language to use for transcription
+            audio: Optional samples from `load_audio`; the file is decoded if omitted
 
         Returns:
             A Transcription object containing the transcribed text and associated metrics
@@ -152,14 +221,17 @@ class WhisperTranscriberAdapter(TranscriberPort):
         start_time = time.monotonic()
         transcription_started_at = datetime.now()
 
+        model_audio, trimmed = self._prepare_audio(audio_file, audio)
+
         # Use the provided model to transcribe with the specified language
-        result = self.model.transcribe(str(audio_file.path), language=language.code)
+        result = self.model.transcribe(model_audio, language=language.code)
+        result = self._restore_timestamps(result, trimmed)
 
         # Calculate transcription time
         transcription_time_seconds = time.monotonic() - start_time
 
         # Extract metrics from the result
-        metrics = self._extract_metrics_from_result(result)
+        metrics = self._extract_metrics_from_result(result, trimmed)
 
         # Add transcription time to metrics
         # Create a new TranscriptionMetrics object including all fields from the original
@@ -177,6 +249,206 @@ class WhisperTranscriberAdapter(TranscriberPort):
             transcription_started_at=transcription_started_at,
         )
 
+    def transcribe_batch(
+        self, audio_files: list[AudioFile], language: Language, audios: list[Any]
+    ) -> list[Transcription]:
+        """
+        Transcribe several files in the same language, batching the short ones.
+
+        Clips that fit into one 30-second window are decoded together in a single forward
+        pass; longer files go through `transcribe` one by one. Metrics are computed per
+        file. Every clip in a batch costs one padded encoder window, so the batch's wall
+        time is split evenly between its clips.
+
+        Args:
+            audio_files: The audio files to transcribe
+            language: The language to use for every file
+            audios: Samples from `load_audio`, one per audio file
+
+        Returns:
+            One Transcription per audio file, in the same order
+        """
+        import time
+
+        prepared = [
+            self._prepare_audio(audio_file, audio) for audio_file, audio in zip(audio_files, audios)
+        ]
+        batched = [
+            i for i, (model_audio, _) in enumerate(prepared) if self.model.is_batchable(model_audio)
+        ]
+        transcriptions: list[Transcription | None] = [None] * len(audio_files)
+        for i, (audio_file, audio) in enumerate(zip(audio_files, audios)):
+            if i not in batched:
+                transcriptions[i] = self.transcribe(audio_file, language, audio=audio)
+
+        if batched:
+            start_time = time.monotonic()
+            transcription_started_at = datetime.now()
+            results = self.model.transcribe_batch(
+                [prepared[i][0] for i in batched], language=language.code
+            )
+            seconds_per_clip = (time.monotonic() - start_time) / len(batched)
+
+            for i, result in zip(batched, results):
+                trimmed = prepared[i][1]
+                result = self._restore_timestamps(result, trimmed)
+                metrics = self._extract_metrics_from_result(result, trimmed)
+                metrics = replace(
+                    metrics,
+                    transcription_time_seconds=seconds_per_clip,
+                    additional_metrics={**metrics.additional_metrics, "batch_size": len(batched)},
+                )
+                transcriptions[i] = Transcription(
+                    audio_file=audio_files[i],
+                    text=result["text"],
+                    language=language,
+                    metrics=metrics,
+                    transcription_started_at=transcription_started_at,
+                )
+
+        return [transcription for transcription in transcriptions if transcription is not None]
+
+    def split_audio(
+        self, audio_file: AudioFile, chunk_seconds: float, audio: Any = None
+    ) -> list[Any]:
+        """
+        Cut a long recording into chunks of roughly `chunk_seconds` at quiet moments.
+
+        Args:
+            audio_file: The audio file to split
+            chunk_seconds: Target chunk length
+            audio: Optional samples from `load_audio`; the file is decoded if omitted
+
+        Returns:
+            Consecutive chunks covering the whole file; a single chunk if it is short
+        """
+        if audio is None:
+            audio = self.load_audio(audio_file)
+        chunks = split_on_silence(audio, chunk_seconds, sample_rate=SAMPLE_RATE)
+        if len(chunks) > 1:
+            logger.debug(f"Split {audio_file.path} into {len(chunks)} chunks")
+        return chunks
+
+    def stitch_transcriptions(
+        self, audio_file: AudioFile, parts: list[Transcription], chunks: list[Any]
+    ) -> Transcription:
+        """
+        Combine the transcriptions of consecutive chunks into one for the whole file.
+
+        Quality metrics are averaged weighted by chunk duration, so a short tail chunk
+        doesn't count as much as a full one. The audio duration is the end of the last
+        chunk's speech on the original timeline, as for a single `transcribe` call.
+
+        Args:
+            audio_file: The file the chunks come from
+            parts: One transcription per chunk, in order, all in the same language
+            chunks: The chunks returned by `split_audio`, in the same order
+
+        Returns:
+            A single Transcription with the joined text and aggregated metrics
+        """
+        durations = [len(chunk) / SAMPLE_RATE for chunk in chunks]
+        metrics = [part.metrics for part in parts]
+
+        def weighted_mean(values: list[float | None]) -> float | None:
+            pairs = [(v, d) for v, d in zip(values, durations) if v is not None and d > 0]
+            total = sum(d for _, d in pairs)
+            return sum(v * d for v, d in pairs) / total if total > 0 else None
+
+        last_offset = sum(durations[:-1])
+        audio_duration = last_offset + (metrics[-1].audio_duration_seconds or 0.0)
+        word_count = sum(m.word_count or 0 for m in metrics)
+        # Compute time across all chunks, not the wall time of a concurrent run
+        transcription_time = sum(m.transcription_time_seconds or 0.0 for m in metrics)
+        additional_metrics: dict[str, Any] = {
+            "segments_count": sum(m.additional_metrics.get("segments_count", 0) for m in metrics),
+            "temperature": metrics[0].additional_metrics.get("temperature"),
+            "chunks_count": len(parts),
+        }
+        if any("trimmed_seconds" in m.additional_metrics for m in metrics):
+            additional_metrics["trimmed_seconds"] = sum(
+                m.additional_metrics.get("trimmed_seconds", 0.0) for m in metrics
+            )
+
+        return Transcription(
+            audio_file=audio_file,
+            text=" ".join(part.text.strip() for part in parts if part.text.strip()),
+            language=parts[0].language,
+            metrics=TranscriptionMetrics(
+                model_name=metrics[0].model_name,
+                transcription_time_seconds=transcription_time,
+                confidence=weighted_mean([m.confidence for m in metrics]),
+                audio_duration_seconds=audio_duration,
+                word_count=word_count,
+                words_per_second=(word_count / audio_duration)
+                if audio_duration > 0 and word_count > 0
+                else None,
+                avg_logprob_mean=weighted_mean([m.avg_logprob_mean for m in metrics]),
+                compression_ratio_mean=weighted_mean([m.compression_ratio_mean for m in metrics]),
+                no_speech_prob_mean=weighted_mean([m.no_speech_prob_mean for m in metrics]),
+                source=MetricSource.WHISPER,
+                additional_metrics=additional_metrics,
+            ),
+            transcription_started_at=min(
+                (p.transcription_started_at for p in parts if p.transcription_started_at),
+                default=None,
+            ),
+        )
+
+    def detect_language(
+        self, audio_file: AudioFile, languages: list[Language], audio: Any = None
+    ) -> dict[Language, float]:
+        """
+        Score the candidate languages using Whisper's language detection.
+
+        Args:
+            audio_file: The audio file to inspect
+            languages: The candidate languages
+            audio: Optional samples from `load_audio`; the file is decoded if omitted
+
+        Returns:
+            Mapping of each candidate language to its probability, or an empty dict if
+            the model doesn't support language detection
+        """
+        probs = self.model.detect_language(
+            self._audio_source(audio_file, audio),
+            languages=[language.code for language in languages],
+        )
+        if not probs:
+            return {}
+        return {language: probs.get(language.code, 0.0) for language in languages}
+
+    @staticmethod
+    def _audio_source(audio_file: AudioFile, audio: Any) -> Any:
+        """Prefer already decoded samples over the file path."""
+        return audio if audio is not None else str(audio_file.path)
+
+    def _prepare_audio(self, audio_file: AudioFile, audio: Any) -> tuple[Any, TrimmedAudio | None]:
+        """Return what to pass to the model and, if silence was trimmed, the offset map."""
+        if not self.trim_silence:
+            return self._audio_source(audio_file, audio), None
+        if audio is None:
+            audio = self.load_audio(audio_file)
+        trimmed = trim_silence(audio)
+        return trimmed.audio, trimmed
+
+    @staticmethod
+    def _restore_timestamps(
+        result: Dict[str, Any], trimmed: TrimmedAudio | None
+    ) -> Dict[str, Any]:
+        """Map segment times of a result for trimmed audio back onto the original file."""
+        if trimmed is None or not trimmed.trimmed_seconds:
+            return result
+        segments = [
+            {
+                **segment,
+                "start": trimmed.to_original_time(segment.get("start", 0.0)),
+                "end": trimmed.to_original_time(segment.get("end", 0.0)),
+            }
+            for segment in result.get("segments", [])
+        ]
+        return {**result, "segments": segments}
+
     def auto_transcribe(self, audio_file: AudioFile) -> Transcription:
         """
         Automatically detect language and transcribe an audio file.
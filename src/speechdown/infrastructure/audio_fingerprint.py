@@ -0,0 +1,106 @@
+"""Compact spectral fingerprints of decoded audio, used to recognize near-duplicate recordings.
+
+Recorder apps often export the same note twice, e.g. as m4a and wav, or trimmed and
+untrimmed. The bytes differ, but the spectrum over time does not. Each frame of the
+fingerprint is one uint32: bit `m` tells whether the energy difference between speech bands
+`m` and `m + 1` grew or shrank since the previous frame. These bits survive re-encoding and
+volume changes; two fingerprints of the same recording, aligned, differ in few bits, while
+unrelated recordings differ in about half of them.
+"""
+
+try:  # pragma: no cover - installed together with openai-whisper
+    import numpy as np  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    np = None  # type: ignore
+from dataclasses import dataclass
+from typing import Any
+
+SAMPLE_RATE = 16000
+# 512 ms frames every 64 ms, about 16 values per second; frames overlap by 7/8, so a copy
+# whose start was trimmed by a fraction of a hop still aligns closely
+FRAME_LENGTH = 8192
+HOP_LENGTH = 1024
+# 33 bands between these frequencies give the 32 bits of each frame
+LOWEST_FREQUENCY = 300.0
+HIGHEST_FREQUENCY = 3000.0
+BAND_COUNT = 33
+# Frames transformed at once
+BLOCK_FRAMES = 256
+# Only the beginning of long recordings is fingerprinted, which keeps fingerprints small
+MAX_SECONDS = 120
+# Near-duplicates have similar durations: trimming may remove silence, not most of the note
+MIN_DURATION_RATIO = 0.75
+# Part of the shorter fingerprint that must overlap the other one at the compared offset
+MIN_OVERLAP = 0.9
+
+
+@dataclass(frozen=True)
+class AudioFingerprint:
+    # uint32 array, one value per frame of the first MAX_SECONDS
+    values: Any
+    duration_seconds: float
+
+
+def compute_fingerprint(audio: Any, sample_rate: int = SAMPLE_RATE) -> AudioFingerprint | None:
+    """
+    Return the fingerprint of mono float samples.
+
+    Returns None without numpy or for audio shorter than three frames.
+    """
+    if np is None:
+        return None
+    samples = np.asarray(audio[: MAX_SECONDS * sample_rate], dtype=np.float32)
+    if len(samples) < FRAME_LENGTH:
+        return None
+    frame_count = 1 + (len(samples) - FRAME_LENGTH) // HOP_LENGTH
+    if frame_count < 3:
+        return None
+
+    window = np.hanning(FRAME_LENGTH).astype(np.float32)
+    bands = _band_matrix(sample_rate)
+    energy = np.empty((frame_count, BAND_COUNT))
+    # Frames are transformed in blocks, so memory stays bounded for long recordings
+    for block_start in range(0, frame_count, BLOCK_FRAMES):
+        starts = np.arange(block_start, min(block_start + BLOCK_FRAMES, frame_count))
+        frames = samples[starts[:, None] * HOP_LENGTH + np.arange(FRAME_LENGTH)] * window
+        energy[starts] = np.abs(np.fft.rfft(frames, axis=1)) ** 2 @ bands
+
+    band_difference = np.diff(energy, axis=1)
+    bits = (band_difference[1:] - band_difference[:-1]) > 0
+    weights = np.uint64(1) << np.arange(BAND_COUNT - 1, dtype=np.uint64)
+    values = (bits.astype(np.uint64) @ weights).astype(np.uint32)
+    return AudioFingerprint(values=values, duration_seconds=len(audio) / sample_rate)
+
+
+def _band_matrix(sample_rate: int) -> Any:
+    """Matrix that sums the power of FFT bins into log-spaced bands."""
+    frequencies = np.fft.rfftfreq(FRAME_LENGTH, d=1.0 / sample_rate)
+    edges = np.geomspace(LOWEST_FREQUENCY, HIGHEST_FREQUENCY, BAND_COUNT + 1)
+    band_of_bin = np.searchsorted(edges, frequencies, side="right") - 1
+    return (band_of_bin[:, None] == np.arange(BAND_COUNT)).astype(np.float64)
+
+
+def fingerprint_similarity(first: AudioFingerprint, second: AudioFingerprint, offset: int) -> float:
+    """
+    Share of equal bits when frame `i` of `first` is compared with frame `i + offset` of
+    `second`; 0.0 if the durations or the overlap rule out a near-duplicate.
+    """
+    shorter, longer = sorted((first.duration_seconds, second.duration_seconds))
+    if shorter < MIN_DURATION_RATIO * longer:
+        return 0.0
+    a, b = first.values, second.values
+    start = max(0, -offset)
+    end = min(len(a), len(b) - offset)
+    if end - start <= 0 or end - start < MIN_OVERLAP * min(len(a), len(b)):
+        return 0.0
+    differing = np.bitwise_xor(a[start:end], b[start + offset : end + offset])
+    differing_bits = int(np.unpackbits(differing.view(np.uint8)).sum())
+    return 1.0 - differing_bits / (32 * (end - start))
+
+
+def values_to_bytes(values: Any) -> bytes:
+    return np.asarray(values, dtype="<u4").tobytes()
+
+
+def values_from_bytes(data: bytes) -> Any:
+    return np.frombuffer(data, dtype="<u4").astype(np.uint32)
@@ -0,0 +1,280 @@
+"""Recording times from audio container headers, read without decoding any audio.
+
+Many recorders name files "Voice 001.m4a" but store when the recording was made in the
+container: the `mvhd` box of MP4/M4A files, the `bext` chunk of broadcast WAV files, the
+ID3v2 `TDRC` (or `TYER`/`TDAT`/`TIME`) frames of MP3 files, and the `DATE` or
+`CREATION_TIME` Vorbis comments of FLAC, Ogg Vorbis and Opus files.
+
+Only box, chunk and frame headers are read; everything else is skipped with a seek, so a
+lookup costs a few small reads even for large files. Tag values without a time of day are
+ignored, since a date at midnight would be less accurate than the file's mtime.
+"""
+
+from datetime import datetime, timedelta, timezone
+import logging
+import os
+from pathlib import Path
+import re
+import struct
+from typing import BinaryIO, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for a single tag block or frame read into memory (cover art is skipped)
+MAX_TAG_BYTES = 64 * 1024
+# Chunks, boxes or frames looked at per file, so corrupt sizes cannot loop for long
+MAX_ENTRIES = 1024
+
+MP4_EPOCH = datetime(1904, 1, 1, tzinfo=timezone.utc)
+# bext: Description (256), Originator (32), OriginatorReference (32), then date and time
+BEXT_DATE_OFFSET = 320
+BEXT_TIME_LENGTH = 18
+ID3_TIME_FRAMES = ("TDRC", "TYER", "TDAT", "TIME")
+# ID3v2 frame flags for compressed, encrypted or unsynchronised data, which are skipped
+ID3V23_FORMAT_FLAGS = 0x00C0
+ID3V24_FORMAT_FLAGS = 0x000F
+VORBIS_TIME_KEYS = ("CREATION_TIME", "DATE")
+OGG_PAGE_HEADER = struct.Struct("<4sBBqIIIB")
+
+_BEXT_TIME = re.compile(rb"(\d{4})\D(\d{2})\D(\d{2})(\d{2})\D(\d{2})\D(\d{2})")
+
+
+def read_recording_time(path: Path) -> datetime | None:
+    """
+    Return the recording time stored in the file's headers as naive local time.
+
+    Returns None for unsupported formats, files without such metadata, and unreadable or
+    malformed files.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(12)
+            if head[4:8] == b"ftyp":
+                return _read_mp4_time(f)
+            if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+                return _read_bext_time(f)
+            if head[:3] == b"ID3":
+                return _read_id3_time(f)
+            if head[:4] == b"fLaC":
+                return _read_flac_time(f)
+            if head[:4] == b"OggS":
+                return _read_ogg_time(f)
+    except (OSError, OverflowError, ValueError, struct.error) as e:
+        logger.debug(f"Could not read metadata of {path}: {e}")
+    return None
+
+
+def _to_local(value: datetime) -> datetime:
+    """Naive local time, like filename timestamps and mtimes."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+def _read_exactly(f: BinaryIO, size: int) -> bytes:
+    data = f.read(size)
+    if len(data) < size:
+        raise ValueError("unexpected end of file")
+    return data
+
+
+def _iter_mp4_boxes(f: BinaryIO, start: int, end: int) -> Iterator[tuple[bytes, int, int]]:
+    """Yield `(type, payload start, box end)` for the boxes between `start` and `end`."""
+    position = start
+    for _ in range(MAX_ENTRIES):
+        if position + 8 > end:
+            return
+        f.seek(position)
+        size, kind = struct.unpack(">I4s", _read_exactly(f, 8))
+        header_size = 8
+        if size == 1:
+            size = struct.unpack(">Q", _read_exactly(f, 8))[0]
+            header_size = 16
+        elif size == 0:
+            size = end - position
+        if size < header_size:
+            return
+        yield kind, position + header_size, position + size
+        position += size
+
+
+def _read_mp4_time(f: BinaryIO) -> datetime | None:
+    """Creation time of the movie header (`moov/mvhd`), stored in UTC."""
+    end = os.fstat(f.fileno()).st_size
+    for kind, start, box_end in _iter_mp4_boxes(f, 0, end):
+        if kind != b"moov":
+            continue
+        for child, child_start, _ in _iter_mp4_boxes(f, start, box_end):
+            if child != b"mvhd":
+                continue
+            f.seek(child_start)
+            version = _read_exactly(f, 4)[0]
+            if version == 1:
+                seconds = struct.unpack(">Q", _read_exactly(f, 8))[0]
+            else:
+                seconds = struct.unpack(">I", _read_exactly(f, 4))[0]
+            # Zero means unset; many encoders write it
+            if seconds == 0:
+                return None
+            return _to_local(MP4_EPOCH + timedelta(seconds=seconds))
+    return None
+
+
+def _read_bext_time(f: BinaryIO) -> datetime | None:
+    """OriginationDate and OriginationTime of the broadcast extension chunk, in local time."""
+    end = os.fstat(f.fileno()).st_size
+    position = 12
+    for _ in range(MAX_ENTRIES):
+        if position + 8 > end:
+            return None
+        f.seek(position)
+        chunk_id, size = struct.unpack("<4sI", _read_exactly(f, 8))
+        if chunk_id == b"bext":
+            f.seek(position + 8 + BEXT_DATE_OFFSET)
+            match = _BEXT_TIME.match(f.read(BEXT_TIME_LENGTH))
+            if not match:
+                return None
+            year, month, day, hour, minute, second = (int(part) for part in match.groups())
+            return datetime(year, month, day, hour, minute, second)
+        # Chunks are padded to an even size
+        position += 8 + size + (size & 1)
+    return None
+
+
+def _syncsafe(data: bytes) -> int:
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def _decode_id3_text(data: bytes) -> str:
+    encoding = {0: "latin-1", 1: "utf-16", 2: "utf-16-be", 3: "utf-8"}.get(data[0])
+    if encoding is None:
+        raise ValueError(f"unknown ID3 text encoding {data[0]}")
+    return data[1:].decode(encoding).split("\x00")[0].strip()
+
+
+def _read_id3_time(f: BinaryIO) -> datetime | None:
+    """Recording time from ID3v2.4 `TDRC`, or from v2.3 `TYER`, `TDAT` and `TIME`."""
+    f.seek(0)
+    header = _read_exactly(f, 10)
+    major, flags = header[3], header[5]
+    if major not in (3, 4):
+        return None
+    end = 10 + _syncsafe(header[6:10])
+    position = 10
+    if flags & 0x40:
+        # Extended header: v2.4 counts its own size field, v2.3 does not
+        extended = _read_exactly(f, 4)
+        position += _syncsafe(extended) if major == 4 else 4 + int.from_bytes(extended, "big")
+
+    frames: dict[str, str] = {}
+    for _ in range(MAX_ENTRIES):
+        if position + 10 > end:
+            break
+        f.seek(position)
+        frame_header = _read_exactly(f, 10)
+        if frame_header[0] == 0:  # padding
+            break
+        frame_id = frame_header[:4].decode("latin-1")
+        size_field = frame_header[4:8]
+        size = _syncsafe(size_field) if major == 4 else int.from_bytes(size_field, "big")
+        frame_flags = struct.unpack(">H", frame_header[8:10])[0]
+        format_flags = ID3V24_FORMAT_FLAGS if major == 4 else ID3V23_FORMAT_FLAGS
+        if (
+            frame_id in ID3_TIME_FRAMES
+            and not frame_flags & format_flags
+            and 0 < size <= MAX_TAG_BYTES
+        ):
+            frames[frame_id] = _decode_id3_text(_read_exactly(f, size))
+        position += 10 + size
+
+    if "TDRC" in frames:
+        return _parse_tag_time(frames["TDRC"])
+    year, day_month, hour_minute = (frames.get(frame) for frame in ("TYER", "TDAT", "TIME"))
+    if year and day_month and hour_minute:
+        return _parse_tag_time(
+            f"{year}-{day_month[2:4]}-{day_month[:2]}T{hour_minute[:2]}:{hour_minute[2:4]}"
+        )
+    return None
+
+
+def _read_flac_time(f: BinaryIO) -> datetime | None:
+    """Vorbis comment metadata block of a FLAC file."""
+    position = 4
+    for _ in range(MAX_ENTRIES):
+        f.seek(position)
+        header = _read_exactly(f, 4)
+        is_last, block_type = header[0] & 0x80, header[0] & 0x7F
+        size = int.from_bytes(header[1:4], "big")
+        if block_type == 4:
+            return _vorbis_comment_time(f.read(min(size, MAX_TAG_BYTES)))
+        if is_last:
+            return None
+        position += 4 + size
+    return None
+
+
+def _read_ogg_time(f: BinaryIO) -> datetime | None:
+    """Comment header, the second packet of an Ogg Vorbis or Opus stream."""
+    f.seek(0)
+    packets: list[bytes] = []
+    packet = b""
+    read = 0
+    while len(packets) < 2 and read < MAX_TAG_BYTES:
+        header = f.read(OGG_PAGE_HEADER.size)
+        if len(header) < OGG_PAGE_HEADER.size:
+            break
+        capture, _, _, _, _, _, _, segment_count = OGG_PAGE_HEADER.unpack(header)
+        if capture != b"OggS":
+            raise ValueError("lost Ogg page sync")
+        lacing = _read_exactly(f, segment_count)
+        data = _read_exactly(f, sum(lacing))
+        read += OGG_PAGE_HEADER.size + segment_count + len(data)
+        offset = 0
+        for length in lacing:
+            packet += data[offset : offset + length]
+            offset += length
+            # A segment shorter than 255 bytes ends the packet
+            if length < 255:
+                packets.append(packet)
+                packet = b""
+    # A comment header cut off by the read limit is still parsed up to the limit
+    comments = packets[1] if len(packets) > 1 else packet if packets else b""
+    for magic in (b"\x03vorbis", b"OpusTags"):
+        if comments.startswith(magic):
+            return _vorbis_comment_time(comments[len(magic) :])
+    return None
+
+
+def _vorbis_comment_time(data: bytes) -> datetime | None:
+    """Parse a Vorbis comment list and return its recording time, if any."""
+    values: dict[str, str] = {}
+    vendor_length = struct.unpack_from("<I", data, 0)[0]
+    position = 4 + vendor_length
+    count = struct.unpack_from("<I", data, position)[0]
+    position += 4
+    for _ in range(min(count, MAX_ENTRIES)):
+        if position + 4 > len(data):
+            break
+        length = struct.unpack_from("<I", data, position)[0]
+        comment = data[position + 4 : position + 4 + length].decode("utf-8", errors="replace")
+        position += 4 + length
+        key, _, value = comment.partition("=")
+        values.setdefault(key.upper(), value)
+    for key in VORBIS_TIME_KEYS:
+        if key in values:
+            parsed = _parse_tag_time(values[key])
+            if parsed is not None:
+                return parsed
+    return None
+
+
+def _parse_tag_time(value: str) -> datetime | None:
+    """ISO 8601 date and time, with or without a UTC offset; None without a time of day."""
+    value = value.strip()
+    # "YYYY-MM-DD" alone, or just a year, carries no time of day
+    if len(value) < len("YYYY-MM-DDTHH:MM"):
+        return None
+    try:
+        return _to_local(datetime.fromisoformat(value))
+    except ValueError:
+        return None
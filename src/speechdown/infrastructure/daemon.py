@@ -0,0 +1,120 @@
+"""Local Unix socket daemon used by `sd serve` to keep the transcription stack warm.
+
+The protocol is intentionally small: a client connects, writes one JSON object terminated
+by a newline and reads one JSON object back. Requests are served one at a time, so a single
+in-memory Whisper model is never used concurrently.
+"""
+
+import json
+import logging
+import socket
+import socketserver
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+DaemonHandler = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+# Waiting for a reply can take as long as a transcription, but connecting should be instant
+CONNECT_TIMEOUT_SECONDS = 1.0
+
+
+def is_supported() -> bool:
+    """Return True if the platform supports Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line)
+            response = self.server.daemon_handler(request)  # type: ignore[attr-defined]
+        except Exception as e:
+            logger.exception("Error handling daemon request")
+            response = {"status": "error", "message": str(e)}
+        self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+
+class DaemonServer:
+    """Serve JSON requests on a Unix socket, dispatching each one to a handler."""
+
+    def __init__(self, socket_path: Path, handler: DaemonHandler):
+        self.socket_path = Path(socket_path)
+        self.handler = handler
+        self._server: socketserver.BaseServer | None = None
+
+    def start(self) -> None:
+        """Bind the socket, removing a stale socket file left by a crashed daemon."""
+        if not is_supported():
+            raise RuntimeError("Unix domain sockets are not supported on this platform")
+        if self.socket_path.exists():
+            if DaemonClient(self.socket_path).ping():
+                raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+            logger.debug(f"Removing stale socket file {self.socket_path}")
+            self.socket_path.unlink()
+        server = socketserver.UnixStreamServer(str(self.socket_path), _RequestHandler)
+        server.daemon_handler = self.handler  # type: ignore[attr-defined]
+        self._server = server
+        logger.info(f"Daemon listening on {self.socket_path}")
+
+    def serve_forever(self) -> None:
+        if self._server is None:
+            self.start()
+        assert self._server is not None
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stop serve_forever running in another thread."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def close(self) -> None:
+        """Close the server socket and remove the socket file."""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        logger.info("Daemon stopped")
+
+
+class DaemonClient:
+    """Send requests to a running daemon, if there is one."""
+
+    def __init__(self, socket_path: Path):
+        self.socket_path = Path(socket_path)
+
+    def request(self, payload: Dict[str, Any]) -> Dict[str, Any] | None:
+        """
+        Send a request and wait for the response.
+
+        Returns:
+            The decoded response, or None if no daemon is listening on the socket
+        """
+        if not is_supported() or not self.socket_path.exists():
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+            try:
+                sock.connect(str(self.socket_path))
+            except OSError as e:
+                logger.debug(f"No daemon listening on {self.socket_path}: {e}")
+                return None
+            sock.settimeout(None)
+            with sock.makefile("rwb") as stream:
+                stream.write((json.dumps(payload) + "\n").encode("utf-8"))
+                stream.flush()
+                line = stream.readline()
+        finally:
+            sock.close()
+        if not line:
+            return None
+        return json.loads(line)
+
+    def ping(self) -> bool:
+        """Return True if a daemon answers on the socket."""
+        response = self.request({"command": "ping"})
+        return response is not None and response.get("status") == "ok"
@@ -1,10 +1,258 @@
+"""
+Schema versioning for the SpeechDown database.
+
+The version of a database file is kept in `PRAGMA user_version`. Each entry in
+`MIGRATIONS` upgrades the schema by one version; a database is brought up to date by
+running the migrations it has not seen yet, each in its own transaction together with the
+version bump. Released migrations must never change; add a new one instead.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import logging
 import sqlite3
 from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from speechdown.infrastructure.schema import (
+    AUDIO_FILE_COLUMNS,
+    CONTENT_HASH_COLUMN,
+    DIRECTORY_COLUMN,
+    FINGERPRINT_INDEX,
+    INDEXES,
+    METADATA_TIMESTAMPS,
+    SCAN_INDEX,
+    SCHEMA,
+)
+
+logger = logging.getLogger(__name__)
+
+# How long a write waits for another process (e.g. a running `sd serve`) to release the lock
+BUSY_TIMEOUT_MS = 5000
+
+
+def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    cursor = conn.execute(f"PRAGMA table_info({table})")
+    return any(row[1] == column for row in cursor.fetchall())
+
+
+def _create_transcriptions_table(conn: sqlite3.Connection) -> None:
+    """Version 1: the `transcriptions` table, renaming `created_at` in pre-0.2.7 files."""
+    conn.execute(SCHEMA)
+    if _column_exists(conn, "transcriptions", "created_at") and not _column_exists(
+        conn, "transcriptions", "transcription_started_at"
+    ):
+        conn.execute(
+            "ALTER TABLE transcriptions RENAME COLUMN created_at TO transcription_started_at"
+        )
+
+
+def _create_transcription_indexes(conn: sqlite3.Connection) -> None:
+    """Version 2: indexes for the lookups by path and by start time."""
+    for statement in INDEXES:
+        conn.execute(statement)
+
+
+def _add_audio_file_columns(conn: sqlite3.Connection) -> None:
+    """Version 3: audio timestamp, file size and mtime, filled in by new saves."""
+    for statement in AUDIO_FILE_COLUMNS:
+        conn.execute(statement)
+
+
+def _create_scan_index(conn: sqlite3.Connection) -> None:
+    """Version 4: the file index used by incremental scans."""
+    for statement in SCAN_INDEX:
+        conn.execute(statement)
+
+
+def _create_metadata_timestamps(conn: sqlite3.Connection) -> None:
+    """Version 5: the cache of recording times read from audio file metadata."""
+    for statement in METADATA_TIMESTAMPS:
+        conn.execute(statement)
+
+
+def _add_content_hash_column(conn: sqlite3.Connection) -> None:
+    """Version 6: content hash of the audio file, filled in by new saves."""
+    for statement in CONTENT_HASH_COLUMN:
+        conn.execute(statement)
+
+
+def _create_fingerprint_index(conn: sqlite3.Connection) -> None:
+    """Version 7: audio fingerprints and their term index, for near-duplicate lookups."""
+    for statement in FINGERPRINT_INDEX:
+        conn.execute(statement)
+
+
+def _add_directory_column(conn: sqlite3.Connection) -> None:
+    """Version 8: parent directory of each transcribed file, filled in for existing rows."""
+    for statement in DIRECTORY_COLUMN:
+        conn.execute(statement)
+    conn.create_function("parent_directory", 1, lambda path: str(Path(path).parent))
+    conn.execute("UPDATE transcriptions SET directory = parent_directory(path)")
 
 
-def initialize_database(db_path: Path, schema: str) -> None:
+MIGRATIONS: list[Callable[[sqlite3.Connection], None]] = [
+    _create_transcriptions_table,
+    _create_transcription_indexes,
+    _add_audio_file_columns,
+    _create_scan_index,
+    _create_metadata_timestamps,
+    _add_content_hash_column,
+    _create_fingerprint_index,
+    _add_directory_column,
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    Apply the pending migrations to an open connection.
+
+    Returns:
+        The schema version before migrating
+
+    Raises:
+        sqlite3.DatabaseError: If the database was written by a newer SpeechDown version
+    """
+    version = get_schema_version(conn)
+    if version > SCHEMA_VERSION:
+        raise sqlite3.DatabaseError(
+            f"Database schema version {version} is newer than supported version "
+            f"{SCHEMA_VERSION}; please upgrade SpeechDown"
+        )
+
+    isolation_level = conn.isolation_level
+    # Manage transactions explicitly so each migration's DDL commits with its version bump
+    conn.isolation_level = None
+    try:
+        for target, migration in enumerate(MIGRATIONS[version:], version + 1):
+            conn.execute("BEGIN")
+            try:
+                migration(conn)
+                conn.execute(f"PRAGMA user_version = {target}")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            logger.debug(f"Migrated database schema to version {target}")
+    finally:
+        conn.isolation_level = isolation_level
+    return version
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """
+    Open a long-lived connection in autocommit mode, with named-column rows.
+
+    WAL mode lets readers, such as a second `sd transcribe`, run while another process
+    writes. With WAL, `synchronous=NORMAL` only syncs at checkpoints: a crash can lose the
+    last commits but never corrupts the database.
+    """
+    conn = sqlite3.connect(
+        db_path,
+        timeout=BUSY_TIMEOUT_MS / 1000,
+        isolation_level=None,
+        check_same_thread=False,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    return conn
+
+
+def initialize_database(db_path: Path) -> int:
+    """
+    Create the database or upgrade it in place to the current schema version.
+
+    Returns:
+        The schema version before migrating (0 for a new database)
+    """
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.executescript(schema)
-    conn.commit()
-    conn.close()
+    try:
+        return migrate(conn)
+    finally:
+        conn.close()
+
+
+@dataclass
+class Database:
+    """
+    The connection to a project database, shared by the SQLite adapters of a process.
+
+    Writes grouped with `transaction()` commit once; nested calls join the outermost
+    transaction. Writes queued with `defer()`, such as cache entries, are not worth a commit
+    of their own and are applied at the start of the next transaction, or on `close()`.
+    The connection is meant for one thread at a time.
+    """
+
+    path: Path
+    _connection: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+    _transaction_depth: int = field(default=0, init=False, repr=False)
+    _deferred: list[tuple[str, tuple[Any, ...]]] = field(
+        default_factory=list, init=False, repr=False
+    )
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the connection, opening and configuring it on first use."""
+        if self._connection is None:
+            self._connection = connect(self.path)
+        return self._connection
+
+    def close(self) -> None:
+        """Apply the deferred writes and close the connection; the next call reopens it."""
+        if self._connection is None:
+            return
+        if self._deferred:
+            try:
+                with self.transaction():
+                    pass
+            except sqlite3.Error as e:
+                logger.error(f"Error applying deferred writes: {e}")
+        self._connection.close()
+        self._connection = None
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into one unit of work that commits once, or not at all on error."""
+        conn = self.connection()
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        self._transaction_depth = 1
+        try:
+            deferred, self._deferred = self._deferred, []
+            for sql, parameters in deferred:
+                self._execute_deferred(sql, parameters)
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            self._transaction_depth = 0
+
+    def defer(self, sql: str, parameters: tuple[Any, ...]) -> None:
+        """Write with the next transaction, or right away inside one."""
+        if self._transaction_depth:
+            self._execute_deferred(sql, parameters)
+        else:
+            self._deferred.append((sql, parameters))
+
+    def _execute_deferred(self, sql: str, parameters: tuple[Any, ...]) -> None:
+        # A failed cache write must not roll back the unit of work it joined
+        try:
+            self.connection().execute(sql, parameters)
+        except sqlite3.Error as e:
+            logger.error(f"Error applying deferred write: {e}")
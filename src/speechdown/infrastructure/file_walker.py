@@ -0,0 +1,151 @@
+"""
+Directory walker used to collect audio files.
+
+`os.scandir` reports whether each entry is a file or a directory without a `stat` call, so
+only audio files are stat'ed. Hidden directories (`.speechdown`, `.git`, ...), a few
+well-known tool directories, excluded paths such as the transcripts output directory, and
+the glob patterns listed in a `.sdignore` file at the root are pruned before descending.
+On network mounts, where every listing is a round trip, subtrees can be listed on a
+thread pool.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+import logging
+import os
+from pathlib import Path
+from typing import Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+SOUND_EXTENSIONS = {".mp3", ".wav", ".ogg", ".m4a", ".flac", ".webm"}
+IGNORE_FILE_NAME = ".sdignore"
+# Never contain recordings, but can be huge
+IGNORED_DIRECTORY_NAMES = frozenset({"node_modules", "__pycache__"})
+
+DirectoryListing = tuple[list[str], list[tuple[str, os.stat_result]]]
+
+
+def is_audio_file_name(name: str) -> bool:
+    """Return True for audio file names, skipping hidden files such as `._` resource forks."""
+    stem, suffix = os.path.splitext(name)
+    return suffix.lower() in SOUND_EXTENSIONS and not stem.startswith(".")
+
+
+def join(directory: str, name: str) -> str:
+    """Join like `Path` does, so `.` as the root gives the paths stored in the database."""
+    return name if directory == "." else os.path.join(directory, name)
+
+
+@dataclass(frozen=True)
+class IgnoreRules:
+    """
+    What to skip while walking `root`.
+
+    `.sdignore` holds one glob pattern per line; blank lines and `#` comments are skipped.
+    A pattern without `/` matches entry names at any depth, one with `/` matches the path
+    relative to the root, and a trailing `/` restricts it to directories.
+    """
+
+    root: str
+    patterns: tuple[str, ...] = ()
+    excluded_paths: frozenset[str] = frozenset()
+
+    @classmethod
+    def load(cls, root: Path, excluded_paths: Iterable[Path] = ()) -> "IgnoreRules":
+        patterns: list[str] = []
+        ignore_file = root / IGNORE_FILE_NAME
+        if ignore_file.is_file():
+            for line in ignore_file.read_text(encoding="utf-8").splitlines():
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    patterns.append(line)
+        return cls(
+            root=str(root),
+            patterns=tuple(patterns),
+            excluded_paths=frozenset(os.path.abspath(path) for path in excluded_paths),
+        )
+
+    def is_ignored(self, path: str, name: str, is_dir: bool) -> bool:
+        if is_dir and (
+            name.startswith(".")
+            or name in IGNORED_DIRECTORY_NAMES
+            or (self.excluded_paths and os.path.abspath(path) in self.excluded_paths)
+        ):
+            return True
+        if not self.patterns:
+            return False
+        relative = self._relative(path)
+        for pattern in self.patterns:
+            if pattern.endswith("/"):
+                if not is_dir:
+                    continue
+                pattern = pattern.rstrip("/")
+            if "/" in pattern:
+                if fnmatchcase(relative, pattern.lstrip("/")):
+                    return True
+            elif fnmatchcase(name, pattern):
+                return True
+        return False
+
+    def _relative(self, path: str) -> str:
+        """Relative POSIX path of `path`, which was built from `root` with `join`."""
+        relative = path if self.root == "." else path[len(self.root) + 1 :]
+        return relative.replace(os.sep, "/")
+
+
+def list_directory(path: str, rules: IgnoreRules) -> DirectoryListing:
+    """Return the subdirectories to descend into and the audio files with their stat."""
+    subdirectories = []
+    files = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                entry_path = join(path, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    if not rules.is_ignored(entry_path, entry.name, is_dir=True):
+                        subdirectories.append(entry_path)
+                elif (
+                    is_audio_file_name(entry.name)
+                    and entry.is_file()
+                    and not rules.is_ignored(entry_path, entry.name, is_dir=False)
+                ):
+                    files.append((entry_path, entry.stat()))
+    except OSError as e:
+        logger.warning(f"Cannot list {path}: {e}")
+    return subdirectories, files
+
+
+def walk_audio_files(
+    root: Path, rules: IgnoreRules | None = None, threads: int = 1
+) -> Iterator[tuple[str, os.stat_result]]:
+    """
+    Yield `(path, stat)` for every audio file under `root`, in no particular order.
+
+    With `threads > 1`, each directory is listed as a separate task, so slow listings of
+    sibling subtrees overlap.
+    """
+    if rules is None:
+        rules = IgnoreRules.load(root)
+    if threads <= 1:
+        stack = [str(root)]
+        while stack:
+            subdirectories, files = list_directory(stack.pop(), rules)
+            yield from files
+            stack.extend(subdirectories)
+        return
+
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="scan") as executor:
+        pending: set[Future[DirectoryListing]] = {
+            executor.submit(list_directory, str(root), rules)
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                subdirectories, files = future.result()
+                pending.update(
+                    executor.submit(list_directory, subdirectory, rules)
+                    for subdirectory in subdirectories
+                )
+                yield from files
@@ -0,0 +1,201 @@
+"""
+Watch a directory tree for audio files that have been completely written.
+
+Recorders and sync clients write a file in many small steps and often create it under a
+temporary name first. Events are therefore coalesced per path: a file is reported once no
+event arrived for it during `quiet_seconds` and its size and mtime are unchanged across
+two checks that far apart. Files that disappear in the meantime are dropped.
+"""
+
+from dataclasses import dataclass, field
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Callable, Iterator, Self
+
+from speechdown.infrastructure.file_walker import (
+    IgnoreRules,
+    is_audio_file_name,
+    join,
+    list_directory,
+)
+from speechdown.infrastructure.inotify import (
+    IN_CREATE,
+    IN_DELETE_SELF,
+    IN_IGNORED,
+    IN_ISDIR,
+    IN_MOVE_SELF,
+    IN_MOVED_TO,
+    IN_Q_OVERFLOW,
+    Inotify,
+    InotifyEvent,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUIET_SECONDS = 2.0
+
+
+@dataclass
+class _PendingFile:
+    last_event: float
+    # (size, mtime_ns) at the last check; None until the first quiet period has passed
+    snapshot: tuple[int, int] | None = None
+
+
+@dataclass
+class PendingFiles:
+    """Coalesce events per path and tell which files are complete."""
+
+    quiet_seconds: float = DEFAULT_QUIET_SECONDS
+    clock: Callable[[], float] = time.monotonic
+    stat: Callable[[str], os.stat_result] = os.stat
+    _files: dict[str, _PendingFile] = field(default_factory=dict)
+
+    def touch(self, path: str) -> None:
+        """Record activity on `path`; it has to be quiet again before it is checked."""
+        pending = self._files.get(path)
+        if pending is None:
+            self._files[path] = _PendingFile(self.clock())
+        else:
+            pending.last_event = self.clock()
+
+    def next_timeout(self) -> float | None:
+        """Seconds until the next file is due for a check, None if nothing is pending."""
+        if not self._files:
+            return None
+        due = min(pending.last_event for pending in self._files.values()) + self.quiet_seconds
+        return max(due - self.clock(), 0.0)
+
+    def pop_completed(self) -> list[str]:
+        """Check the files that have been quiet long enough; return those that are complete."""
+        now = self.clock()
+        completed = []
+        for path, pending in list(self._files.items()):
+            if now - pending.last_event < self.quiet_seconds:
+                continue
+            try:
+                stat = self.stat(path)
+            except OSError:
+                del self._files[path]
+                continue
+            snapshot = (stat.st_size, stat.st_mtime_ns)
+            if snapshot == pending.snapshot:
+                del self._files[path]
+                completed.append(path)
+            else:
+                # Still changing, or checked for the first time: wait one more quiet period
+                pending.snapshot = snapshot
+                pending.last_event = now
+        return sorted(completed)
+
+
+class DirectoryWatcher:
+    """
+    Report completely written audio files under `root`, using inotify.
+
+    New subdirectories are watched as they appear, so folders moved in with recordings
+    are picked up too. If the kernel event queue overflows, the tree is walked again and
+    every audio file changed since the last report is checked.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        rules: IgnoreRules | None = None,
+        quiet_seconds: float = DEFAULT_QUIET_SECONDS,
+    ):
+        self.root = root
+        self.rules = rules if rules is not None else IgnoreRules.load(root)
+        self.pending = PendingFiles(quiet_seconds)
+        self._inotify: Inotify | None = None
+        self._directories: dict[int, str] = {}
+        self._last_report_ns = time.time_ns()
+
+    def start(self) -> None:
+        self._inotify = Inotify()
+        self._watch_tree(str(self.root), since_ns=None)
+        logger.info(f"Watching {len(self._directories)} directories under {self.root}")
+
+    def close(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        self._directories.clear()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def poll(self, timeout: float | None = None) -> list[Path]:
+        """
+        Wait for events up to `timeout` seconds, or less if a pending file is due.
+
+        Returns the files that became complete, possibly none.
+        """
+        assert self._inotify is not None, "call start() first"
+        next_check = self.pending.next_timeout()
+        if next_check is not None and (timeout is None or next_check < timeout):
+            timeout = next_check
+        for event in self._inotify.read_events(timeout):
+            self._handle(event)
+        completed = self.pending.pop_completed()
+        if completed:
+            self._last_report_ns = time.time_ns()
+        return [Path(path) for path in completed]
+
+    def iter_completed(self) -> Iterator[list[Path]]:
+        """Yield each non-empty batch of complete files, forever."""
+        while True:
+            completed = self.poll()
+            if completed:
+                yield completed
+
+    def _handle(self, event: InotifyEvent) -> None:
+        if event.mask & IN_Q_OVERFLOW:
+            logger.warning("Too many file system events; scanning the watched tree again")
+            self._watch_tree(str(self.root), since_ns=self._last_report_ns)
+            return
+        directory = self._directories.get(event.wd)
+        if directory is None:
+            return
+        if event.mask & (IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF):
+            if event.mask & IN_IGNORED:
+                del self._directories[event.wd]
+            return
+
+        path = join(directory, event.name)
+        if event.mask & IN_ISDIR:
+            if event.mask & (IN_CREATE | IN_MOVED_TO) and not self.rules.is_ignored(
+                path, event.name, is_dir=True
+            ):
+                # Files may have landed in it before the watch was added
+                self._watch_tree(path, since_ns=0)
+            return
+        if is_audio_file_name(event.name) and not self.rules.is_ignored(
+            path, event.name, is_dir=False
+        ):
+            self.pending.touch(path)
+
+    def _watch_tree(self, root: str, since_ns: int | None) -> None:
+        """Watch `root` and its subdirectories; check audio files modified since `since_ns`."""
+        assert self._inotify is not None
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                wd = self._inotify.add_watch(directory)
+            except OSError as e:
+                logger.warning(f"Cannot watch {directory}: {e}")
+                continue
+            self._directories[wd] = directory
+            subdirectories, files = list_directory(directory, self.rules)
+            stack.extend(subdirectories)
+            if since_ns is not None:
+                for path, stat in files:
+                    if stat.st_mtime_ns >= since_ns:
+                        self.pending.touch(path)
@@ -0,0 +1,123 @@
+"""
+Minimal Linux inotify binding through ctypes.
+
+Only what `sd watch` needs: watch directories, and read the events with a timeout. The
+standard library has no inotify module, and this keeps the watcher free of extra
+dependencies.
+"""
+
+import ctypes
+import ctypes.util
+from dataclasses import dataclass
+import errno
+import os
+import select
+import struct
+import sys
+from typing import Iterator, Self
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+# Everything that can make a file appear, grow or finish in a watched directory
+DIRECTORY_EVENTS = (
+    IN_MODIFY
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+_READ_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class InotifyEvent:
+    wd: int
+    mask: int
+    cookie: int
+    name: str
+
+
+def is_supported() -> bool:
+    """Return True on Linux with a C library that provides inotify."""
+    return sys.platform.startswith("linux") and _load_libc() is not None
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, "inotify_init1") else None
+
+
+class Inotify:
+    """An inotify instance; close it, or use it as a context manager."""
+
+    def __init__(self) -> None:
+        libc = _load_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+        self._libc = libc
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            self._raise_errno("inotify_init1")
+
+    def add_watch(self, path: str, mask: int = DIRECTORY_EVENTS) -> int:
+        """Watch `path`; returns the watch descriptor reported in its events."""
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), ctypes.c_uint32(mask))
+        if wd < 0:
+            self._raise_errno(f"inotify_add_watch {path}")
+        return wd
+
+    def read_events(self, timeout: float | None = None) -> list[InotifyEvent]:
+        """Wait up to `timeout` seconds (forever if None) and return the pending events."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self.fd, _READ_SIZE)
+        except BlockingIOError:
+            return []
+        return list(_parse_events(data))
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _raise_errno(self, operation: str) -> None:
+        error = ctypes.get_errno()
+        raise OSError(error, f"{operation}: {os.strerror(error)}")
+
+
+def _parse_events(data: bytes) -> Iterator[InotifyEvent]:
+    offset = 0
+    while offset + _EVENT_HEADER.size <= len(data):
+        wd, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+        offset += _EVENT_HEADER.size
+        name = data[offset : offset + length].rstrip(b"\0")
+        offset += length
+        yield InotifyEvent(wd, mask, cookie, os.fsdecode(name))
@@ -16,3 +16,99 @@ CREATE TABLE IF NOT EXISTS transcriptions (
     transcription_started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 """
+
+# Serves the best-per-path lookups (ORDER BY confidence DESC) and path deletes without a
+# table scan, and the "latest transcriptions" listing by start time
+INDEXES = [
+    """
+    CREATE INDEX IF NOT EXISTS idx_transcriptions_path_confidence
+    ON transcriptions (path, confidence DESC)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_transcriptions_started_at
+    ON transcriptions (transcription_started_at)
+    """,
+]
+
+# Recorded timestamp and file fingerprint at save time, so reads never touch the audio files
+AUDIO_FILE_COLUMNS = [
+    "ALTER TABLE transcriptions ADD COLUMN audio_timestamp TIMESTAMP",
+    "ALTER TABLE transcriptions ADD COLUMN file_size INTEGER",
+    "ALTER TABLE transcriptions ADD COLUMN file_mtime REAL",
+]
+
+# Incremental scans: what a directory and its audio files looked like at the last scan
+SCAN_INDEX = [
+    """
+    CREATE TABLE scan_directories (
+        path TEXT PRIMARY KEY,
+        parent TEXT,
+        mtime_ns INTEGER
+    )
+    """,
+    "CREATE INDEX idx_scan_directories_parent ON scan_directories (parent)",
+    """
+    CREATE TABLE scan_files (
+        path TEXT PRIMARY KEY,
+        directory TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        inode INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX idx_scan_files_directory ON scan_files (directory)",
+    "CREATE INDEX idx_scan_files_mtime ON scan_files (mtime_ns)",
+]
+
+# Recording times read from audio file metadata, valid while size and mtime are unchanged;
+# a NULL timestamp records that the file has none
+METADATA_TIMESTAMPS = [
+    """
+    CREATE TABLE metadata_timestamps (
+        path TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        timestamp TIMESTAMP
+    )
+    """,
+]
+
+# Hash of the audio bytes, so copies and moved files find their transcriptions; a hash has
+# only a few rows, so model and language are filtered after the index lookup
+CONTENT_HASH_COLUMN = [
+    "ALTER TABLE transcriptions ADD COLUMN content_hash TEXT",
+    "CREATE INDEX idx_transcriptions_content_hash ON transcriptions (content_hash)",
+]
+
+# Spectral fingerprints of decoded audio, for recognizing re-encoded or trimmed copies; the
+# terms table maps fingerprint values from the start of each recording to their frame, so
+# a lookup is one indexed query for the values of the new recording
+FINGERPRINT_INDEX = [
+    """
+    CREATE TABLE audio_fingerprints (
+        id INTEGER PRIMARY KEY,
+        path TEXT NOT NULL UNIQUE,
+        duration REAL NOT NULL,
+        fingerprint BLOB NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE fingerprint_terms (
+        term INTEGER NOT NULL,
+        fingerprint_id INTEGER NOT NULL,
+        position INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX idx_fingerprint_terms_term ON fingerprint_terms (term)",
+    "CREATE INDEX idx_fingerprint_terms_fingerprint ON fingerprint_terms (fingerprint_id)",
+]
+
+# Parent directory of each path, so the language frequencies of a directory are one indexed
+# lookup; the index also orders each file's rows for picking its best transcription
+DIRECTORY_COLUMN = [
+    "ALTER TABLE transcriptions ADD COLUMN directory TEXT",
+    """
+    CREATE INDEX idx_transcriptions_directory
+    ON transcriptions (directory, path, confidence DESC)
+    """,
+]
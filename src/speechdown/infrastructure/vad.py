@@ -0,0 +1,141 @@
+"""Energy-based voice activity detection used to drop silence before inference.
+
+Phone recordings often carry long silent tails or pocket noise. Whisper spends decoder steps
+on them and sometimes hallucinates text there. `trim_silence` removes those regions and
+returns an offset map, so timestamps reported for the trimmed audio can be mapped back to
+the original file. `split_on_silence` cuts long recordings into chunks at the quietest
+moment near each chunk boundary, so no word is cut in half.
+"""
+
+try:  # pragma: no cover - installed together with openai-whisper
+    import numpy as np  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    np = None  # type: ignore
+from bisect import bisect_right
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+FRAME_SECONDS = 0.03
+# A frame is speech if it is within this many dB of the loud end of the recording...
+DYNAMIC_RANGE_DB = 35.0
+# ...and louder than this absolute floor (dBFS), so near-silent files are not amplified
+ABSOLUTE_FLOOR_DB = -55.0
+# Speech is kept with this much context on each side, so word edges are not clipped
+PADDING_SECONDS = 0.3
+# Silences shorter than this are kept; pauses between words must not be cut out
+MIN_SILENCE_SECONDS = 1.0
+# A chunk boundary may move by up to this fraction of the chunk length to find a pause
+SPLIT_SEARCH_FRACTION = 0.1
+
+
+@dataclass(frozen=True)
+class TrimmedAudio:
+    """
+    Audio with non-speech regions removed.
+
+    `offsets` holds one `(trimmed_start, original_start)` pair in seconds per kept region,
+    sorted by `trimmed_start`.
+    """
+
+    audio: Any
+    trimmed_seconds: float = 0.0
+    offsets: list[tuple[float, float]] = field(default_factory=lambda: [(0.0, 0.0)])
+
+    def to_original_time(self, seconds: float) -> float:
+        """Map a timestamp in the trimmed audio to the same moment in the original audio."""
+        index = max(bisect_right([start for start, _ in self.offsets], seconds) - 1, 0)
+        trimmed_start, original_start = self.offsets[index]
+        return original_start + (seconds - trimmed_start)
+
+
+def trim_silence(audio: Any, sample_rate: int = SAMPLE_RATE) -> TrimmedAudio:
+    """
+    Remove leading, trailing and long inner silences from mono float samples.
+
+    Frame energy is compared with the loud end (95th percentile) of the recording rather
+    than a fixed level, so quiet but clean recordings keep their speech. If no frame looks
+    like speech, the audio is returned unchanged and Whisper's own no-speech detection
+    decides.
+    """
+    frame_length = int(sample_rate * FRAME_SECONDS)
+    frame_count = len(audio) // frame_length
+    if np is None or frame_count == 0:
+        return TrimmedAudio(audio)
+
+    frames = np.asarray(audio[: frame_count * frame_length], dtype=np.float32).reshape(
+        frame_count, frame_length
+    )
+    energy_db = 10 * np.log10(np.mean(frames**2, axis=1) + 1e-10)
+    threshold_db = max(np.percentile(energy_db, 95) - DYNAMIC_RANGE_DB, ABSOLUTE_FLOOR_DB)
+    is_speech = energy_db > threshold_db
+    if not is_speech.any():
+        return TrimmedAudio(audio)
+
+    regions = _speech_regions(is_speech, frame_length, sample_rate, len(audio))
+    kept = sum(end - start for start, end in regions)
+    if kept == len(audio):
+        return TrimmedAudio(audio)
+
+    offsets = []
+    trimmed_position = 0
+    for start, end in regions:
+        offsets.append((trimmed_position / sample_rate, start / sample_rate))
+        trimmed_position += end - start
+    trimmed = np.concatenate([audio[start:end] for start, end in regions])
+    trimmed_seconds = (len(audio) - kept) / sample_rate
+    logger.debug(f"Trimmed {trimmed_seconds:.1f}s of silence in {len(regions)} region(s)")
+    return TrimmedAudio(trimmed, trimmed_seconds=trimmed_seconds, offsets=offsets)
+
+
+def _speech_regions(
+    is_speech: Any, frame_length: int, sample_rate: int, sample_count: int
+) -> list[tuple[int, int]]:
+    """Turn per-frame speech flags into padded, merged `(start, end)` sample ranges."""
+    padding = int(PADDING_SECONDS * sample_rate)
+    min_silence = int(MIN_SILENCE_SECONDS * sample_rate)
+
+    regions: list[tuple[int, int]] = []
+    for frame in np.flatnonzero(is_speech):
+        start = max(int(frame) * frame_length - padding, 0)
+        end = min((int(frame) + 1) * frame_length + padding, sample_count)
+        if regions and start - regions[-1][1] < min_silence:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+    return regions
+
+
+def split_on_silence(
+    audio: Any, chunk_seconds: float, sample_rate: int = SAMPLE_RATE
+) -> list[Any]:
+    """
+    Cut samples into consecutive chunks of roughly `chunk_seconds` each.
+
+    Every cut is placed at the quietest frame within `SPLIT_SEARCH_FRACTION` of the chunk
+    length around the nominal boundary. The chunks cover the audio without gaps or overlap,
+    so chunk offsets are the cumulative chunk lengths.
+    """
+    chunk_length = int(chunk_seconds * sample_rate)
+    if np is None or chunk_length <= 0:
+        return [audio]
+
+    frame_length = int(sample_rate * FRAME_SECONDS)
+    search = max(int(chunk_length * SPLIT_SEARCH_FRACTION), frame_length)
+    chunks = []
+    start = 0
+    # Leave the tail in the last chunk rather than cutting off a sliver
+    while len(audio) - start > chunk_length + search:
+        window_start = start + chunk_length - search
+        window = np.asarray(audio[window_start : start + chunk_length + search], dtype=np.float32)
+        frame_count = len(window) // frame_length
+        frames = window[: frame_count * frame_length].reshape(frame_count, frame_length)
+        quietest = int(np.argmin(np.mean(frames**2, axis=1)))
+        cut = window_start + quietest * frame_length + frame_length // 2
+        chunks.append(audio[start:cut])
+        start = cut
+    chunks.append(audio[start:])
+    return chunks
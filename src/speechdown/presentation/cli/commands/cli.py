@@ -9,11 +9,17 @@ from speechdown.presentation.cli.commands.common import (
     add_common_arguments,
     add_debug_argument,
     add_transcribe_arguments,
+    add_watch_arguments,
     configure_logging,
+    non_negative_int,
+    positive_int,
+    read_paths,
 )
 from speechdown.presentation.cli.commands.init import init
 from speechdown.presentation.cli.commands.transcribe import transcribe
 from speechdown.presentation.cli.commands.config import config
+from speechdown.presentation.cli.commands.serve import serve
+from speechdown.presentation.cli.commands.watch import watch
 
 __all__ = ["cli"]
 
@@ -38,6 +44,16 @@ def cli() -> int:
     parser_transcribe = subparsers.add_parser("transcribe", help="Transcribe audio files")
     add_transcribe_arguments(parser_transcribe)
 
+    parser_serve = subparsers.add_parser(
+        "serve", help="Run a daemon that keeps the model loaded for `sd transcribe`"
+    )
+    add_common_arguments(parser_serve)
+
+    parser_watch = subparsers.add_parser(
+        "watch", help="Transcribe new recordings as they are written (Linux)"
+    )
+    add_watch_arguments(parser_watch)
+
     parser_config.add_argument(
         "--output-dir", type=str, help="Set the output directory for transcription files"
     )
@@ -58,6 +74,75 @@ def cli() -> int:
         help="Set the default model name for transcription (e.g., 'tiny', 'base', 'small', 'medium', 'large', 'turbo')",
     )
 
+    parser_config.add_argument(
+        "--language-detection",
+        choices=["on", "off"],
+        help="Detect the language first and transcribe only the likely languages "
+        "(default: off)",
+    )
+    parser_config.add_argument(
+        "--language-detection-margin",
+        type=float,
+        help="Also transcribe languages whose detection probability is within this margin "
+        "of the top language (e.g., 0.2)",
+    )
+    parser_config.add_argument(
+        "--early-exit",
+        choices=["on", "off"],
+        help="Stop trying further languages once a transcription is confident enough; "
+        "languages are tried in order of how often they won in the same directory",
+    )
+    parser_config.add_argument(
+        "--early-exit-confidence",
+        type=float,
+        help="Confidence at which no further languages are tried (default: -0.4)",
+    )
+    parser_config.add_argument(
+        "--near-duplicates",
+        choices=["on", "off"],
+        help="Reuse the transcription of a recording that sounds the same, such as an m4a "
+        "and a wav export of one note, instead of transcribing it again (requires numpy)",
+    )
+    parser_config.add_argument(
+        "--near-duplicate-similarity",
+        type=float,
+        help="Share of audio fingerprint bits that must agree for a near-duplicate "
+        "(default: 0.75)",
+    )
+    parser_config.add_argument(
+        "--model-cascade",
+        type=str,
+        help="Comma-separated models from cheapest to largest (e.g., 'tiny,small,medium'); "
+        "a file is re-run with the next model only if its result is poor. '' disables it",
+    )
+    parser_config.add_argument(
+        "--cascade-min-confidence",
+        type=float,
+        help="Escalate to the next cascade model below this confidence (default: -1.0)",
+    )
+    parser_config.add_argument(
+        "--cascade-max-compression-ratio",
+        type=float,
+        help="Escalate to the next cascade model above this compression ratio (default: 2.4)",
+    )
+    parser_config.add_argument(
+        "--trim-silence",
+        choices=["on", "off"],
+        help="Drop silence and background noise before transcribing (default: off)",
+    )
+    parser_config.add_argument(
+        "--scan-threads",
+        type=positive_int,
+        help="List this many directories concurrently when collecting audio files; "
+        "useful on network mounts (default: 1)",
+    )
+    parser_config.add_argument(
+        "--audio-cache-mb",
+        type=non_negative_int,
+        help="Disk space for decoded audio kept in .speechdown/cache, so re-transcribing "
+        "skips decoding; least recently used files are evicted (default: 0, disabled)",
+    )
+
     args = parser.parse_args()
 
     # Configure logging based on the debug flag
@@ -68,11 +153,37 @@ def cli() -> int:
     elif args.command == "transcribe":
         if args.debug:
             logging.debug("Debug mode enabled")
+        paths = None
+        if args.paths or args.from_stdin:
+            if args.within_hours is not None or args.incremental:
+                parser_transcribe.error(
+                    "--within-hours and --incremental apply to directory scans, not to "
+                    "explicit paths"
+                )
+            paths = list(args.paths)
+            if args.from_stdin:
+                paths.extend(read_paths(sys.stdin))
         return transcribe(
             Path(args.directory),
             args.dry_run,
             args.ignore_existing,
             args.within_hours,
+            use_daemon=not args.no_daemon,
+            workers=args.workers,
+            prefetch=args.prefetch,
+            prefetch_max_mb=args.prefetch_max_mb,
+            batch_size=args.batch_size,
+            chunk_minutes=args.chunk_minutes,
+            incremental=args.incremental,
+            paths=paths,
+        )
+    elif args.command == "serve":
+        return serve(Path(args.directory))
+    elif args.command == "watch":
+        return watch(
+            Path(args.directory),
+            quiet_seconds=args.quiet_seconds,
+            catch_up_hours=args.catch_up_hours,
         )
     elif args.command == "config":
         return config(
@@ -82,6 +193,20 @@ def cli() -> int:
             add_language=args.add_language,
             remove_language=args.remove_language,
             model_name=args.model_name,
+            language_detection=(
+                None if args.language_detection is None else args.language_detection == "on"
+            ),
+            language_detection_margin=args.language_detection_margin,
+            trim_silence=None if args.trim_silence is None else args.trim_silence == "on",
+            scan_threads=args.scan_threads,
+            audio_cache_mb=args.audio_cache_mb,
+            model_cascade=args.model_cascade,
+            early_exit=None if args.early_exit is None else args.early_exit == "on",
+            early_exit_confidence=args.early_exit_confidence,
+            near_duplicates=None if args.near_duplicates is None else args.near_duplicates == "on",
+            near_duplicate_similarity=args.near_duplicate_similarity,
+            cascade_min_confidence=args.cascade_min_confidence,
+            cascade_max_compression_ratio=args.cascade_max_compression_ratio,
         )
     else:
         parser.print_help()
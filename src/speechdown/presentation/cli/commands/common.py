@@ -4,6 +4,7 @@ from dataclasses import dataclass
 import logging
 from pathlib import Path
 import argparse
+from typing import TextIO
 
 __all__ = [
     "configure_logging",
@@ -11,6 +12,12 @@ __all__ = [
     "add_debug_argument",
     "add_common_arguments",
     "add_transcribe_arguments",
+    "add_watch_arguments",
+    "read_paths",
+    "positive_int",
+    "positive_float",
+    "non_negative_int",
+    "non_negative_float",
 ]
 
 
@@ -29,6 +36,7 @@ class SpeechDownPaths:
     db: Path
     config: Path
     cache_dir: Path
+    socket: Path
 
     @classmethod
     def from_working_directory(cls, working_directory: Path):
@@ -39,6 +47,7 @@ class SpeechDownPaths:
             db=speechdown_directory / "speechdown.db",
             config=speechdown_directory / "config.json",
             cache_dir=speechdown_directory / "cache",
+            socket=speechdown_directory / "sd.sock",
         )
 
 
@@ -65,9 +74,72 @@ def add_common_arguments(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def positive_int(value: str) -> int:
+    """Argparse type for integers of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+
+def positive_float(value: str) -> float:
+    """Argparse type for numbers greater than 0."""
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got {value}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """Argparse type for integers of at least 0."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"expected a non-negative integer, got {value}")
+    return number
+
+
+def non_negative_float(value: str) -> float:
+    """Argparse type for numbers of at least 0."""
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"expected a non-negative number, got {value}")
+    return number
+
+
+def add_watch_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add watch-specific arguments to parser."""
+    add_common_arguments(parser)
+    parser.add_argument(
+        "--quiet-seconds",
+        type=positive_float,
+        default=2.0,
+        help="Treat a file as complete once it had no writes for this long and its size "
+        "stayed the same (default: 2)",
+    )
+    parser.add_argument(
+        "--catch-up-hours",
+        type=non_negative_float,
+        default=48.0,
+        help="On start, transcribe files modified within the last N hours that arrived "
+        "while not watching; 0 disables (default: 48)",
+    )
+
+
 def add_transcribe_arguments(parser: argparse.ArgumentParser) -> None:
     """Add transcribe-specific arguments to parser."""
     add_common_arguments(parser)
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help="Audio files to transcribe instead of scanning the directory",
+    )
+    parser.add_argument(
+        "--from-stdin",
+        action="store_true",
+        help="Read the audio files to transcribe from standard input, one per line or "
+        "NUL-separated (as from `find -print0`)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -83,3 +155,52 @@ def add_transcribe_arguments(parser: argparse.ArgumentParser) -> None:
         type=float,
         help="Only transcribe files modified within the last N hours",
     )
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=1,
+        help="Number of worker processes transcribing files in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--prefetch",
+        type=non_negative_int,
+        default=2,
+        help="Number of upcoming files to decode while the current one is transcribed "
+        "(0 disables, default: 2)",
+    )
+    parser.add_argument(
+        "--prefetch-max-mb",
+        type=positive_int,
+        default=512,
+        help="Stop decoding ahead once this many MB of audio are waiting (default: 512)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=1,
+        help="Transcribe up to N short clips (30 s or less) in one forward pass "
+        "(default: 1)",
+    )
+    parser.add_argument(
+        "--chunk-minutes",
+        type=positive_float,
+        help="Long-file mode: split recordings into chunks of about N minutes at pauses and "
+        "transcribe the chunks in parallel across --workers",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only collect audio files that are new or changed since the last incremental run",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Transcribe in this process even if an `sd serve` daemon is running",
+    )
+
+
+def read_paths(stream: TextIO) -> list[Path]:
+    """Read newline- or NUL-separated paths; NUL wins if present, so names may hold newlines."""
+    data = stream.read()
+    lines = data.split("\0") if "\0" in data else data.splitlines()
+    return [Path(line) for line in lines if line.strip()]
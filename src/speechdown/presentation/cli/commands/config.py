@@ -13,10 +13,22 @@ def config(
         *,
         directory: Path, 
         add_language: str | None = None,
+        audio_cache_mb: int | None = None,
+        cascade_max_compression_ratio: float | None = None,
+        cascade_min_confidence: float | None = None,
+        early_exit: bool | None = None,
+        early_exit_confidence: float | None = None,
         languages: str | None = None, 
+        language_detection: bool | None = None,
+        language_detection_margin: float | None = None,
+        model_cascade: str | None = None,
         model_name: str | None = None,
+        near_duplicates: bool | None = None,
+        near_duplicate_similarity: float | None = None,
         output_dir: str | None = None, 
         remove_language: str | None = None, 
+        scan_threads: int | None = None,
+        trim_silence: bool | None = None,
 ) -> int:
     """
     Configure the speechdown project settings.
@@ -24,10 +36,27 @@ def config(
     Args:
         directory: The directory containing the speechdown project
         add_language: Language code to add to the configuration
+        audio_cache_mb: Disk space for decoded audio kept between runs (0 disables the cache)
+        cascade_max_compression_ratio: Escalate to the next cascade model above this
+            compression ratio
+        cascade_min_confidence: Escalate to the next cascade model below this confidence
+        early_exit: Whether to stop trying languages once one is confident enough
+        early_exit_confidence: Confidence at which no further languages are tried
         languages: Comma-separated list of language codes to set (replaces existing languages)
+        language_detection: Whether to detect the language before transcribing
+        language_detection_margin: Probability margin below the top detected language
+            within which other languages are still transcribed
+        model_cascade: Comma-separated models to try from cheapest to largest
+            (an empty string disables the cascade)
         model_name: The name of the Whisper model to use for transcription
+        near_duplicates: Whether recordings that sound the same as a transcribed one, such
+            as re-encoded or trimmed exports, reuse its transcription
+        near_duplicate_similarity: Share of fingerprint bits, between 0 and 1, that must
+            agree for a recording to count as a near-duplicate
         output_dir: The directory to store transcription output files
         remove_language: Language code to remove from the configuration
+        scan_threads: Number of directories listed concurrently while collecting audio files
+        trim_silence: Whether to drop non-speech regions before transcribing
 
     Returns:
         Exit code (0 for success)
@@ -45,6 +74,55 @@ def config(
         if model_name is not None:
             config_adapter.set_model_name(model_name)
             print(f"Model name set to: {model_name}")
+
+        if language_detection is not None:
+            config_adapter.set_language_detection(language_detection)
+            print(f"Language detection set to: {'on' if language_detection else 'off'}")
+
+        if language_detection_margin is not None:
+            config_adapter.set_language_detection_margin(language_detection_margin)
+            print(f"Language detection margin set to: {language_detection_margin}")
+
+        if early_exit is not None:
+            config_adapter.set_early_exit(early_exit)
+            print(f"Early exit set to: {'on' if early_exit else 'off'}")
+
+        if early_exit_confidence is not None:
+            config_adapter.set_early_exit_confidence(early_exit_confidence)
+            print(f"Early exit confidence set to: {early_exit_confidence}")
+
+        if near_duplicates is not None:
+            config_adapter.set_near_duplicates(near_duplicates)
+            print(f"Near-duplicate detection set to: {'on' if near_duplicates else 'off'}")
+
+        if near_duplicate_similarity is not None:
+            config_adapter.set_near_duplicate_similarity(near_duplicate_similarity)
+            print(f"Near-duplicate similarity set to: {near_duplicate_similarity}")
+
+        if model_cascade is not None:
+            cascade = [name.strip() for name in model_cascade.split(",") if name.strip()]
+            config_adapter.set_model_cascade(cascade)
+            print(f"Model cascade set to: {' -> '.join(cascade) if cascade else 'off'}")
+
+        if cascade_min_confidence is not None:
+            config_adapter.set_cascade_min_confidence(cascade_min_confidence)
+            print(f"Cascade minimum confidence set to: {cascade_min_confidence}")
+
+        if cascade_max_compression_ratio is not None:
+            config_adapter.set_cascade_max_compression_ratio(cascade_max_compression_ratio)
+            print(f"Cascade maximum compression ratio set to: {cascade_max_compression_ratio}")
+
+        if trim_silence is not None:
+            config_adapter.set_trim_silence(trim_silence)
+            print(f"Silence trimming set to: {'on' if trim_silence else 'off'}")
+
+        if audio_cache_mb is not None:
+            config_adapter.set_audio_cache_mb(audio_cache_mb)
+            print(f"Audio cache set to: {audio_cache_mb} MB")
+
+        if scan_threads is not None:
+            config_adapter.set_scan_threads(scan_threads)
+            print(f"Scan threads set to: {scan_threads}")
         
         # Handle language configuration
         if languages is not None:
@@ -100,6 +178,29 @@ def config(
         print(f"  Output directory: {output_dir_value if output_dir_value else 'Not set'}")
         model_name_value = config_adapter.get_model_name()
         print(f"  Model name: {model_name_value if model_name_value else 'Not set'}")
+        print(
+            f"  Language detection: {'on' if config_adapter.get_language_detection() else 'off'}"
+            f" (margin {config_adapter.get_language_detection_margin()})"
+        )
+        print(f"  Silence trimming: {'on' if config_adapter.get_trim_silence() else 'off'}")
+        print(f"  Scan threads: {config_adapter.get_scan_threads()}")
+        audio_cache_mb = config_adapter.get_audio_cache_mb()
+        print(f"  Audio cache: {f'{audio_cache_mb} MB' if audio_cache_mb else 'off'}")
+        print(
+            f"  Early exit: {'on' if config_adapter.get_early_exit() else 'off'}"
+            f" (confidence {config_adapter.get_early_exit_confidence()})"
+        )
+        print(
+            f"  Near-duplicate detection: {'on' if config_adapter.get_near_duplicates() else 'off'}"
+            f" (similarity {config_adapter.get_near_duplicate_similarity()})"
+        )
+        cascade = config_adapter.get_model_cascade()
+        if cascade:
+            print(
+                f"  Model cascade: {' -> '.join(cascade)} (escalate below confidence "
+                f"{config_adapter.get_cascade_min_confidence()} or above compression ratio "
+                f"{config_adapter.get_cascade_max_compression_ratio()})"
+            )
         
         return 0
     except Exception as e:
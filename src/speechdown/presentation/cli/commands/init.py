@@ -2,8 +2,7 @@
 from pathlib import Path
 import logging
 
-from speechdown.infrastructure.database import initialize_database
-from speechdown.infrastructure.schema import SCHEMA
+from speechdown.infrastructure.database import SCHEMA_VERSION, initialize_database
 from speechdown.infrastructure.adapters.config_adapter import ConfigAdapter
 from speechdown.presentation.cli.commands.common import SpeechDownPaths
 
@@ -26,15 +25,19 @@ def init(directory: Path) -> int:
         if not speechdown_paths.speechdown_directory.exists():
             speechdown_paths.speechdown_directory.mkdir(parents=True)
 
-        # Cache directory is no longer needed but kept for backward compatibility
+        # Holds the decoded audio cache, when enabled with `sd config --audio-cache-mb`
         if not speechdown_paths.cache_dir.exists():
             speechdown_paths.cache_dir.mkdir(parents=True)
 
         if not speechdown_paths.db.exists():
-            initialize_database(speechdown_paths.db, SCHEMA)
+            initialize_database(speechdown_paths.db)
             print(f"Initialized SpeechDown project in {directory}")
         else:
-            print("Database already exists. Initialization skipped.")
+            previous_version = initialize_database(speechdown_paths.db)
+            if previous_version < SCHEMA_VERSION:
+                print(f"Upgraded database schema to version {SCHEMA_VERSION}")
+            else:
+                print("Database already exists. Initialization skipped.")
 
         config_adapter = ConfigAdapter.load_config_from_path(speechdown_paths.config, create=True)
         config_adapter.set_default_languages_if_not_set()
@@ -0,0 +1,98 @@
+"""Serve command handler for speechdown CLI."""
+
+from pathlib import Path
+import logging
+import os
+from typing import Any, Dict
+
+from speechdown.infrastructure.daemon import DaemonServer
+from speechdown.presentation.cli.commands.common import SpeechDownPaths
+from speechdown.presentation.cli.commands.transcribe import (
+    create_transcription_service,
+    run_transcription,
+    run_transcription_for_paths,
+)
+
+__all__ = ["serve"]
+
+
+def serve(directory: Path) -> int:
+    """
+    Run a long-lived daemon that keeps the Whisper model, database and config in memory.
+
+    `sd transcribe` for the same project forwards its work to the daemon over a Unix socket
+    in `.speechdown/`, so each request costs inference time only. Configuration changes made
+    with `sd config` take effect after the daemon is restarted.
+
+    Args:
+        directory: The directory containing the speechdown project
+
+    Returns:
+        Exit code (0 for success)
+    """
+    try:
+        # Every path of the service is absolute, since requests run in the client's cwd
+        speechdown_paths = SpeechDownPaths.from_working_directory(Path(directory).resolve())
+        project_directory = speechdown_paths.speechdown_directory
+        transcription_service, whisper_model = create_transcription_service(speechdown_paths)
+
+        def handle(request: Dict[str, Any]) -> Dict[str, Any]:
+            command = request.get("command")
+            if command == "ping":
+                return {"status": "ok"}
+            if command != "transcribe":
+                return {"status": "error", "message": f"Unknown command: {command}"}
+
+            # Relative paths of the request, stored paths and the output directory are
+            # relative to the client's cwd, so the request runs there
+            daemon_cwd = os.getcwd()
+            os.chdir(request["cwd"])
+            try:
+                return transcribe_request(request)
+            finally:
+                os.chdir(daemon_cwd)
+
+        def transcribe_request(request: Dict[str, Any]) -> Dict[str, Any]:
+            request_directory = Path(request["directory"])
+            request_project = SpeechDownPaths.from_working_directory(request_directory)
+            if request_project.speechdown_directory.resolve() != project_directory:
+                return {
+                    "status": "error",
+                    "message": f"Daemon serves {project_directory.parent}, not {request_directory}",
+                }
+
+            if request.get("paths") is not None:
+                logging.info(f"Transcribing {len(request['paths'])} file(s) for a client")
+                processed = run_transcription_for_paths(
+                    transcription_service,
+                    [Path(path) for path in request["paths"]],
+                    ignore_existing=bool(request.get("ignore_existing")),
+                )
+            else:
+                logging.info(f"Transcribing {request_directory} for a client")
+                processed = run_transcription(
+                    transcription_service,
+                    request_directory,
+                    ignore_existing=bool(request.get("ignore_existing")),
+                    within_hours=request.get("within_hours"),
+                    incremental=bool(request.get("incremental")),
+                )
+            return {
+                "status": "ok",
+                "processed": processed,
+                "model_loads": whisper_model.load_count,
+            }
+
+        server = DaemonServer(speechdown_paths.socket, handle)
+        server.start()
+        print(f"Serving SpeechDown project {directory} on {speechdown_paths.socket}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+        return 0
+    except Exception as e:
+        logging.error(f"Error running daemon: {e}")
+        return 1
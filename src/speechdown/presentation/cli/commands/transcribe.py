@@ -1,87 +1,363 @@
 """Transcribe command handler for speechdown CLI."""
 
+from functools import partial
 from pathlib import Path
 import logging
+import os
 
 from speechdown.infrastructure.adapters.audio_file_adapter import AudioFileAdapter
-from speechdown.infrastructure.adapters.config_adapter import ConfigAdapter
+from speechdown.infrastructure.adapters.config_adapter import DEFAULT_OUTPUT_DIR, ConfigAdapter
+from speechdown.infrastructure.adapters.content_hash_adapter import Blake2ContentHashAdapter
+from speechdown.infrastructure.adapters.fingerprint_index_adapter import (
+    SQLiteFingerprintIndexAdapter,
+)
+from speechdown.infrastructure.adapters.file_index_adapter import SQLiteFileIndexAdapter
 from speechdown.infrastructure.adapters.file_output_adapter import FileOutputAdapter
 from speechdown.infrastructure.adapters.whisper_transcriber_adapter import WhisperTranscriberAdapter
 from speechdown.infrastructure.adapters.whisper_model_adapter import WhisperModelAdapter
 from speechdown.infrastructure.adapters.file_timestamp_adapter import FileTimestampAdapter
+from speechdown.infrastructure.adapters.npy_audio_cache_adapter import NpyAudioCacheAdapter
+from speechdown.infrastructure.adapters.metadata_timestamp_adapter import (
+    SQLiteMetadataTimestampAdapter,
+)
 from speechdown.infrastructure.adapters.repository_adapter import SQLiteRepositoryAdapter
+from speechdown.infrastructure.daemon import DaemonClient
+from speechdown.infrastructure.file_walker import is_audio_file_name
+from speechdown.infrastructure.database import Database
 from speechdown.application.services.transcription_service import TranscriptionService
+from speechdown.application.services.transcription_options import (
+    DEFAULT_PREFETCH_MAX_BYTES,
+    TranscriptionOptions,
+)
 from speechdown.presentation.cli.commands.common import SpeechDownPaths
 
 
 from datetime import datetime, timedelta
 
+__all__ = [
+    "transcribe",
+    "create_transcription_service",
+    "run_transcription",
+    "run_transcription_for_paths",
+]
+
+
+def create_transcription_service(
+    speechdown_paths: SpeechDownPaths,
+    workers: int = 1,
+    prefetch: int = 2,
+    prefetch_max_mb: int = DEFAULT_PREFETCH_MAX_BYTES // (1024 * 1024),
+    batch_size: int = 1,
+    chunk_minutes: float | None = None,
+) -> tuple[TranscriptionService, WhisperModelAdapter]:
+    """
+    Wire up the adapters for a SpeechDown project.
+
+    Args:
+        speechdown_paths: Paths of the SpeechDown project
+        workers: Number of transcription worker processes; CPU threads are split between them
+        prefetch: Number of upcoming files decoded in the background
+        prefetch_max_mb: Memory budget for audio decoded ahead of transcription
+        batch_size: Number of short clips decoded together in one forward pass
+        chunk_minutes: If set, split long recordings into chunks of about this length
+
+    Returns:
+        The transcription service and the Whisper model adapter it uses
+    """
+    # One connection to the project DB, shared by the SQLite adapters and their transactions
+    database = Database(speechdown_paths.db)
+    # Create timestamp adapter; recording times from metadata are cached in the project DB
+    timestamp_adapter = FileTimestampAdapter(metadata_port=SQLiteMetadataTimestampAdapter(database))
+
+    config_adapter = ConfigAdapter.load_config_from_path(speechdown_paths.config)
+    config_adapter.set_default_output_dir_if_not_set()
+    # Transcripts never contain recordings, so the output directory is not scanned
+    excluded_directories = [config_adapter.get_output_dir() or Path(DEFAULT_OUTPUT_DIR)]
+    audio_file_adapter = AudioFileAdapter(
+        timestamp_port=timestamp_adapter,
+        excluded_directories=excluded_directories,
+        scan_threads=config_adapter.get_scan_threads(),
+    )
+    config_adapter.set_default_model_name_if_not_set()
+    output_adapter = FileOutputAdapter(config_adapter)
+    repository_adapter = SQLiteRepositoryAdapter(database, timestamp_port=timestamp_adapter)
+
+    # Create model and transcriber
+    # With a model cascade its first (cheapest) model replaces model_name, and the larger
+    # ones are only used for files whose result falls outside the quality bounds.
+    cascade = config_adapter.get_model_cascade()
+    model_name = cascade[0] if cascade else config_adapter.get_model_name()
+    if chunk_minutes is not None and len(cascade) > 1:
+        logging.warning(
+            f"The model cascade is not used in long-file mode (--chunk-minutes); "
+            f"transcribing with {model_name} only"
+        )
+    # model_name is guaranteed to be set by set_default_model_name_if_not_set.
+    # The model itself is loaded lazily on the first file that needs transcription.
+    whisper_model = WhisperModelAdapter(model_name=model_name)
+    trim_silence = config_adapter.get_trim_silence()
+    audio_cache_mb = config_adapter.get_audio_cache_mb()
+    audio_cache = (
+        NpyAudioCacheAdapter(speechdown_paths.cache_dir / "audio", audio_cache_mb * 1024 * 1024)
+        if audio_cache_mb > 0
+        else None
+    )
+    transcriber_adapter = WhisperTranscriberAdapter(
+        whisper_model, trim_silence=trim_silence, audio_cache=audio_cache
+    )
+    num_threads = max(1, (os.cpu_count() or 1) // workers)
+    # Copies of a file reuse stored results only if they came from a model in use now
+    model_names = [whisper_model.name] + [
+        WhisperModelAdapter(model_name=escalation_model_name).name
+        for escalation_model_name in cascade[1:]
+    ]
+
+    transcription_service = TranscriptionService(
+        audio_file_port=audio_file_adapter,
+        config_port=config_adapter,
+        output_port=output_adapter,
+        repository_port=repository_adapter,
+        transcriber_port=transcriber_adapter,
+        timestamp_port=timestamp_adapter,
+        file_index_port=SQLiteFileIndexAdapter(
+            database,
+            timestamp_port=timestamp_adapter,
+            excluded_directories=excluded_directories,
+        ),
+        content_hash_port=Blake2ContentHashAdapter(),
+        fingerprint_port=SQLiteFingerprintIndexAdapter(database),
+        options=TranscriptionOptions(
+            detect_language=config_adapter.get_language_detection(),
+            language_detection_margin=config_adapter.get_language_detection_margin(),
+            workers=workers,
+            prefetch=prefetch,
+            prefetch_max_bytes=prefetch_max_mb * 1024 * 1024,
+            batch_size=batch_size,
+            chunk_seconds=chunk_minutes * 60 if chunk_minutes is not None else None,
+            cascade_min_confidence=config_adapter.get_cascade_min_confidence(),
+            cascade_max_compression_ratio=config_adapter.get_cascade_max_compression_ratio(),
+            early_exit_confidence=(
+                config_adapter.get_early_exit_confidence()
+                if config_adapter.get_early_exit()
+                else None
+            ),
+            model_names=tuple(model_names),
+            near_duplicate_similarity=(
+                config_adapter.get_near_duplicate_similarity()
+                if config_adapter.get_near_duplicates()
+                else None
+            ),
+        ),
+        transcriber_factory=partial(
+            WhisperTranscriberAdapter.from_model_name,
+            model_name,
+            num_threads=num_threads,
+            trim_silence=trim_silence,
+            audio_cache=audio_cache,
+        ),
+        escalation_factories=[
+            partial(
+                WhisperTranscriberAdapter.from_model_name,
+                escalation_model_name,
+                num_threads=num_threads,
+                trim_silence=trim_silence,
+                audio_cache=audio_cache,
+            )
+            for escalation_model_name in cascade[1:]
+        ],
+    )
+    return transcription_service, whisper_model
+
+
+def run_transcription(
+    transcription_service: TranscriptionService,
+    directory: Path,
+    ignore_existing: bool,
+    within_hours: float | None = None,
+    incremental: bool = False,
+) -> int:
+    """
+    Collect, transcribe and output audio files using an already configured service.
+
+    With `incremental`, only files that are new or changed since the last incremental run
+    are collected. The scan is recorded after all of them were written, so an interrupted
+    run picks the same files up again.
+
+    Returns:
+        Number of processed audio files
+    """
+    start_dt = None
+    if within_hours is not None:
+        start_dt = datetime.now() - timedelta(hours=within_hours)
+
+    audio_files = transcription_service.collect_audio_files(
+        directory, start_dt=start_dt, incremental=incremental
+    )
+    # Day files are updated in small batches while transcription is still running
+    processed = transcription_service.output_transcription_stream(
+        transcription_service.iter_transcribe_audio_files(
+            audio_files, ignore_existing=ignore_existing
+        )
+    )
+    if incremental:
+        transcription_service.commit_scan()
+    return processed
+
+
+def run_transcription_for_paths(
+    transcription_service: TranscriptionService,
+    paths: list[Path],
+    ignore_existing: bool = False,
+) -> int:
+    """
+    Transcribe and output the given audio files, without scanning any directory.
+
+    Returns:
+        Number of processed audio files
+    """
+    audio_files = transcription_service.get_audio_files(paths)
+    return transcription_service.output_transcription_stream(
+        transcription_service.iter_transcribe_audio_files(
+            audio_files, ignore_existing=ignore_existing
+        )
+    )
+
+
+def select_audio_paths(paths: list[Path], directory: Path) -> list[Path]:
+    """
+    Keep the paths that are audio files, in the form a scan of `directory` produces,
+    dropping duplicates.
+
+    Transcriptions are stored by path, so `/home/me/notes/a.m4a` given while the project
+    directory is `.` (and cwd is `/home/me`) becomes `notes/a.m4a`, matching earlier runs.
+    """
+    root = os.path.abspath(directory)
+    selected = []
+    for path in paths:
+        if not path.is_file():
+            logging.warning(f"Skipping {path}: not a file")
+            continue
+        if not is_audio_file_name(path.name):
+            logging.warning(f"Skipping {path}: not an audio file")
+            continue
+        absolute = os.path.abspath(path)
+        if os.path.commonpath([root, absolute]) == root:
+            path = directory / os.path.relpath(absolute, root)
+        selected.append(path)
+    return list(dict.fromkeys(selected))
+
+
+def _forward_to_daemon(
+    speechdown_paths: SpeechDownPaths,
+    directory: Path,
+    ignore_existing: bool,
+    within_hours: float | None,
+    incremental: bool = False,
+    paths: list[Path] | None = None,
+) -> int | None:
+    """Send the request to a running `sd serve` daemon; return None if there is none."""
+    response = DaemonClient(speechdown_paths.socket).request(
+        {
+            "command": "transcribe",
+            # Paths stored in the DB and the output location are relative to the caller's
+            # working directory, so the daemon replays the request from the same place.
+            "cwd": os.getcwd(),
+            "directory": str(directory),
+            "ignore_existing": ignore_existing,
+            "within_hours": within_hours,
+            "incremental": incremental,
+            "paths": None if paths is None else [str(path) for path in paths],
+        }
+    )
+    if response is None:
+        return None
+    if response.get("status") != "ok":
+        raise RuntimeError(f"Daemon error: {response.get('message')}")
+    logging.debug("Transcription handled by the running daemon")
+    return int(response["processed"])
+
 
 def transcribe(
     directory: Path,
     dry_run: bool,
     ignore_existing: bool,
     within_hours: float | None = None,
+    use_daemon: bool = True,
+    workers: int = 1,
+    prefetch: int = 2,
+    prefetch_max_mb: int = DEFAULT_PREFETCH_MAX_BYTES // (1024 * 1024),
+    batch_size: int = 1,
+    chunk_minutes: float | None = None,
+    incremental: bool = False,
+    paths: list[Path] | None = None,
 ) -> int:
     """
     Transcribe audio files in the specified directory.
 
+    If an `sd serve` daemon is running for the project, the work is forwarded to it so the
+    already loaded model is reused.
+
     Args:
         directory: The directory containing audio files
         dry_run: Whether to perform a dry run without saving to database
         ignore_existing: Whether to ignore existing transcriptions and perform new ones
         within_hours: If set, only transcribe files modified within this many hours
+        use_daemon: Whether to forward to a running daemon instead of transcribing in-process
+        workers: Number of worker processes; more than one always runs locally, since the
+                 daemon holds a single model
+        prefetch: Number of upcoming files decoded in the background while transcribing
+        prefetch_max_mb: Memory budget in MB for audio decoded ahead of transcription
+        batch_size: Number of short clips decoded together in one forward pass; batching
+                    always runs locally, like multiple workers
+        chunk_minutes: If set, split long recordings into chunks of about this many minutes
+                       at quiet moments and transcribe the chunks across the workers
+        incremental: Only collect files that are new or changed since the last incremental
+                     run, using the scan index in the project database
+        paths: If set, transcribe exactly these files instead of scanning the directory;
+               `within_hours` and `incremental` don't apply
 
     Returns:
         Exit code (0 for success)
     """
     try:
         speechdown_paths = SpeechDownPaths.from_working_directory(directory)
+        if paths is not None:
+            paths = select_audio_paths(paths, directory)
 
-        # Create timestamp adapter
-        timestamp_adapter = FileTimestampAdapter()
-
-        audio_file_adapter = AudioFileAdapter(timestamp_port=timestamp_adapter)
-        config_adapter = ConfigAdapter.load_config_from_path(speechdown_paths.config)
-        config_adapter.set_default_output_dir_if_not_set()
-        config_adapter.set_default_model_name_if_not_set()
-        output_adapter = FileOutputAdapter(config_adapter)
-        repository_adapter = SQLiteRepositoryAdapter(
-            speechdown_paths.db, timestamp_port=timestamp_adapter
-        )
+        processed = None
+        if use_daemon and workers == 1 and batch_size == 1 and chunk_minutes is None:
+            processed = _forward_to_daemon(
+                speechdown_paths, directory, ignore_existing, within_hours, incremental, paths
+            )
 
-        # Create model and transcriber
-        model_name = config_adapter.get_model_name()
-        # model_name is guaranteed to be set by set_default_model_name_if_not_set.
-        whisper_model = WhisperModelAdapter(model_name=model_name)
-        transcriber_adapter = WhisperTranscriberAdapter(whisper_model)
-
-        transcription_service = TranscriptionService(
-            audio_file_port=audio_file_adapter,
-            config_port=config_adapter,
-            output_port=output_adapter,
-            repository_port=repository_adapter,
-            transcriber_port=transcriber_adapter,
-            timestamp_port=timestamp_adapter,
-        )
-
-        start_dt = None
-        if within_hours is not None:
-            start_dt = datetime.now() - timedelta(hours=within_hours)
-
-        audio_files = transcription_service.collect_audio_files(directory, start_dt=start_dt)
-        transcriptions = transcription_service.transcribe_audio_files(
-            audio_files, ignore_existing=ignore_existing
-        )
-        # get existing output
-        # update transcriptions based on existing output
-        # update the output
-        transcription_service.output_transcriptions(transcriptions)
+        if processed is None:
+            transcription_service, whisper_model = create_transcription_service(
+                speechdown_paths,
+                workers=workers,
+                prefetch=prefetch,
+                prefetch_max_mb=prefetch_max_mb,
+                batch_size=batch_size,
+                chunk_minutes=chunk_minutes,
+            )
+            if paths is not None:
+                processed = run_transcription_for_paths(
+                    transcription_service, paths, ignore_existing
+                )
+            else:
+                processed = run_transcription(
+                    transcription_service, directory, ignore_existing, within_hours, incremental
+                )
+            # Worker processes load their own models, which this count doesn't include
+            workers_note = f"; each of the {workers} workers loads its own" if workers > 1 else ""
+            logging.info(
+                f"Whisper model loads in the main process during this run: "
+                f"{whisper_model.load_count}{workers_note}"
+            )
 
         if dry_run:
             print("Dry run mode enabled. No changes to the database were made.")
         else:
-            print(f"Processed {len(transcriptions)} audio file(s)")
+            print(f"Processed {processed} audio file(s)")
 
         return 0
     except Exception as e:
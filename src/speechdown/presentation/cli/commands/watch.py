@@ -0,0 +1,79 @@
+"""Watch command handler for speechdown CLI."""
+
+from pathlib import Path
+import logging
+
+from speechdown.infrastructure import inotify
+from speechdown.infrastructure.adapters.config_adapter import DEFAULT_OUTPUT_DIR
+from speechdown.infrastructure.file_watcher import DEFAULT_QUIET_SECONDS, DirectoryWatcher
+from speechdown.infrastructure.file_walker import IgnoreRules
+from speechdown.presentation.cli.commands.common import SpeechDownPaths
+from speechdown.presentation.cli.commands.transcribe import (
+    create_transcription_service,
+    run_transcription,
+    run_transcription_for_paths,
+)
+
+__all__ = ["watch"]
+
+
+def watch(
+    directory: Path,
+    quiet_seconds: float = DEFAULT_QUIET_SECONDS,
+    catch_up_hours: float = 48.0,
+) -> int:
+    """
+    Transcribe audio files as soon as they are completely written to the directory.
+
+    The model stays loaded between files, and each batch of new files is transcribed and
+    merged into the daily files without scanning the rest of the tree.
+
+    Args:
+        directory: The directory containing the speechdown project and recordings
+        quiet_seconds: How long a file must go without writes, and keep its size, before
+                       it is considered complete
+        catch_up_hours: On start, first transcribe files modified within this many hours,
+                        to pick up recordings that arrived while not watching; 0 disables
+
+    Returns:
+        Exit code (0 for success)
+    """
+    try:
+        if not inotify.is_supported():
+            logging.error(
+                "sd watch requires Linux inotify; on macOS use the fswatch-based watcher in "
+                "scripts/2025-10-04-auto-transcribe-watcher"
+            )
+            return 1
+
+        speechdown_paths = SpeechDownPaths.from_working_directory(directory)
+        transcription_service, _ = create_transcription_service(speechdown_paths)
+        output_dir = transcription_service.config_port.get_output_dir() or Path(
+            DEFAULT_OUTPUT_DIR
+        )
+        rules = IgnoreRules.load(directory, [output_dir])
+
+        # Watches are in place before catching up, so files arriving meanwhile are queued
+        with DirectoryWatcher(directory, rules, quiet_seconds=quiet_seconds) as watcher:
+            if catch_up_hours > 0:
+                processed = run_transcription(
+                    transcription_service, directory, False, within_hours=catch_up_hours
+                )
+                print(f"Caught up on {processed} audio file(s)")
+            print(f"Watching {directory} for new recordings (Ctrl+C to stop)")
+            for paths in watcher.iter_completed():
+                logging.info(f"Transcribing {len(paths)} new file(s)")
+                # A file removed before it was read, or one ffmpeg can't decode, fails its
+                # batch only; the watcher keeps going
+                try:
+                    processed = run_transcription_for_paths(transcription_service, paths)
+                except Exception:
+                    logging.exception(f"Error transcribing {', '.join(map(str, paths))}")
+                    continue
+                print(f"Processed {processed} audio file(s)")
+    except KeyboardInterrupt:
+        return 0
+    except Exception as e:
+        logging.error(f"Error while watching: {e}")
+        return 1
+    return 0
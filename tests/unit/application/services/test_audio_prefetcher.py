@@ -0,0 +1,76 @@
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from speechdown.application.services.audio_prefetcher import AudioPrefetcher
+from speechdown.domain.entities import AudioFile
+from speechdown.domain.value_objects import Timestamp
+
+
+class Samples:
+    def __init__(self, name, nbytes=100):
+        self.name = name
+        self.nbytes = nbytes
+
+
+def _audio_files(count):
+    return [
+        AudioFile(path=Path(f"note-{i}.m4a"), timestamp=Timestamp(datetime(2024, 1, 1)))
+        for i in range(count)
+    ]
+
+
+def test_yields_decoded_audio_in_input_order():
+    audio_files = _audio_files(5)
+    prefetcher = AudioPrefetcher(lambda f: Samples(f.path.name), depth=2, max_buffered_bytes=10**6)
+
+    decoded = list(prefetcher.iter_decoded(audio_files))
+
+    assert [audio_file for audio_file, _ in decoded] == audio_files
+    assert [audio.name for _, audio in decoded] == [f.path.name for f in audio_files]
+
+
+def test_depth_zero_decodes_inline():
+    calls = []
+    prefetcher = AudioPrefetcher(
+        lambda f: calls.append(threading.current_thread()) or Samples(f.path.name),
+        depth=0,
+        max_buffered_bytes=0,
+    )
+
+    list(prefetcher.iter_decoded(_audio_files(2)))
+
+    assert calls == [threading.current_thread()] * 2
+
+
+def test_reads_ahead_at_most_depth_files():
+    lock = threading.Lock()
+    loaded = []
+
+    def load(audio_file):
+        with lock:
+            loaded.append(audio_file)
+        return Samples(audio_file.path.name, nbytes=10**6)
+
+    prefetcher = AudioPrefetcher(load, depth=2, max_buffered_bytes=1)
+
+    for consumed, _ in enumerate(prefetcher.iter_decoded(_audio_files(6))):
+        with lock:
+            assert len(loaded) - consumed <= 3
+
+
+def test_decode_error_raised_for_failing_file():
+    def load(audio_file):
+        if audio_file.path.name == "note-1.m4a":
+            raise RuntimeError("ffmpeg failed")
+        return Samples(audio_file.path.name)
+
+    decoded = AudioPrefetcher(load, depth=2, max_buffered_bytes=10**6).iter_decoded(
+        _audio_files(3)
+    )
+
+    assert next(decoded)[1].name == "note-0.m4a"
+    with pytest.raises(RuntimeError):
+        next(decoded)
@@ -1,14 +1,35 @@
 import os
 from datetime import datetime, timedelta
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
+from speechdown.application.services.transcription_options import TranscriptionOptions
 from speechdown.application.services.transcription_service import TranscriptionService
 from speechdown.domain.entities import AudioFile, Transcription
 from speechdown.domain.value_objects import Language, Timestamp, TranscriptionMetrics
 
 
+class FakeTranscriber:
+    """Deterministic, picklable transcriber used to compare sequential and parallel runs."""
+
+    def load_audio(self, audio_file):
+        return audio_file.path.read_text()
+
+    def detect_language(self, audio_file, languages, audio=None):
+        return {}
+
+    def transcribe(self, audio_file, language, audio=None):
+        confidence = -0.1 if language.code == audio else -0.9
+        return Transcription(
+            audio_file=audio_file,
+            text=f"{audio_file.path.name} in {language}",
+            language=language,
+            metrics=TranscriptionMetrics(confidence=confidence),
+            transcription_started_at=datetime(2024, 1, 1),
+        )
+
+
 @pytest.fixture
 def audio_file(tmp_path):
     file_path = tmp_path / "audio.m4a"
@@ -29,8 +50,8 @@ def test_retranscribe_when_file_modified(audio_file):
         transcription_started_at=old_time,
     )
 
-    repo = Mock()
-    repo.get_best_transcription.return_value = old_transcription
+    repo = MagicMock()
+    repo.get_best_transcriptions.return_value = {audio_file.path: old_transcription}
     repo.delete_transcriptions = Mock()
     repo.save_transcription = Mock()
 
@@ -59,5 +80,549 @@ def test_retranscribe_when_file_modified(audio_file):
     results = service.transcribe_audio_files([audio_file])
 
     repo.delete_transcriptions.assert_called_once_with(audio_file.path)
-    transcriber.transcribe.assert_called_once_with(audio_file, Language("en"))
+    transcriber.transcribe.assert_called_once_with(
+        audio_file, Language("en"), audio=transcriber.load_audio.return_value
+    )
     assert results == [new_transcription]
+
+
+def _make_transcription(audio_file, language, confidence):
+    return Transcription(
+        audio_file=audio_file,
+        text=f"text in {language}",
+        language=language,
+        metrics=TranscriptionMetrics(confidence=confidence),
+        transcription_started_at=datetime.now(),
+    )
+
+
+def _make_service(transcriber, languages, **kwargs):
+    repo = MagicMock()
+    repo.get_best_transcriptions.return_value = {}
+    repo.get_language_frequencies.return_value = {}
+    config_port = Mock()
+    config_port.get_languages.return_value = languages
+    return TranscriptionService(
+        audio_file_port=Mock(),
+        config_port=config_port,
+        output_port=Mock(),
+        repository_port=repo,
+        transcriber_port=transcriber,
+        timestamp_port=Mock(),
+        **kwargs,
+    )
+
+
+def test_language_detection_transcribes_only_top_language(audio_file):
+    en, uk, ru = Language("en"), Language("uk"), Language("ru")
+    transcriber = Mock()
+    transcriber.detect_language.return_value = {en: 0.9, uk: 0.06, ru: 0.04}
+    transcriber.transcribe.side_effect = lambda f, lang, audio=None: _make_transcription(f, lang, -0.3)
+    service = _make_service(
+        transcriber, [en, uk, ru], options=TranscriptionOptions(detect_language=True)
+    )
+
+    results = service.transcribe_audio_files([audio_file])
+
+    transcriber.transcribe.assert_called_once_with(
+        audio_file, en, audio=transcriber.load_audio.return_value
+    )
+    assert results[0].language == en
+    assert results[0].metrics.language_detection_confidence == 0.9
+    service.repository_port.save_transcription.assert_called_once_with(results[0])
+
+
+def test_language_detection_keeps_languages_within_margin(audio_file):
+    en, uk, ru = Language("en"), Language("uk"), Language("ru")
+    transcriber = Mock()
+    transcriber.detect_language.return_value = {en: 0.4, uk: 0.5, ru: 0.1}
+    confidences = {en: -0.2, uk: -0.6}
+    transcriber.transcribe.side_effect = lambda f, lang, audio=None: _make_transcription(
+        f, lang, confidences[lang]
+    )
+    service = _make_service(
+        transcriber, [en, uk, ru], options=TranscriptionOptions(detect_language=True)
+    )
+
+    results = service.transcribe_audio_files([audio_file])
+
+    assert [call.args[1] for call in transcriber.transcribe.call_args_list] == [uk, en]
+    assert results[0].language == en
+    assert results[0].metrics.language_detection_confidence == 0.4
+
+
+def test_language_detection_off_by_default_tries_all_languages(audio_file):
+    en, uk = Language("en"), Language("uk")
+    transcriber = Mock()
+    transcriber.transcribe.side_effect = lambda f, lang, audio=None: _make_transcription(f, lang, -0.3)
+    service = _make_service(transcriber, [en, uk])
+
+    service.transcribe_audio_files([audio_file])
+
+    transcriber.detect_language.assert_not_called()
+    assert transcriber.transcribe.call_count == 2
+
+
+def test_audio_decoded_once_for_all_language_attempts(audio_file):
+    en, uk = Language("en"), Language("uk")
+    transcriber = Mock()
+    transcriber.detect_language.return_value = {en: 0.5, uk: 0.5}
+    transcriber.transcribe.side_effect = lambda f, lang, audio=None: _make_transcription(
+        f, lang, -0.3
+    )
+    service = _make_service(
+        transcriber, [en, uk], options=TranscriptionOptions(detect_language=True)
+    )
+
+    service.transcribe_audio_files([audio_file])
+
+    transcriber.load_audio.assert_called_once_with(audio_file)
+    decoded = transcriber.load_audio.return_value
+    transcriber.detect_language.assert_called_once_with(audio_file, [en, uk], audio=decoded)
+    assert all(call.kwargs["audio"] is decoded for call in transcriber.transcribe.call_args_list)
+
+
+def test_parallel_workers_match_sequential_results(tmp_path):
+    audio_files = []
+    for i, code in enumerate(["en", "uk", "uk", "en"]):
+        path = tmp_path / f"note-{i}.m4a"
+        path.write_text(code)
+        audio_files.append(AudioFile(path=path, timestamp=Timestamp(datetime(2024, 1, 1))))
+    languages = [Language("en"), Language("uk")]
+
+    sequential = _make_service(FakeTranscriber(), languages)
+    parallel = _make_service(
+        FakeTranscriber(),
+        languages,
+        options=TranscriptionOptions(workers=2),
+        transcriber_factory=FakeTranscriber,
+    )
+
+    expected = sequential.transcribe_audio_files(audio_files)
+    results = parallel.transcribe_audio_files(audio_files)
+
+    assert results == expected
+    assert [result.language.code for result in results] == ["en", "uk", "uk", "en"]
+    assert (
+        parallel.repository_port.save_transcription.call_args_list
+        == sequential.repository_port.save_transcription.call_args_list
+    )
+
+
+def test_parallel_workers_require_factory(tmp_path, audio_file):
+    other = AudioFile(path=tmp_path / "other.m4a", timestamp=audio_file.timestamp)
+    service = _make_service(Mock(), [Language("en")], options=TranscriptionOptions(workers=2))
+
+    with pytest.raises(ValueError):
+        service.transcribe_audio_files([audio_file, other])
+
+
+class FakeBatchTranscriber(FakeTranscriber):
+    """FakeTranscriber that records how files were grouped into batches."""
+
+    def __init__(self):
+        self.batches = []
+
+    def transcribe_batch(self, audio_files, language, audios):
+        self.batches.append(([f.path.name for f in audio_files], language.code))
+        return [
+            self.transcribe(audio_file, language, audio=audio)
+            for audio_file, audio in zip(audio_files, audios)
+        ]
+
+
+def test_batched_transcription_matches_sequential_results(tmp_path):
+    audio_files = []
+    for i, code in enumerate(["en", "uk", "uk", "en", "en"]):
+        path = tmp_path / f"note-{i}.m4a"
+        path.write_text(code)
+        audio_files.append(AudioFile(path=path, timestamp=Timestamp(datetime(2024, 1, 1))))
+    languages = [Language("en"), Language("uk")]
+
+    sequential = _make_service(FakeTranscriber(), languages)
+    transcriber = FakeBatchTranscriber()
+    batched = _make_service(transcriber, languages, options=TranscriptionOptions(batch_size=3))
+
+    expected = sequential.transcribe_audio_files(audio_files)
+    results = batched.transcribe_audio_files(audio_files)
+
+    assert results == expected
+    assert transcriber.batches == [
+        (["note-0.m4a", "note-1.m4a", "note-2.m4a"], "en"),
+        (["note-0.m4a", "note-1.m4a", "note-2.m4a"], "uk"),
+        (["note-3.m4a", "note-4.m4a"], "en"),
+        (["note-3.m4a", "note-4.m4a"], "uk"),
+    ]
+    # Attempts are saved in rounds, so only the set of saved attempts matches
+    saved = batched.repository_port.save_transcription.call_args_list
+    expected_saved = sequential.repository_port.save_transcription.call_args_list
+    assert sorted(call.args[0].text for call in saved) == sorted(
+        call.args[0].text for call in expected_saved
+    )
+
+
+class FakeChunkTranscriber(FakeTranscriber):
+    """FakeTranscriber whose files split into one chunk per line."""
+
+    def load_audio(self, audio_file):
+        return audio_file.path.read_text().splitlines()
+
+    def split_audio(self, audio_file, chunk_seconds, audio=None):
+        return [[line] for line in audio]
+
+    def transcribe(self, audio_file, language, audio=None):
+        code, text = audio[0].split(":")
+        return Transcription(
+            audio_file=audio_file,
+            text=text,
+            language=language,
+            metrics=TranscriptionMetrics(confidence=-0.1 if language.code == code else -0.9),
+            transcription_started_at=datetime(2024, 1, 1),
+        )
+
+    def stitch_transcriptions(self, audio_file, parts, chunks):
+        return Transcription(
+            audio_file=audio_file,
+            text=" ".join(part.text for part in parts),
+            language=parts[0].language,
+            metrics=TranscriptionMetrics(
+                confidence=sum(part.metrics.confidence for part in parts) / len(parts),
+                additional_metrics={"chunks_count": len(parts)},
+            ),
+            transcription_started_at=parts[0].transcription_started_at,
+        )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_chunked_transcription_stitches_chunks_in_order(tmp_path, workers):
+    audio_files = []
+    for i, lines in enumerate([["en:one", "en:two", "en:three"], ["uk:short"]]):
+        path = tmp_path / f"recording-{i}.m4a"
+        path.write_text("\n".join(lines))
+        audio_files.append(AudioFile(path=path, timestamp=Timestamp(datetime(2024, 1, 1))))
+    service = _make_service(
+        FakeChunkTranscriber(),
+        [Language("en"), Language("uk")],
+        options=TranscriptionOptions(chunk_seconds=300, workers=workers),
+        transcriber_factory=FakeChunkTranscriber,
+    )
+
+    results = service.transcribe_audio_files(audio_files)
+
+    assert [result.text for result in results] == ["one two three", "short"]
+    assert [result.language.code for result in results] == ["en", "uk"]
+    assert results[0].metrics.additional_metrics["chunks_count"] == 3
+    assert service.repository_port.save_transcription.call_count == 4
+
+
+class FakeDetectingChunkTranscriber(FakeChunkTranscriber):
+    """FakeChunkTranscriber that detects the language of the first chunk."""
+
+    def detect_language(self, audio_file, languages, audio=None):
+        detected = audio[0].split(":")[0]
+        return {language: 0.9 if language.code == detected else 0.05 for language in languages}
+
+
+class MainProcessChunkTranscriber(FakeChunkTranscriber):
+    """Transcriber of the main process, which must leave detection to the workers."""
+
+    def detect_language(self, audio_file, languages, audio=None):
+        raise AssertionError("language detection ran in the main process")
+
+
+def test_chunked_transcription_detects_language_in_workers(tmp_path):
+    audio_files = []
+    for i, lines in enumerate([["en:one", "en:two"], ["uk:short"]]):
+        path = tmp_path / f"recording-{i}.m4a"
+        path.write_text("\n".join(lines))
+        audio_files.append(AudioFile(path=path, timestamp=Timestamp(datetime(2024, 1, 1))))
+    service = _make_service(
+        MainProcessChunkTranscriber(),
+        [Language("en"), Language("uk")],
+        options=TranscriptionOptions(detect_language=True, chunk_seconds=300, workers=2),
+        transcriber_factory=FakeDetectingChunkTranscriber,
+    )
+
+    results = service.transcribe_audio_files(audio_files)
+
+    assert [result.text for result in results] == ["one two", "short"]
+    assert [result.language.code for result in results] == ["en", "uk"]
+    # Only the detected language of each file was transcribed
+    assert service.repository_port.save_transcription.call_count == 2
+
+
+class FakeModelTranscriber(FakeTranscriber):
+    """Transcriber of a named model that reaches a fixed confidence on every file."""
+
+    def __init__(self, model_name="tiny", confidence=-0.2, compression_ratio=1.5):
+        self.model_name = model_name
+        self.confidence = confidence
+        self.compression_ratio = compression_ratio
+        self.calls = 0
+
+    def transcribe(self, audio_file, language, audio=None):
+        self.calls += 1
+        return Transcription(
+            audio_file=audio_file,
+            text=f"{self.model_name} text",
+            language=language,
+            metrics=TranscriptionMetrics(
+                model_name=self.model_name,
+                confidence=self.confidence,
+                compression_ratio_mean=self.compression_ratio,
+            ),
+            transcription_started_at=datetime(2024, 1, 1),
+        )
+
+
+def test_model_cascade_stops_at_first_confident_model(audio_file):
+    small = FakeModelTranscriber("small", confidence=-0.4)
+    medium = FakeModelTranscriber("medium", confidence=-0.1)
+    service = _make_service(
+        FakeModelTranscriber("tiny", confidence=-1.3),
+        [Language("en")],
+        escalation_factories=[lambda: small, lambda: medium],
+    )
+
+    results = service.transcribe_audio_files([audio_file])
+
+    saved = service.repository_port.save_transcription.call_args_list
+    assert [call.args[0].metrics.model_name for call in saved] == ["tiny", "small"]
+    assert results[0].metrics.model_name == "small"
+    assert medium.calls == 0
+
+
+def test_model_cascade_escalates_on_repetitive_text(audio_file):
+    small = FakeModelTranscriber("small")
+    service = _make_service(
+        FakeModelTranscriber("tiny", confidence=-0.2, compression_ratio=3.1),
+        [Language("en")],
+        escalation_factories=[lambda: small],
+    )
+
+    service.transcribe_audio_files([audio_file])
+
+    assert small.calls == 1
+
+
+def test_model_cascade_skipped_for_confident_results(audio_file):
+    small = FakeModelTranscriber("small")
+    service = _make_service(
+        FakeModelTranscriber("tiny", confidence=-0.3),
+        [Language("en")],
+        escalation_factories=[lambda: small],
+    )
+
+    service.transcribe_audio_files([audio_file])
+
+    assert small.calls == 0
+    assert service.repository_port.save_transcription.call_count == 1
+
+
+def test_languages_tried_in_learned_order_with_early_exit(audio_file):
+    en, uk, ru = Language("en"), Language("uk"), Language("ru")
+    transcriber = Mock()
+    confidences = {en: -0.9, uk: -0.2, ru: -0.1}
+    transcriber.transcribe.side_effect = lambda f, lang, audio=None: _make_transcription(
+        f, lang, confidences[lang]
+    )
+    service = _make_service(
+        transcriber,
+        [en, uk, ru],
+        options=TranscriptionOptions(detect_language=False, early_exit_confidence=-0.4),
+    )
+    service.repository_port.get_language_frequencies.return_value = {uk: 12, en: 3}
+
+    results = service.transcribe_audio_files([audio_file])
+
+    # Ukrainian wins most often in this directory and is confident enough on its own
+    assert [call.args[1] for call in transcriber.transcribe.call_args_list] == [uk]
+    assert results[0].language == uk
+    service.repository_port.get_language_frequencies.assert_called_once_with(
+        audio_file.path.parent
+    )
+
+
+def test_languages_keep_configured_order_without_early_exit(audio_file):
+    en, uk = Language("en"), Language("uk")
+    transcriber = Mock()
+    transcriber.transcribe.side_effect = lambda f, lang, audio=None: _make_transcription(
+        f, lang, -0.3
+    )
+    service = _make_service(
+        transcriber, [en, uk], options=TranscriptionOptions(detect_language=False)
+    )
+
+    service.transcribe_audio_files([audio_file])
+
+    assert [call.args[1] for call in transcriber.transcribe.call_args_list] == [en, uk]
+    service.repository_port.get_language_frequencies.assert_not_called()
+
+
+def test_early_exit_keeps_trying_after_unconfident_attempts(audio_file):
+    en, uk = Language("en"), Language("uk")
+    transcriber = Mock()
+    confidences = {en: -0.9, uk: -0.3}
+    transcriber.transcribe.side_effect = lambda f, lang, audio=None: _make_transcription(
+        f, lang, confidences[lang]
+    )
+    service = _make_service(
+        transcriber,
+        [en, uk],
+        options=TranscriptionOptions(detect_language=False, early_exit_confidence=-0.4),
+    )
+
+    results = service.transcribe_audio_files([audio_file])
+
+    assert [call.args[1] for call in transcriber.transcribe.call_args_list] == [en, uk]
+    assert results[0].language == uk
+
+
+def test_iter_transcribe_yields_stored_results_before_new_ones(tmp_path):
+    audio_files = []
+    for i in range(3):
+        path = tmp_path / f"note-{i}.m4a"
+        path.write_text("en")
+        audio_files.append(AudioFile(path=path, timestamp=Timestamp(datetime(2024, 1, 1))))
+    service = _make_service(FakeTranscriber(), [Language("en")])
+    stored = _make_transcription(audio_files[2], Language("en"), -0.1)
+    stored.transcription_started_at = datetime.now() + timedelta(hours=1)
+    service.repository_port.get_best_transcriptions.return_value = {audio_files[2].path: stored}
+
+    streamed = list(service.iter_transcribe_audio_files(audio_files))
+
+    assert [result.audio_file for result in streamed] == [
+        audio_files[2],
+        audio_files[0],
+        audio_files[1],
+    ]
+    assert service.transcribe_audio_files(audio_files)[2] is stored
+
+
+def _hash_by_text(audio_file):
+    return audio_file.path.read_text()
+
+
+def test_moved_file_reuses_transcription_of_same_content(tmp_path):
+    moved = tmp_path / "moved.m4a"
+    moved.write_text("en")
+    audio_file = AudioFile(path=moved, timestamp=Timestamp(datetime(2024, 1, 1)))
+    transcriber = Mock()
+    content_hash_port = Mock()
+    content_hash_port.get_content_hash.side_effect = _hash_by_text
+    service = _make_service(
+        transcriber,
+        [Language("en")],
+        content_hash_port=content_hash_port,
+        options=TranscriptionOptions(model_names=("whisper-tiny",)),
+    )
+    original = _make_transcription(
+        AudioFile(path=tmp_path / "old.m4a", timestamp=Timestamp(datetime(2024, 1, 1))),
+        Language("en"),
+        -0.2,
+    )
+    service.repository_port.get_best_transcriptions_by_content.return_value = {"en": original}
+
+    [result] = service.transcribe_audio_files([audio_file])
+
+    transcriber.transcribe.assert_not_called()
+    service.repository_port.get_best_transcriptions_by_content.assert_called_once_with(
+        ["en"], ["whisper-tiny"], [Language("en")]
+    )
+    assert result.audio_file is audio_file
+    assert audio_file.content_hash == "en"
+    assert result.text == original.text
+    service.repository_port.save_transcription.assert_called_once_with(result)
+
+
+def test_duplicates_in_one_run_are_transcribed_once(tmp_path):
+    audio_files = []
+    for name in ["a.m4a", "synced/a.m4a", "b.m4a"]:
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("uk" if name == "b.m4a" else "en")
+        audio_files.append(AudioFile(path=path, timestamp=Timestamp(datetime(2024, 1, 1))))
+    transcriber = Mock(wraps=FakeTranscriber())
+    content_hash_port = Mock()
+    content_hash_port.get_content_hash.side_effect = _hash_by_text
+    service = _make_service(
+        transcriber,
+        [Language("en")],
+        content_hash_port=content_hash_port,
+        options=TranscriptionOptions(detect_language=False),
+    )
+    service.repository_port.get_best_transcriptions_by_content.return_value = {}
+
+    results = service.transcribe_audio_files(audio_files)
+
+    assert transcriber.transcribe.call_count == 2
+    assert [result.audio_file for result in results] == audio_files
+    assert results[1].text == results[0].text
+    assert results[1].audio_file.content_hash == "en"
+
+
+@pytest.mark.parametrize("batch_size", [1, 2])
+def test_near_duplicate_reuses_stored_transcription(tmp_path, batch_size):
+    audio_files = []
+    for name in ["note.wav", "other.m4a"]:
+        path = tmp_path / name
+        path.write_text("en")
+        audio_files.append(AudioFile(path=path, timestamp=Timestamp(datetime(2024, 1, 1))))
+    original_path = tmp_path / "note.m4a"
+    original = _make_transcription(
+        AudioFile(path=original_path, timestamp=Timestamp(datetime(2024, 1, 1))),
+        Language("en"),
+        -0.2,
+    )
+    original.metrics = TranscriptionMetrics(confidence=-0.2, model_name="whisper-tiny")
+    fingerprint_port = Mock()
+    fingerprint_port.index_and_match.side_effect = lambda audio_file, audio, similarity: (
+        [original_path] if audio_file.path.name == "note.wav" else []
+    )
+    transcriber = FakeBatchTranscriber()
+    service = _make_service(
+        transcriber,
+        [Language("en")],
+        fingerprint_port=fingerprint_port,
+        options=TranscriptionOptions(
+            detect_language=False,
+            batch_size=batch_size,
+            model_names=("whisper-tiny",),
+            near_duplicate_similarity=0.8,
+        ),
+    )
+    service.repository_port.get_best_transcription.return_value = original
+
+    results = service.transcribe_audio_files(audio_files)
+
+    assert [result.audio_file for result in results] == audio_files
+    assert results[0].text == original.text
+    assert results[1].text == "other.m4a in en"
+    assert transcriber.batches == ([(["other.m4a"], "en")] if batch_size > 1 else [])
+    service.repository_port.get_best_transcription.assert_called_once_with(original_path)
+    fingerprint_port.index_and_match.assert_any_call(audio_files[0], "en", 0.8)
+
+
+def test_near_duplicate_of_other_model_is_transcribed(tmp_path):
+    path = tmp_path / "note.wav"
+    path.write_text("en")
+    audio_file = AudioFile(path=path, timestamp=Timestamp(datetime(2024, 1, 1)))
+    original = _make_transcription(audio_file, Language("en"), -0.2)
+    original.metrics = TranscriptionMetrics(confidence=-0.2, model_name="whisper-large")
+    fingerprint_port = Mock()
+    fingerprint_port.index_and_match.return_value = [tmp_path / "note.m4a"]
+    service = _make_service(
+        FakeTranscriber(),
+        [Language("en")],
+        fingerprint_port=fingerprint_port,
+        options=TranscriptionOptions(
+            detect_language=False,
+            model_names=("whisper-tiny",),
+            near_duplicate_similarity=0.8,
+        ),
+    )
+    service.repository_port.get_best_transcription.return_value = original
+
+    [result] = service.transcribe_audio_files([audio_file])
+
+    assert result.text == "note.wav in en"
@@ -171,4 +171,143 @@ def test_config_with_existing_language(temp_speechdown_dir, capsys):
     with open(config_file, "r") as f:
         config_data = json.load(f)
     
-    assert config_data["languages"] == ["en", "uk", "ru"]
\ No newline at end of file
+    assert config_data["languages"] == ["en", "uk", "ru"]
+
+def test_config_sets_language_detection(temp_speechdown_dir, capsys):
+    """Test turning on language detection and setting its margin."""
+    result = config(
+        directory=temp_speechdown_dir, language_detection=True, language_detection_margin=0.3
+    )
+
+    assert result == 0
+
+    captured = capsys.readouterr()
+    assert "Language detection set to: on" in captured.out
+    assert "Language detection: on (margin 0.3)" in captured.out
+
+    config_file = temp_speechdown_dir / ".speechdown" / "config.json"
+    with open(config_file, "r") as f:
+        config_data = json.load(f)
+
+    assert config_data["language_detection"] is True
+    assert config_data["language_detection_margin"] == 0.3
+
+
+def test_config_sets_trim_silence(temp_speechdown_dir, capsys):
+    """Test turning on silence trimming."""
+    result = config(directory=temp_speechdown_dir, trim_silence=True)
+
+    assert result == 0
+
+    captured = capsys.readouterr()
+    assert "Silence trimming set to: on" in captured.out
+    assert "Silence trimming: on" in captured.out
+
+    config_file = temp_speechdown_dir / ".speechdown" / "config.json"
+    with open(config_file, "r") as f:
+        config_data = json.load(f)
+
+    assert config_data["trim_silence"] is True
+
+
+def test_config_sets_model_cascade(temp_speechdown_dir, capsys):
+    """Test configuring a model cascade and its thresholds."""
+    result = config(
+        directory=temp_speechdown_dir,
+        model_cascade="tiny, small,medium",
+        cascade_min_confidence=-0.8,
+    )
+
+    assert result == 0
+
+    captured = capsys.readouterr()
+    assert "Model cascade set to: tiny -> small -> medium" in captured.out
+    assert "Model cascade: tiny -> small -> medium (escalate below confidence -0.8" in captured.out
+
+    config_file = temp_speechdown_dir / ".speechdown" / "config.json"
+    with open(config_file, "r") as f:
+        config_data = json.load(f)
+
+    assert config_data["model_cascade"] == ["tiny", "small", "medium"]
+    assert config_data["cascade_min_confidence"] == -0.8
+    assert "cascade_max_compression_ratio" not in config_data
+
+
+def test_config_sets_early_exit(temp_speechdown_dir, capsys):
+    """Test turning on the early exit of the language loop."""
+    result = config(directory=temp_speechdown_dir, early_exit=True, early_exit_confidence=-0.5)
+
+    assert result == 0
+
+    captured = capsys.readouterr()
+    assert "Early exit set to: on" in captured.out
+    assert "Early exit: on (confidence -0.5)" in captured.out
+
+    config_file = temp_speechdown_dir / ".speechdown" / "config.json"
+    with open(config_file, "r") as f:
+        config_data = json.load(f)
+
+    assert config_data["early_exit"] is True
+    assert config_data["early_exit_confidence"] == -0.5
+
+
+def test_config_sets_near_duplicates(temp_speechdown_dir, capsys):
+    """Test turning on near-duplicate detection."""
+    result = config(
+        directory=temp_speechdown_dir, near_duplicates=True, near_duplicate_similarity=0.8
+    )
+
+    assert result == 0
+
+    captured = capsys.readouterr()
+    assert "Near-duplicate detection set to: on" in captured.out
+    assert "Near-duplicate detection: on (similarity 0.8)" in captured.out
+
+    config_file = temp_speechdown_dir / ".speechdown" / "config.json"
+    with open(config_file, "r") as f:
+        config_data = json.load(f)
+
+    assert config_data["near_duplicates"] is True
+    assert config_data["near_duplicate_similarity"] == 0.8
+
+
+def test_config_sets_audio_cache_mb(temp_speechdown_dir, capsys):
+    """Test configuring the size of the decoded audio cache."""
+    result = config(directory=temp_speechdown_dir, audio_cache_mb=512)
+
+    assert result == 0
+
+    captured = capsys.readouterr()
+    assert "Audio cache set to: 512 MB" in captured.out
+    assert "Audio cache: 512 MB" in captured.out
+
+    config_file = temp_speechdown_dir / ".speechdown" / "config.json"
+    with open(config_file, "r") as f:
+        config_data = json.load(f)
+
+    assert config_data["audio_cache_mb"] == 512
+
+
+def test_audio_cache_is_off_by_default(temp_speechdown_dir, capsys):
+    """Test that decoded audio is only cached once a size is configured."""
+    result = config(directory=temp_speechdown_dir)
+
+    assert result == 0
+    assert "Audio cache: off" in capsys.readouterr().out
+
+
+def test_config_sets_scan_threads(temp_speechdown_dir, capsys):
+    """Test configuring concurrent directory listing."""
+    result = config(directory=temp_speechdown_dir, scan_threads=8)
+
+    assert result == 0
+
+    captured = capsys.readouterr()
+    assert "Scan threads set to: 8" in captured.out
+    assert "Scan threads: 8" in captured.out
+
+    config_file = temp_speechdown_dir / ".speechdown" / "config.json"
+    with open(config_file, "r") as f:
+        config_data = json.load(f)
+
+    assert config_data["scan_threads"] == 8
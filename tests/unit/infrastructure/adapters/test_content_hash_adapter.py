@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from speechdown.domain.entities import AudioFile
+from speechdown.domain.value_objects import Timestamp
+from speechdown.infrastructure.adapters.content_hash_adapter import Blake2ContentHashAdapter
+
+
+def _audio_file(path):
+    return AudioFile(path=path, timestamp=Timestamp(datetime(2024, 1, 1)))
+
+
+def test_copies_share_a_hash_and_other_content_does_not(tmp_path):
+    (tmp_path / "a.m4a").write_bytes(b"audio" * 100_000)
+    (tmp_path / "copy of a.m4a").write_bytes(b"audio" * 100_000)
+    (tmp_path / "b.m4a").write_bytes(b"audio" * 100_000 + b"!")
+    adapter = Blake2ContentHashAdapter()
+
+    a, copy, b = (
+        adapter.get_content_hash(_audio_file(tmp_path / name))
+        for name in ["a.m4a", "copy of a.m4a", "b.m4a"]
+    )
+
+    assert a == copy
+    assert a != b
+    assert adapter.get_content_hash(_audio_file(tmp_path / "missing.m4a")) is None
@@ -0,0 +1,146 @@
+from datetime import datetime
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from speechdown.infrastructure.adapters.file_index_adapter import SQLiteFileIndexAdapter
+from speechdown.infrastructure.database import Database
+
+# Old enough that directory mtimes are trusted and files don't count as recent
+PAST = datetime(2024, 1, 1).timestamp()
+
+
+@pytest.fixture
+def index(tmp_path):
+    timestamp_port = Mock()
+    timestamp_port.get_timestamp.return_value = datetime(2024, 1, 1)
+    index = SQLiteFileIndexAdapter(
+        Database(tmp_path / "speechdown.db"), timestamp_port=timestamp_port
+    )
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def archive(tmp_path):
+    root = tmp_path / "archive"
+    for name in ["a.m4a", "notes.txt", "2024/b.mp3", "2024/02/c.wav"]:
+        _write(root / name)
+    _age(root)
+    return root
+
+
+def _write(path, data=b"audio"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    os.utime(path, (PAST, PAST))
+
+
+def _age(root, mtime=PAST):
+    """Backdate all directory mtimes, as for an archive that hasn't changed in a while."""
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, (mtime, mtime))
+
+
+def _names(audio_files, root):
+    return sorted(str(audio_file.path.relative_to(root)) for audio_file in audio_files)
+
+
+def test_first_scan_returns_all_audio_files(index, archive):
+    audio_files = index.collect_changed_audio_files(archive)
+
+    assert _names(audio_files, archive) == ["2024/02/c.wav", "2024/b.mp3", "a.m4a"]
+    assert audio_files[0].file_size == 5
+
+
+def test_committed_scan_returns_nothing_new(index, archive, monkeypatch):
+    index.collect_changed_audio_files(archive)
+    index.commit()
+    scandir = Mock(wraps=os.scandir)
+    monkeypatch.setattr(os, "scandir", scandir)
+
+    assert index.collect_changed_audio_files(archive) == []
+    # Unchanged directories are not listed again
+    scandir.assert_not_called()
+
+
+def test_scan_is_repeated_until_committed(index, archive):
+    index.collect_changed_audio_files(archive)
+
+    assert len(index.collect_changed_audio_files(archive)) == 3
+
+
+def test_files_in_changed_directories_are_returned(index, archive):
+    index.collect_changed_audio_files(archive)
+    index.commit()
+
+    _write(archive / "2024/02/d.ogg")
+    (archive / "2024/b.mp3").rename(archive / "2024/b2.mp3")
+    _age(archive, PAST + 60)
+
+    changed = index.collect_changed_audio_files(archive)
+    assert _names(changed, archive) == ["2024/02/d.ogg", "2024/b2.mp3"]
+
+
+def test_recent_file_growing_in_place_is_returned(index, tmp_path):
+    root = tmp_path / "archive"
+    recording = root / "now.m4a"
+    recording.parent.mkdir()
+    recording.write_bytes(b"partial")
+    _age(root)
+    index.collect_changed_audio_files(root)
+    index.commit()
+
+    with recording.open("ab") as f:
+        f.write(b" and the rest")
+    _age(root)
+
+    assert _names(index.collect_changed_audio_files(root), root) == ["now.m4a"]
+
+
+def test_removed_directory_is_dropped_from_index(index, archive):
+    index.collect_changed_audio_files(archive)
+    index.commit()
+
+    for path in sorted((archive / "2024").rglob("*"), reverse=True):
+        path.unlink() if path.is_file() else path.rmdir()
+    (archive / "2024").rmdir()
+    _age(archive)
+    index.collect_changed_audio_files(archive)
+    index.commit()
+
+    conn = index._connect()
+    directories = [row[0] for row in conn.execute("SELECT path FROM scan_directories")]
+    files = [row[0] for row in conn.execute("SELECT path FROM scan_files")]
+    assert directories == [str(archive)]
+    assert files == [str(archive / "a.m4a")]
+
+
+def test_files_outside_time_range_are_collected_later(index, archive):
+    _write(archive / "new.m4a")
+    os.utime(archive / "new.m4a")
+    _age(archive)
+
+    recent = index.collect_changed_audio_files(archive, start_dt=datetime(2025, 1, 1))
+    index.commit()
+
+    assert _names(recent, archive) == ["new.m4a"]
+    assert _names(index.collect_changed_audio_files(archive), archive) == [
+        "2024/02/c.wav",
+        "2024/b.mp3",
+        "a.m4a",
+    ]
+
+
+def test_relative_paths_match_collected_form(index, archive, monkeypatch):
+    monkeypatch.chdir(archive)
+
+    audio_files = index.collect_changed_audio_files(Path("."))
+
+    assert sorted(str(audio_file.path) for audio_file in audio_files) == [
+        "2024/02/c.wav",
+        "2024/b.mp3",
+        "a.m4a",
+    ]
@@ -145,3 +145,55 @@ def test_output_transcription_results_groups_by_date(tmp_path):
     assert file2.exists()
     assert "one" in file1.read_text()
     assert "two" in file2.read_text()
+
+
+def test_output_transcription_stream_flushes_in_batches(tmp_path):
+    adapter = FileOutputAdapter(MockConfigPort(), flush_every_results=2)
+    day_file = tmp_path / "2025-06-09.md"
+    seen_on_disk = []
+
+    def results():
+        for i in range(5):
+            # Record what was flushed before producing the next result
+            seen_on_disk.append(day_file.read_text().count("## ") if day_file.exists() else 0)
+            ts = datetime(2025, 6, 9, 10, i, 0)
+            audio = AudioFile(path=tmp_path / f"file{i}.m4a", timestamp=ts)
+            yield Transcription(
+                audio_file=audio, text=f"text {i}", language=Language("en"),
+                metrics=TranscriptionMetrics(),
+            )
+
+    written = adapter.output_transcription_stream(results(), path=tmp_path)
+
+    assert written == 5
+    assert seen_on_disk == [0, 0, 2, 2, 4]
+    content = day_file.read_text()
+    assert all(f"text {i}" in content for i in range(5))
+    assert content.count("## ") == 5
+
+
+def test_output_transcription_stream_writes_slow_results_right_away(tmp_path):
+    now = [0.0]
+    adapter = FileOutputAdapter(MockConfigPort(), clock=lambda: now[0])
+    day_file = tmp_path / "2025-06-09.md"
+    seen_on_disk = []
+
+    def results():
+        # Three stored results, a new transcription that takes two minutes, two more
+        for i, seconds in enumerate([0.01, 0.01, 0.01, 120.0, 0.01, 0.01]):
+            seen_on_disk.append(day_file.read_text().count("## ") if day_file.exists() else 0)
+            now[0] += seconds
+            ts = datetime(2025, 6, 9, 10, i, 0)
+            audio = AudioFile(path=tmp_path / f"file{i}.m4a", timestamp=ts)
+            yield Transcription(
+                audio_file=audio, text=f"text {i}", language=Language("en"),
+                metrics=TranscriptionMetrics(),
+            )
+
+    written = adapter.output_transcription_stream(results(), path=tmp_path)
+
+    assert written == 6
+    # The stored results are batched until the new transcription arrives with them
+    assert seen_on_disk == [0, 0, 0, 0, 4, 4]
+    assert day_file.read_text().count("## ") == 6
+
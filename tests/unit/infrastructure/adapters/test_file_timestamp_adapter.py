@@ -1,6 +1,7 @@
 import os
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
@@ -39,3 +40,37 @@ def test_fallback_to_file_mtime(timestamp_adapter, tmp_path):
     file_path = _create_tmp_file(tmp_path, "no_timestamp.m4a", mtime)
     result = timestamp_adapter.get_timestamp(file_path)
     assert result == datetime.fromtimestamp(mtime)
+
+
+def test_latest_match_in_filename_wins(timestamp_adapter):
+    dt = timestamp_adapter._extract_from_filename("20200101_000000 copy of 20240908_102336.m4a")
+    assert dt == datetime(2024, 9, 8, 10, 23, 36)
+
+
+def test_invalid_match_falls_through_to_next_pattern(timestamp_adapter):
+    # The 4-digit year pattern matches "20241399_102336", which has month 13
+    dt = timestamp_adapter._extract_from_filename("20241399_102336 250512_105730.m4a")
+    assert dt == datetime(2025, 5, 12, 10, 57, 30)
+
+
+def test_metadata_timestamp_before_mtime_fallback(tmp_path):
+    metadata_port = Mock()
+    metadata_port.get_metadata_timestamp.return_value = datetime(2024, 9, 8, 10, 23, 36)
+    adapter = FileTimestampAdapter(metadata_port=metadata_port)
+    file_path = _create_tmp_file(tmp_path, "Voice 001.m4a", 1_600_000_000)
+
+    assert adapter.get_timestamp(file_path) == datetime(2024, 9, 8, 10, 23, 36)
+    assert adapter.get_timestamp(tmp_path / "call_20250512_105730.m4a") == datetime(
+        2025, 5, 12, 10, 57, 30
+    )
+    metadata_port.get_metadata_timestamp.assert_called_once()
+
+
+def test_metadata_timestamp_out_of_range_falls_back_to_mtime(tmp_path):
+    metadata_port = Mock()
+    # An unset MP4 creation time read as a real date
+    metadata_port.get_metadata_timestamp.return_value = datetime(1904, 1, 1)
+    adapter = FileTimestampAdapter(metadata_port=metadata_port)
+    file_path = _create_tmp_file(tmp_path, "Voice 002.m4a", 1_600_000_000)
+
+    assert adapter.get_timestamp(file_path) == datetime.fromtimestamp(1_600_000_000)
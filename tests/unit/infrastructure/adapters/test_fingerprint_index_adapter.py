@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import pytest
+
+from speechdown.domain.entities import AudioFile
+from speechdown.domain.value_objects import Timestamp
+from speechdown.infrastructure.adapters.fingerprint_index_adapter import (
+    SQLiteFingerprintIndexAdapter,
+)
+from speechdown.infrastructure.audio_fingerprint import SAMPLE_RATE
+from speechdown.infrastructure.database import Database
+
+np = pytest.importorskip("numpy")
+
+
+def _tones(seconds, seed):
+    """A new random chord every quarter second, fading in and out."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(SAMPLE_RATE // 4) / SAMPLE_RATE
+    chords = []
+    for _ in range(int(seconds * 4)):
+        frequencies = rng.uniform(200, 3000, (6, 1))
+        chords.append(np.sin(2 * np.pi * frequencies * t).sum(axis=0) * np.hanning(len(t)))
+    return np.concatenate(chords).astype(np.float32)
+
+
+def _audio_file(tmp_path, name):
+    return AudioFile(path=tmp_path / name, timestamp=Timestamp(datetime(2024, 1, 1)))
+
+
+@pytest.fixture
+def index(tmp_path):
+    adapter = SQLiteFingerprintIndexAdapter(Database(tmp_path / "speechdown.db"))
+    yield adapter
+    adapter.close()
+
+
+def test_trimmed_quieter_copy_matches_original(tmp_path, index):
+    original = _tones(30, seed=1)
+    index.index_and_match(_audio_file(tmp_path, "note.m4a"), original, 0.75)
+    index.index_and_match(_audio_file(tmp_path, "other.m4a"), _tones(30, seed=2), 0.75)
+
+    rng = np.random.default_rng(3)
+    copy = original[int(0.9 * SAMPLE_RATE) :] * 0.5
+    copy += 0.05 * rng.standard_normal(len(copy)).astype(np.float32)
+    matches = index.index_and_match(_audio_file(tmp_path, "note.wav"), copy, 0.75)
+
+    assert matches == [tmp_path / "note.m4a"]
+
+
+def test_unrelated_recording_has_no_match(tmp_path, index):
+    index.index_and_match(_audio_file(tmp_path, "note.m4a"), _tones(30, seed=1), 0.75)
+
+    assert index.index_and_match(_audio_file(tmp_path, "new.m4a"), _tones(30, seed=2), 0.75) == []
+
+
+def test_reindexed_file_replaces_its_fingerprint(tmp_path, index):
+    audio_file = _audio_file(tmp_path, "note.m4a")
+    index.index_and_match(audio_file, _tones(30, seed=1), 0.75)
+
+    assert index.index_and_match(audio_file, _tones(30, seed=1), 0.75) == []
+    rows = index._connect().execute("SELECT COUNT(*) FROM audio_fingerprints").fetchone()[0]
+    assert rows == 1
+    assert index.index_and_match(_audio_file(tmp_path, "copy.wav"), _tones(30, seed=1), 0.75) == [
+        audio_file.path
+    ]
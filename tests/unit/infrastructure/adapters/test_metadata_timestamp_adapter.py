@@ -0,0 +1,89 @@
+from datetime import datetime
+import os
+
+import pytest
+
+from speechdown.infrastructure.adapters import metadata_timestamp_adapter
+from speechdown.infrastructure.adapters.metadata_timestamp_adapter import (
+    SQLiteMetadataTimestampAdapter,
+)
+from speechdown.infrastructure.database import Database
+
+RECORDED = datetime(2024, 9, 8, 10, 23, 36)
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Record header reads and answer them with RECORDED for m4a files."""
+    calls = []
+
+    def read_recording_time(path):
+        calls.append(path.name)
+        return RECORDED if path.suffix == ".m4a" else None
+
+    monkeypatch.setattr(metadata_timestamp_adapter, "read_recording_time", read_recording_time)
+    return calls
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "speechdown.db"
+
+
+def _lookup(db_path, path):
+    adapter = SQLiteMetadataTimestampAdapter(Database(db_path))
+    try:
+        return adapter.get_metadata_timestamp(path, path.stat())
+    finally:
+        adapter.close()
+
+
+def test_headers_are_read_once_across_runs(tmp_path, db_path, reads):
+    recording = tmp_path / "Voice 001.m4a"
+    recording.write_bytes(b"audio")
+
+    assert _lookup(db_path, recording) == RECORDED
+    assert _lookup(db_path, recording) == RECORDED
+    assert reads == ["Voice 001.m4a"]
+
+
+def test_files_without_metadata_are_remembered(tmp_path, db_path, reads):
+    recording = tmp_path / "Voice 002.wav"
+    recording.write_bytes(b"audio")
+
+    assert _lookup(db_path, recording) is None
+    assert _lookup(db_path, recording) is None
+    assert reads == ["Voice 002.wav"]
+
+
+def test_changed_file_is_read_again(tmp_path, db_path, reads):
+    recording = tmp_path / "Voice 003.m4a"
+    recording.write_bytes(b"audio")
+    _lookup(db_path, recording)
+
+    recording.write_bytes(b"longer audio")
+    os.utime(recording, (1_600_000_000, 1_600_000_000))
+
+    assert _lookup(db_path, recording) == RECORDED
+    assert reads == ["Voice 003.m4a", "Voice 003.m4a"]
+
+
+def test_cached_timestamps_are_written_with_the_next_transaction(tmp_path, db_path, reads):
+    database = Database(db_path)
+    adapter = SQLiteMetadataTimestampAdapter(database)
+    for name in ["Voice 004.m4a", "Voice 005.m4a"]:
+        recording = tmp_path / name
+        recording.write_bytes(b"audio")
+        adapter.get_metadata_timestamp(recording, recording.stat())
+
+    def stored():
+        return database.connection().execute(
+            "SELECT COUNT(*) FROM metadata_timestamps"
+        ).fetchone()[0]
+
+    # Nothing committed per file; the entries join the next unit of work
+    assert stored() == 0
+    with database.transaction():
+        pass
+    assert stored() == 2
+    adapter.close()
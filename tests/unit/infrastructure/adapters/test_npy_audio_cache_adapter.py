@@ -0,0 +1,87 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+import pickle
+
+import pytest
+
+from speechdown.infrastructure.adapters.npy_audio_cache_adapter import NpyAudioCacheAdapter
+
+np = pytest.importorskip("numpy")
+
+# Four seconds of 16 kHz float32 samples
+SECONDS = 4
+AUDIO_BYTES = SECONDS * 16000 * 4
+
+
+def _audio(seed):
+    return np.random.default_rng(seed).standard_normal(SECONDS * 16000).astype(np.float32)
+
+
+def test_cached_audio_is_memory_mapped(tmp_path):
+    cache = NpyAudioCacheAdapter(tmp_path / "cache", max_bytes=10 * AUDIO_BYTES)
+    audio = _audio(1)
+
+    assert cache.load_audio("abc") is None
+    cache.store_audio("abc", audio)
+    cached = cache.load_audio("abc")
+
+    assert isinstance(cached, np.memmap)
+    assert cached.dtype == np.float32 and cached.flags.writeable
+    assert np.array_equal(cached, audio)
+    # Copy-on-write: changing the samples never changes the cached file
+    cached[:] = 0
+    assert np.array_equal(cache.load_audio("abc"), audio)
+
+
+def test_least_recently_used_files_are_evicted(tmp_path):
+    cache = NpyAudioCacheAdapter(tmp_path, max_bytes=int(2.5 * AUDIO_BYTES))
+    cache.store_audio("first", _audio(1))
+    cache.store_audio("second", _audio(2))
+    # "first" becomes the most recently used
+    os.utime(tmp_path / "second.npy", ns=(1, 1))
+    assert cache.load_audio("first") is not None
+
+    cache.store_audio("third", _audio(3))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["first.npy", "third.npy"]
+    assert cache.load_audio("second") is None
+
+
+def test_corrupt_file_is_discarded(tmp_path):
+    cache = NpyAudioCacheAdapter(tmp_path, max_bytes=AUDIO_BYTES * 2)
+    (tmp_path / "abc.npy").write_bytes(b"not numpy")
+
+    assert cache.load_audio("abc") is None
+    assert not (tmp_path / "abc.npy").exists()
+
+
+def test_audio_larger_than_budget_is_not_cached(tmp_path):
+    cache = NpyAudioCacheAdapter(tmp_path, max_bytes=AUDIO_BYTES // 2)
+
+    cache.store_audio("abc", _audio(1))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_concurrent_stores_keep_the_cache_within_budget(tmp_path):
+    cache = NpyAudioCacheAdapter(tmp_path, max_bytes=int(3.5 * AUDIO_BYTES))
+    cache.store_audio("first", _audio(0))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda seed: cache.store_audio(str(seed), _audio(seed)), range(1, 9)))
+
+    on_disk = sum(path.stat().st_size for path in tmp_path.iterdir())
+    assert on_disk <= cache.max_bytes
+    assert cache._total_bytes == on_disk
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_unpickled_cache_has_its_own_lock(tmp_path):
+    cache = NpyAudioCacheAdapter(tmp_path, max_bytes=10 * AUDIO_BYTES)
+
+    copy = pickle.loads(pickle.dumps(cache))
+
+    assert copy == cache
+    assert copy._lock is not cache._lock
+    copy.store_audio("abc", _audio(1))
+    assert cache.load_audio("abc") is not None
@@ -0,0 +1,226 @@
+from datetime import datetime
+import sqlite3
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from speechdown.domain.entities import AudioFile, Transcription
+from speechdown.domain.value_objects import Language, Timestamp, TranscriptionMetrics
+from speechdown.infrastructure.adapters.repository_adapter import SQLiteRepositoryAdapter
+from speechdown.infrastructure.database import Database
+
+
+@pytest.fixture
+def repository(tmp_path):
+    timestamp_port = Mock()
+    timestamp_port.get_timestamp.return_value = datetime(2024, 1, 1)
+    repository = SQLiteRepositoryAdapter(
+        Database(tmp_path / "speechdown.db"), timestamp_port=timestamp_port
+    )
+    yield repository
+    repository.close()
+
+
+def _save(repository, path, language, confidence):
+    repository.save_transcription(
+        Transcription(
+            audio_file=AudioFile(path=Path(path), timestamp=Timestamp(datetime(2024, 1, 1))),
+            text=f"text in {language}",
+            language=Language(language),
+            metrics=TranscriptionMetrics(confidence=confidence),
+            transcription_started_at=datetime(2024, 1, 2),
+        )
+    )
+
+
+def test_language_frequencies_count_best_transcription_per_file(repository):
+    _save(repository, "notes/a.m4a", "en", -0.2)
+    _save(repository, "notes/a.m4a", "uk", -0.6)
+    _save(repository, "notes/b.m4a", "en", -0.9)
+    _save(repository, "notes/b.m4a", "uk", -0.3)
+    _save(repository, "notes/c.m4a", "uk", -0.4)
+    # Files in other directories, including subdirectories, are not counted
+    _save(repository, "notes/old/d.m4a", "ru", -0.1)
+    _save(repository, "notes_backup/e.m4a", "ru", -0.1)
+
+    assert repository.get_language_frequencies(Path("notes")) == {
+        Language("en"): 1,
+        Language("uk"): 2,
+    }
+
+
+def test_language_frequencies_in_current_directory(repository):
+    _save(repository, "a.m4a", "en", -0.2)
+    _save(repository, "notes/b.m4a", "uk", -0.3)
+
+    assert repository.get_language_frequencies(Path(".")) == {Language("en"): 1}
+
+
+def test_get_best_transcriptions_returns_best_row_per_file(repository):
+    _save(repository, "notes/a.m4a", "en", -0.2)
+    _save(repository, "notes/a.m4a", "uk", -0.6)
+    _save(repository, "notes/b.m4a", "en", -0.9)
+    _save(repository, "notes/b.m4a", "uk", -0.3)
+    _save(repository, "notes/other.m4a", "uk", -0.1)
+    audio_files = [
+        AudioFile(path=Path(name), timestamp=Timestamp(datetime(2024, 5, 1)))
+        for name in ["notes/a.m4a", "notes/b.m4a", "notes/new.m4a"]
+    ]
+
+    best = repository.get_best_transcriptions(audio_files)
+
+    assert set(best) == {Path("notes/a.m4a"), Path("notes/b.m4a")}
+    assert best[Path("notes/a.m4a")].language == Language("en")
+    assert best[Path("notes/b.m4a")].language == Language("uk")
+    assert best[Path("notes/b.m4a")].metrics.confidence == -0.3
+    # The given AudioFile is reused instead of extracting its timestamp again
+    assert best[Path("notes/a.m4a")].audio_file is audio_files[0]
+    repository.timestamp_port.get_timestamp.assert_not_called()
+
+
+def test_get_best_transcriptions_matches_single_lookups(repository):
+    _save(repository, "a.m4a", "en", -0.4)
+    _save(repository, "a.m4a", "ru", -0.35)
+    audio_file = AudioFile(path=Path("a.m4a"), timestamp=Timestamp(datetime(2024, 1, 1)))
+
+    single = repository.get_best_transcription(Path("a.m4a"))
+    batched = repository.get_best_transcriptions([audio_file])[Path("a.m4a")]
+
+    assert (batched.text, batched.language, batched.metrics) == (
+        single.text,
+        single.language,
+        single.metrics,
+    )
+
+
+def test_connection_uses_wal_and_is_reused(repository):
+    conn = repository._connect()
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    _save(repository, "a.m4a", "en", -0.2)
+    repository.get_best_transcription(Path("a.m4a"))
+    assert repository._connect() is conn
+
+
+def test_transaction_commits_all_writes_at_once(repository, tmp_path):
+    other = sqlite3.connect(tmp_path / "speechdown.db")
+
+    with repository.transaction():
+        _save(repository, "a.m4a", "en", -0.2)
+        with repository.transaction():
+            _save(repository, "a.m4a", "uk", -0.6)
+        # Nested blocks join the outer transaction, so nothing is visible yet
+        assert other.execute("SELECT COUNT(*) FROM transcriptions").fetchone()[0] == 0
+
+    assert other.execute("SELECT COUNT(*) FROM transcriptions").fetchone()[0] == 2
+    other.close()
+
+
+def test_transaction_rolls_back_on_error(repository):
+    _save(repository, "a.m4a", "en", -0.2)
+
+    with pytest.raises(RuntimeError), repository.transaction():
+        repository.delete_transcriptions(Path("a.m4a"))
+        _save(repository, "b.m4a", "en", -0.3)
+        raise RuntimeError("interrupted")
+
+    assert len(repository.get_transcriptions(Path("a.m4a"))) == 1
+    assert repository.get_transcriptions(Path("b.m4a")) == []
+
+
+def test_get_best_transcriptions_can_be_called_repeatedly(repository):
+    _save(repository, "a.m4a", "en", -0.2)
+    _save(repository, "b.m4a", "en", -0.2)
+    a, b = (
+        AudioFile(path=Path(name), timestamp=Timestamp(datetime(2024, 1, 1)))
+        for name in ["a.m4a", "b.m4a"]
+    )
+
+    assert set(repository.get_best_transcriptions([a])) == {Path("a.m4a")}
+    assert set(repository.get_best_transcriptions([b])) == {Path("b.m4a")}
+
+
+def test_reads_use_stored_timestamp_and_fingerprint(repository):
+    audio_file = AudioFile(
+        path=Path("/unmounted/volume/a.m4a"),
+        timestamp=Timestamp(datetime(2024, 3, 5, 7, 30)),
+        file_size=1234,
+        file_mtime=1709620200.5,
+    )
+    repository.save_transcription(
+        Transcription(
+            audio_file=audio_file,
+            text="hello",
+            language=Language("en"),
+            metrics=TranscriptionMetrics(confidence=-0.2),
+        )
+    )
+
+    stored = repository.get_best_transcription(audio_file.path)
+    [listed] = repository.get_transcriptions(audio_file.path)
+
+    assert stored.audio_file == audio_file
+    assert listed.audio_file == audio_file
+    repository.timestamp_port.get_timestamp.assert_not_called()
+
+
+def test_legacy_rows_get_their_timestamp_extracted_once(repository):
+    _save(repository, "a.m4a", "en", -0.2)
+    repository._connect().execute("UPDATE transcriptions SET audio_timestamp = NULL")
+
+    first = repository.get_best_transcription(Path("a.m4a"))
+    second = repository.get_best_transcription(Path("a.m4a"))
+
+    assert first.audio_file.timestamp == second.audio_file.timestamp == Timestamp(
+        datetime(2024, 1, 1)
+    )
+    repository.timestamp_port.get_timestamp.assert_called_once_with(Path("a.m4a"))
+
+
+def test_legacy_rows_of_one_file_get_one_timestamp_written_back(repository):
+    _save(repository, "a.m4a", "en", -0.2)
+    _save(repository, "a.m4a", "uk", -0.6)
+    repository._connect().execute("UPDATE transcriptions SET audio_timestamp = NULL")
+
+    listed = repository.get_transcriptions(Path("a.m4a"))
+
+    assert len(listed) == 2
+    repository.timestamp_port.get_timestamp.assert_called_once_with(Path("a.m4a"))
+    rows = repository._connect().execute("SELECT audio_timestamp FROM transcriptions")
+    assert [row[0] for row in rows] == ["2024-01-01T00:00:00"] * 2
+
+
+def _save_with_hash(repository, path, content_hash, language, confidence, model_name):
+    repository.save_transcription(
+        Transcription(
+            audio_file=AudioFile(
+                path=Path(path),
+                timestamp=Timestamp(datetime(2024, 1, 1)),
+                content_hash=content_hash,
+            ),
+            text=f"{model_name} text in {language}",
+            language=Language(language),
+            metrics=TranscriptionMetrics(confidence=confidence, model_name=model_name),
+            transcription_started_at=datetime(2024, 1, 2),
+        )
+    )
+
+
+def test_best_transcriptions_by_content_filter_model_and_language(repository):
+    _save_with_hash(repository, "old/a.m4a", "aaa", "en", -0.2, "whisper-tiny")
+    _save_with_hash(repository, "old/a.m4a", "aaa", "uk", -0.5, "whisper-small")
+    _save_with_hash(repository, "old/a.m4a", "aaa", "ru", -0.1, "whisper-small")
+    _save_with_hash(repository, "old/b.m4a", "bbb", "en", -0.3, "whisper-tiny")
+
+    best = repository.get_best_transcriptions_by_content(
+        ["aaa", "bbb", "ccc"], ["whisper-small"], [Language("en"), Language("uk")]
+    )
+
+    assert list(best) == ["aaa"]
+    assert best["aaa"].text == "whisper-small text in uk"
+    assert best["aaa"].audio_file.path == Path("old/a.m4a")
+    assert best["aaa"].audio_file.content_hash == "aaa"
+    any_model = repository.get_best_transcriptions_by_content(["aaa"], [], [Language("en")])
+    assert any_model["aaa"].text == "whisper-tiny text in en"
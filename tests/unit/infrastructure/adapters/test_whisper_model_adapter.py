@@ -15,16 +15,33 @@ def mock_whisper():
         yield mock_whisper, mock_model
 
 
-def test_init_loads_model(mock_whisper):
-    """Test that the adapter loads a whisper model during initialization"""
+def test_init_does_not_load_model(mock_whisper):
+    """Test that the adapter defers loading the whisper model until it is needed"""
     mock_whisper_module, _ = mock_whisper
 
     # Act
     adapter = WhisperModelAdapter(model_name="tiny")
 
+    # Assert
+    mock_whisper_module.load_model.assert_not_called()
+    assert adapter.is_loaded is False
+    assert adapter.load_count == 0
+
+
+def test_model_loaded_once_on_first_transcribe(mock_whisper):
+    """Test that the model is loaded on the first transcribe call and then reused"""
+    mock_whisper_module, mock_model = mock_whisper
+    adapter = WhisperModelAdapter(model_name="tiny")
+
+    # Act
+    adapter.transcribe("first.mp3")
+    adapter.transcribe("second.mp3")
+
     # Assert
     mock_whisper_module.load_model.assert_called_once_with("tiny")
-    assert adapter._model == mock_whisper_module.load_model.return_value
+    assert adapter._model == mock_model
+    assert adapter.is_loaded is True
+    assert adapter.load_count == 1
 
 
 def test_model_name_property(mock_whisper):
@@ -86,3 +103,124 @@ def test_fp16_override(mock_whisper):
 
     # Verify fp16 is passed as True
     mock_model.transcribe.assert_called_once_with("test.mp3", fp16=True)
+
+
+def test_detect_language_restricts_and_normalizes(mock_whisper):
+    """Test that detection probabilities are limited to the candidate languages"""
+    mock_whisper_module, mock_model = mock_whisper
+    mock_model.detect_language.return_value = (None, {"en": 0.6, "uk": 0.2, "de": 0.2})
+
+    adapter = WhisperModelAdapter(model_name="tiny")
+    probs = adapter.detect_language("test.mp3", languages=["en", "uk"])
+
+    mock_whisper_module.load_audio.assert_called_once_with("test.mp3")
+    assert probs == pytest.approx({"en": 0.75, "uk": 0.25})
+
+
+def test_detect_language_unsupported_by_english_only_model(mock_whisper):
+    """Test that English-only models report no detection result"""
+    _, mock_model = mock_whisper
+    mock_model.is_multilingual = False
+
+    adapter = WhisperModelAdapter(model_name="tiny.en")
+
+    assert adapter.detect_language("test.mp3", languages=["en", "uk"]) == {}
+    mock_model.detect_language.assert_not_called()
+
+
+def test_load_audio_does_not_load_model(mock_whisper):
+    """Test that decoding audio uses whisper.load_audio without loading the model"""
+    mock_whisper_module, _ = mock_whisper
+
+    adapter = WhisperModelAdapter(model_name="tiny")
+    samples = adapter.load_audio(Path("test.mp3"))
+
+    mock_whisper_module.load_audio.assert_called_once_with("test.mp3")
+    assert samples == mock_whisper_module.load_audio.return_value
+    assert adapter.is_loaded is False
+
+
+def test_transcribe_and_detect_with_decoded_audio(mock_whisper):
+    """Test that decoded samples are passed to Whisper without decoding the file again"""
+    mock_whisper_module, mock_model = mock_whisper
+    mock_model.detect_language.return_value = (None, {"en": 1.0})
+    samples = object()
+
+    adapter = WhisperModelAdapter(model_name="tiny")
+    adapter.detect_language(samples, languages=["en"])
+    adapter.transcribe(samples, language="en")
+
+    mock_whisper_module.load_audio.assert_not_called()
+    mock_whisper_module.pad_or_trim.assert_called_once_with(samples)
+    mock_model.transcribe.assert_called_once_with(samples, language="en", fp16=False)
+
+
+def test_num_threads_applied_when_model_loads(mock_whisper):
+    """Test that torch threads are limited only once the model is actually loaded"""
+    with patch("speechdown.infrastructure.adapters.whisper_model_adapter.torch") as mock_torch:
+        adapter = WhisperModelAdapter(model_name="tiny", num_threads=4)
+        mock_torch.set_num_threads.assert_not_called()
+
+        adapter.transcribe("test.mp3")
+
+        mock_torch.set_num_threads.assert_called_once_with(4)
+
+
+def _decoding(text, avg_logprob=-0.2, compression_ratio=1.2, no_speech_prob=0.1):
+    return Mock(
+        text=text,
+        language="en",
+        tokens=[1, 2],
+        temperature=0.0,
+        avg_logprob=avg_logprob,
+        compression_ratio=compression_ratio,
+        no_speech_prob=no_speech_prob,
+    )
+
+
+def test_is_batchable_only_for_short_decoded_audio(mock_whisper):
+    """Test that only decoded clips of at most 30 seconds can be batched"""
+    adapter = WhisperModelAdapter(model_name="tiny")
+
+    assert adapter.is_batchable([0.0] * 16000 * 30) is True
+    assert adapter.is_batchable([0.0] * (16000 * 30 + 1)) is False
+    assert adapter.is_batchable("test.mp3") is False
+
+
+def test_transcribe_batch_decodes_clips_together(mock_whisper):
+    """Test that short clips are decoded in one whisper.decode call"""
+    mock_whisper_module, mock_model = mock_whisper
+    mock_whisper_module.decode.return_value = [_decoding("first"), _decoding("second")]
+    clips = [[0.0] * 16000, [0.0] * 8000]
+
+    with patch("speechdown.infrastructure.adapters.whisper_model_adapter.torch") as mock_torch:
+        adapter = WhisperModelAdapter(model_name="tiny")
+        results = adapter.transcribe_batch(clips, language="en")
+
+    assert mock_torch.stack.call_count == 1
+    assert mock_whisper_module.decode.call_count == 1
+    mock_whisper_module.DecodingOptions.assert_called_once_with(
+        language="en", fp16=False, without_timestamps=True
+    )
+    mock_model.transcribe.assert_not_called()
+    assert [result["text"] for result in results] == ["first", "second"]
+    assert [result["segments"][0]["end"] for result in results] == [1.0, 0.5]
+
+
+def test_transcribe_batch_falls_back_for_low_quality_clips(mock_whisper):
+    """Test that clips failing Whisper's thresholds are transcribed alone or dropped as silence"""
+    mock_whisper_module, mock_model = mock_whisper
+    mock_whisper_module.decode.return_value = [
+        _decoding("la la la la", compression_ratio=3.0),
+        _decoding("", avg_logprob=-1.5, no_speech_prob=0.9),
+    ]
+    mock_model.transcribe.return_value = {"text": "la", "language": "en", "segments": []}
+    clips = [[0.0] * 16000, [0.0] * 16000]
+
+    with patch("speechdown.infrastructure.adapters.whisper_model_adapter.torch"):
+        adapter = WhisperModelAdapter(model_name="tiny")
+        results = adapter.transcribe_batch(clips, language="en")
+
+    mock_model.transcribe.assert_called_once_with(clips[0], language="en", fp16=False)
+    assert results[0]["text"] == "la"
+    assert results[1] == {"text": "", "language": "en", "segments": []}
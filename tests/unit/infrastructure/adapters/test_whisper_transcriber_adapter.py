@@ -175,3 +175,153 @@ def test_extract_metrics_empty_segments(mock_transcription_model):
     assert metrics.words_per_second is None
     assert metrics.additional_metrics["segments_count"] == 0
     assert metrics.additional_metrics["temperature"] is None
+
+
+def test_detect_language(mock_transcription_model, sample_audio_file):
+    """Test that detection results are mapped back to Language objects"""
+    # Arrange
+    mock_transcription_model.detect_language.return_value = {"en": 0.7, "uk": 0.3}
+    adapter = WhisperTranscriberAdapter(model=mock_transcription_model)
+
+    # Act
+    probs = adapter.detect_language(sample_audio_file, [Language("en"), Language("uk")])
+
+    # Assert
+    mock_transcription_model.detect_language.assert_called_once_with(
+        str(sample_audio_file.path), languages=["en", "uk"]
+    )
+    assert probs == {Language("en"): 0.7, Language("uk"): 0.3}
+
+
+def test_transcribe_with_decoded_audio(
+    mock_transcription_model, sample_audio_file, sample_transcription_result
+):
+    """Test that samples from load_audio are passed to the model instead of the path"""
+    # Arrange
+    mock_transcription_model.transcribe.return_value = sample_transcription_result
+    adapter = WhisperTranscriberAdapter(model=mock_transcription_model)
+
+    # Act
+    audio = adapter.load_audio(sample_audio_file)
+    adapter.transcribe(sample_audio_file, Language("en"), audio=audio)
+
+    # Assert
+    mock_transcription_model.load_audio.assert_called_once_with(str(sample_audio_file.path))
+    mock_transcription_model.transcribe.assert_called_once_with(
+        mock_transcription_model.load_audio.return_value, language="en"
+    )
+
+
+def test_load_audio_uses_cache_by_content_hash(mock_transcription_model, sample_audio_file):
+    """Test that decoded audio is cached by content hash and decoded only on a miss"""
+    cached = {}
+    audio_cache = Mock()
+    audio_cache.load_audio.side_effect = cached.get
+    audio_cache.store_audio.side_effect = cached.__setitem__
+    adapter = WhisperTranscriberAdapter(model=mock_transcription_model, audio_cache=audio_cache)
+    sample_audio_file.content_hash = "abc"
+
+    first = adapter.load_audio(sample_audio_file)
+    second = adapter.load_audio(sample_audio_file)
+
+    assert first is second is mock_transcription_model.load_audio.return_value
+    mock_transcription_model.load_audio.assert_called_once_with(str(sample_audio_file.path))
+    audio_cache.store_audio.assert_called_once_with("abc", first)
+
+
+def test_transcribe_batch_splits_long_files_out(
+    mock_transcription_model, sample_audio_file, sample_transcription_result
+):
+    """Test that short clips share one batch call and long files are transcribed alone"""
+    # Arrange
+    other_file = AudioFile(path=Path("/fake/path/long.mp3"), timestamp=sample_audio_file.timestamp)
+    third_file = AudioFile(path=Path("/fake/path/other.mp3"), timestamp=sample_audio_file.timestamp)
+    mock_transcription_model.is_batchable.side_effect = lambda audio: audio != "long"
+    mock_transcription_model.transcribe.return_value = sample_transcription_result
+    mock_transcription_model.transcribe_batch.return_value = [
+        sample_transcription_result,
+        {**sample_transcription_result, "text": "Third."},
+    ]
+    adapter = WhisperTranscriberAdapter(model=mock_transcription_model)
+
+    # Act
+    transcriptions = adapter.transcribe_batch(
+        [sample_audio_file, other_file, third_file], Language("en"), ["short", "long", "tiny"]
+    )
+
+    # Assert
+    mock_transcription_model.transcribe_batch.assert_called_once_with(
+        ["short", "tiny"], language="en"
+    )
+    mock_transcription_model.transcribe.assert_called_once_with("long", language="en")
+    assert [t.audio_file for t in transcriptions] == [sample_audio_file, other_file, third_file]
+    assert transcriptions[2].text == "Third."
+    assert transcriptions[0].metrics.additional_metrics["batch_size"] == 2
+    assert transcriptions[0].metrics.confidence == pytest.approx(-0.55)
+
+
+def test_transcribe_with_trimmed_silence(
+    mock_transcription_model, sample_audio_file, sample_transcription_result, monkeypatch
+):
+    """Test that trimmed audio is transcribed and timestamps map back to the original file"""
+    # Arrange
+    trimmed = whisper_transcriber_adapter.TrimmedAudio(
+        audio="speech only", trimmed_seconds=4.0, offsets=[(0.0, 1.0), (5.0, 9.0)]
+    )
+    monkeypatch.setattr(whisper_transcriber_adapter, "trim_silence", lambda audio: trimmed)
+    mock_transcription_model.transcribe.return_value = sample_transcription_result
+    adapter = WhisperTranscriberAdapter(model=mock_transcription_model, trim_silence=True)
+
+    # Act
+    transcription = adapter.transcribe(sample_audio_file, Language("en"), audio="decoded")
+
+    # Assert
+    mock_transcription_model.transcribe.assert_called_once_with("speech only", language="en")
+    assert transcription.metrics.additional_metrics["trimmed_seconds"] == 4.0
+    # The last segment ends at 10.5 s of trimmed audio, i.e. 14.5 s into the file
+    assert transcription.metrics.audio_duration_seconds == 14.5
+
+
+def test_stitch_transcriptions_weights_metrics_by_chunk_duration(
+    mock_transcription_model, sample_audio_file
+):
+    """Test that chunk transcriptions are joined with duration-weighted metrics"""
+    # Arrange
+    def part(text, confidence, duration, started_at):
+        return Transcription(
+            audio_file=sample_audio_file,
+            text=text,
+            language=Language("en"),
+            metrics=TranscriptionMetrics(
+                model_name="mock-model",
+                transcription_time_seconds=2.0,
+                confidence=confidence,
+                avg_logprob_mean=confidence,
+                audio_duration_seconds=duration,
+                word_count=len(text.split()),
+                additional_metrics={"segments_count": 3},
+            ),
+            transcription_started_at=started_at,
+        )
+
+    parts = [
+        part(" First chunk here.", -0.2, 179.5, datetime(2024, 1, 1, 10, 0, 1)),
+        part(" And the tail.", -0.8, 58.0, datetime(2024, 1, 1, 10, 0, 0)),
+    ]
+    # 3 minutes and 1 minute of 16 kHz samples
+    chunks = [[0.0] * 16000 * 180, [0.0] * 16000 * 60]
+    adapter = WhisperTranscriberAdapter(model=mock_transcription_model)
+
+    # Act
+    stitched = adapter.stitch_transcriptions(sample_audio_file, parts, chunks)
+
+    # Assert
+    assert stitched.text == "First chunk here. And the tail."
+    assert stitched.metrics.confidence == pytest.approx(-0.35)
+    assert stitched.metrics.avg_logprob_mean == pytest.approx(-0.35)
+    assert stitched.metrics.audio_duration_seconds == 238.0
+    assert stitched.metrics.word_count == 6
+    assert stitched.metrics.transcription_time_seconds == 4.0
+    assert stitched.metrics.additional_metrics["chunks_count"] == 2
+    assert stitched.metrics.additional_metrics["segments_count"] == 6
+    assert stitched.transcription_started_at == datetime(2024, 1, 1, 10, 0, 0)
@@ -0,0 +1,71 @@
+import pytest
+
+from speechdown.infrastructure.audio_fingerprint import (
+    SAMPLE_RATE,
+    compute_fingerprint,
+    fingerprint_similarity,
+    values_from_bytes,
+    values_to_bytes,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def _voice(seconds, seed):
+    """Speech-like audio: syllables of harmonic tones with varying pitch, and pauses."""
+    rng = np.random.default_rng(seed)
+    syllables = []
+    while sum(len(s) for s in syllables) < seconds * SAMPLE_RATE:
+        t = np.arange(int(rng.uniform(0.1, 0.4) * SAMPLE_RATE)) / SAMPLE_RATE
+        pitch = rng.uniform(90, 250)
+        harmonics = np.arange(1, 25)[:, None]
+        amplitudes = rng.uniform(0, 1, (24, 1)) / harmonics
+        syllable = (amplitudes * np.sin(2 * np.pi * pitch * harmonics * t)).sum(axis=0)
+        syllables.append(syllable * np.hanning(len(t)) * (rng.random() > 0.2))
+    audio = np.concatenate(syllables)[: int(seconds * SAMPLE_RATE)]
+    return (audio + 0.01 * rng.standard_normal(len(audio))).astype(np.float32)
+
+
+def _reencode(audio, seed):
+    """Lossy copy: low-passed, quieter and with added noise."""
+    rng = np.random.default_rng(seed)
+    filtered = np.convolve(audio, np.ones(3) / 3, mode="same") * 0.7
+    return (filtered + 0.02 * rng.standard_normal(len(audio))).astype(np.float32)
+
+
+def test_reencoded_and_trimmed_copy_is_similar():
+    original = _voice(40, seed=1)
+    # Trimmed by a length that is not a multiple of the hop
+    copy = _reencode(original[int(1.23 * SAMPLE_RATE) :], seed=2)
+    first, second = compute_fingerprint(original), compute_fingerprint(copy)
+
+    # Frame i of the copy lines up with frame i + 19 of the original
+    best = max(fingerprint_similarity(second, first, offset) for offset in range(30))
+
+    assert best > 0.8
+    assert fingerprint_similarity(second, first, 0) < 0.6
+
+
+def test_unrelated_recordings_are_not_similar():
+    first, second = compute_fingerprint(_voice(40, seed=1)), compute_fingerprint(_voice(40, 3))
+
+    assert max(fingerprint_similarity(first, second, offset) for offset in range(-5, 6)) < 0.6
+
+
+def test_excerpt_of_long_recording_is_not_a_near_duplicate():
+    original = _voice(60, seed=1)
+    excerpt = compute_fingerprint(original[: 20 * SAMPLE_RATE])
+
+    assert fingerprint_similarity(excerpt, compute_fingerprint(original), 0) == 0.0
+
+
+def test_short_audio_has_no_fingerprint():
+    assert compute_fingerprint(np.zeros(SAMPLE_RATE // 4, dtype=np.float32)) is None
+
+
+def test_values_round_trip_through_bytes():
+    fingerprint = compute_fingerprint(_voice(5, seed=1))
+    data = values_to_bytes(fingerprint.values)
+
+    assert len(data) == 4 * len(fingerprint.values)
+    assert np.array_equal(values_from_bytes(data), fingerprint.values)
@@ -0,0 +1,156 @@
+import struct
+from datetime import datetime, timezone
+
+from speechdown.infrastructure.audio_metadata import MP4_EPOCH, read_recording_time
+
+RECORDED = datetime(2024, 9, 8, 10, 23, 36)
+
+
+def _box(kind: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def _chunk(chunk_id: bytes, payload: bytes) -> bytes:
+    padding = b"\x00" if len(payload) % 2 else b""
+    return struct.pack("<4sI", chunk_id, len(payload)) + payload + padding
+
+
+def _syncsafe(value: int) -> bytes:
+    return bytes((value >> shift) & 0x7F for shift in (21, 14, 7, 0))
+
+
+def _id3_frame(frame_id: bytes, text: str, version: int) -> bytes:
+    data = b"\x03" + text.encode()
+    size = _syncsafe(len(data)) if version == 4 else struct.pack(">I", len(data))
+    return frame_id + size + b"\x00\x00" + data
+
+
+def _id3_tag(frames: bytes, version: int) -> bytes:
+    body = frames + b"\x00" * 32
+    return b"ID3" + bytes((version, 0, 0)) + _syncsafe(len(body)) + body + b"\xff\xfb" * 64
+
+
+def _vorbis_comments(*comments: str) -> bytes:
+    vendor = b"test encoder"
+    data = struct.pack("<I", len(vendor)) + vendor + struct.pack("<I", len(comments))
+    for comment in comments:
+        data += struct.pack("<I", len(comment.encode())) + comment.encode()
+    return data
+
+
+def _ogg_page(packet: bytes, sequence: int) -> bytes:
+    lacing = bytes([255] * (len(packet) // 255) + [len(packet) % 255])
+    header = struct.pack("<4sBBqIIIB", b"OggS", 0, 0, 0, 1, sequence, 0, len(lacing))
+    return header + lacing + packet
+
+
+def test_mp4_creation_time_is_read_after_media_data(tmp_path):
+    recorded_utc = datetime(2024, 9, 8, 8, 23, 36, tzinfo=timezone.utc)
+    seconds = int((recorded_utc - MP4_EPOCH).total_seconds())
+    mvhd = _box(b"mvhd", b"\x00\x00\x00\x00" + struct.pack(">II", seconds, seconds) + bytes(88))
+    path = tmp_path / "Voice 001.m4a"
+    path.write_bytes(
+        _box(b"ftyp", b"M4A \x00\x00\x00\x00isom")
+        + _box(b"mdat", bytes(4096))
+        + _box(b"moov", mvhd)
+    )
+
+    assert read_recording_time(path) == recorded_utc.astimezone().replace(tzinfo=None)
+
+
+def test_mp4_without_creation_time(tmp_path):
+    mvhd = _box(b"mvhd", bytes(100))
+    path = tmp_path / "Voice 002.m4a"
+    path.write_bytes(_box(b"ftyp", b"M4A \x00\x00\x00\x00") + _box(b"moov", mvhd))
+
+    assert read_recording_time(path) is None
+
+
+def test_wav_bext_origination_time(tmp_path):
+    bext = bytes(320) + b"2024-09-08" + b"10:23:36" + bytes(602 - 338)
+    path = tmp_path / "TAKE_01.wav"
+    path.write_bytes(
+        b"RIFF\x00\x00\x00\x00WAVE"
+        + _chunk(b"fmt ", bytes(16))
+        + _chunk(b"bext", bext)
+        + _chunk(b"data", bytes(1000))
+    )
+
+    assert read_recording_time(path) == RECORDED
+
+
+def test_wav_without_bext(tmp_path):
+    path = tmp_path / "plain.wav"
+    path.write_bytes(b"RIFF\x00\x00\x00\x00WAVE" + _chunk(b"fmt ", bytes(16)))
+
+    assert read_recording_time(path) is None
+
+
+def test_id3v24_recording_time(tmp_path):
+    frames = _id3_frame(b"TIT2", "Memo", 4) + _id3_frame(b"TDRC", "2024-09-08T10:23:36", 4)
+    path = tmp_path / "memo.mp3"
+    path.write_bytes(_id3_tag(frames, 4))
+
+    assert read_recording_time(path) == RECORDED
+
+
+def test_id3v23_year_date_and_time_frames(tmp_path):
+    frames = (
+        _id3_frame(b"TYER", "2024", 3)
+        + _id3_frame(b"TDAT", "0809", 3)
+        + _id3_frame(b"TIME", "1023", 3)
+    )
+    path = tmp_path / "memo.mp3"
+    path.write_bytes(_id3_tag(frames, 3))
+
+    assert read_recording_time(path) == datetime(2024, 9, 8, 10, 23)
+
+
+def test_id3_year_only_is_ignored(tmp_path):
+    path = tmp_path / "memo.mp3"
+    path.write_bytes(_id3_tag(_id3_frame(b"TDRC", "2024", 4), 4))
+
+    assert read_recording_time(path) is None
+
+
+def test_flac_vorbis_comment(tmp_path):
+    comments = _vorbis_comments("TITLE=Memo", "DATE=2024-09-08T10:23:36")
+    path = tmp_path / "memo.flac"
+    path.write_bytes(
+        b"fLaC"
+        + bytes([0]) + (34).to_bytes(3, "big") + bytes(34)
+        + bytes([0x80 | 4]) + len(comments).to_bytes(3, "big") + comments
+    )
+
+    assert read_recording_time(path) == RECORDED
+
+
+def test_opus_tags(tmp_path):
+    path = tmp_path / "memo.opus"
+    path.write_bytes(
+        _ogg_page(b"OpusHead" + bytes(11), 0)
+        + _ogg_page(b"OpusTags" + _vorbis_comments("date=2024-09-08 10:23:36"), 1)
+    )
+
+    assert read_recording_time(path) == RECORDED
+
+
+def test_vorbis_date_without_time_is_ignored(tmp_path):
+    path = tmp_path / "memo.ogg"
+    path.write_bytes(
+        _ogg_page(b"\x01vorbis" + bytes(23), 0)
+        + _ogg_page(b"\x03vorbis" + _vorbis_comments("DATE=2024-09-08"), 1)
+    )
+
+    assert read_recording_time(path) is None
+
+
+def test_truncated_and_unknown_files(tmp_path):
+    truncated = tmp_path / "cut.m4a"
+    truncated.write_bytes(_box(b"ftyp", b"M4A \x00\x00\x00\x00") + b"\x00\x00\x01\x00moov")
+    unknown = tmp_path / "noise.webm"
+    unknown.write_bytes(b"\x1a\x45\xdf\xa3" + bytes(64))
+
+    assert read_recording_time(truncated) is None
+    assert read_recording_time(unknown) is None
+    assert read_recording_time(tmp_path / "missing.m4a") is None
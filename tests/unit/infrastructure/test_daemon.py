@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+
+from speechdown.infrastructure import daemon
+from speechdown.infrastructure.daemon import DaemonClient, DaemonServer
+
+pytestmark = pytest.mark.skipif(not daemon.is_supported(), reason="requires Unix sockets")
+
+
+@pytest.fixture
+def running_server(tmp_path):
+    requests = []
+
+    def handle(request):
+        requests.append(request)
+        if request.get("command") == "fail":
+            raise ValueError("boom")
+        return {"status": "ok", "echo": request}
+
+    server = DaemonServer(tmp_path / "sd.sock", handle)
+    server.start()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, requests
+    server.shutdown()
+    thread.join()
+    server.close()
+
+
+def test_client_returns_none_without_daemon(tmp_path):
+    client = DaemonClient(tmp_path / "sd.sock")
+
+    assert client.request({"command": "ping"}) is None
+    assert client.ping() is False
+
+
+def test_request_round_trip(running_server):
+    server, requests = running_server
+    client = DaemonClient(server.socket_path)
+
+    response = client.request({"command": "transcribe", "directory": "."})
+
+    assert response == {"status": "ok", "echo": {"command": "transcribe", "directory": "."}}
+    assert requests == [{"command": "transcribe", "directory": "."}]
+
+
+def test_handler_errors_are_returned(running_server):
+    server, _ = running_server
+
+    response = DaemonClient(server.socket_path).request({"command": "fail"})
+
+    assert response == {"status": "error", "message": "boom"}
+
+
+def test_start_refuses_second_daemon(running_server):
+    server, _ = running_server
+
+    with pytest.raises(RuntimeError):
+        DaemonServer(server.socket_path, lambda request: {}).start()
+
+
+def test_start_removes_stale_socket(tmp_path):
+    socket_path = tmp_path / "sd.sock"
+    socket_path.touch()
+    server = DaemonServer(socket_path, lambda request: {"status": "ok"})
+
+    server.start()
+    server.close()
+
+    assert not socket_path.exists()
@@ -0,0 +1,149 @@
+import sqlite3
+
+import pytest
+
+from speechdown.infrastructure.database import (
+    SCHEMA_VERSION,
+    Database,
+    get_schema_version,
+    initialize_database,
+    migrate,
+)
+
+
+def _columns(conn):
+    return [row[1] for row in conn.execute("PRAGMA table_info(transcriptions)")]
+
+
+def _indexes(conn):
+    return {row[1] for row in conn.execute("PRAGMA index_list(transcriptions)")}
+
+
+def test_new_database_is_created_at_current_version(tmp_path):
+    db_path = tmp_path / "speechdown.db"
+
+    assert initialize_database(db_path) == 0
+
+    with sqlite3.connect(db_path) as conn:
+        assert get_schema_version(conn) == SCHEMA_VERSION
+        assert "transcription_started_at" in _columns(conn)
+        assert {
+            "idx_transcriptions_path_confidence",
+            "idx_transcriptions_started_at",
+        } <= _indexes(conn)
+
+
+def test_unversioned_database_is_upgraded_in_place(tmp_path):
+    db_path = tmp_path / "speechdown.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE transcriptions (id INTEGER PRIMARY KEY, path TEXT NOT NULL, "
+            "confidence REAL, created_at TIMESTAMP)"
+        )
+        conn.execute(
+            "INSERT INTO transcriptions (path, confidence, created_at) "
+            "VALUES ('a.m4a', -0.3, '2025-06-01 10:00:00')"
+        )
+
+    assert initialize_database(db_path) == 0
+
+    with sqlite3.connect(db_path) as conn:
+        assert get_schema_version(conn) == SCHEMA_VERSION
+        assert "created_at" not in _columns(conn)
+        rows = conn.execute("SELECT path, transcription_started_at FROM transcriptions")
+        assert rows.fetchall() == [("a.m4a", "2025-06-01 10:00:00")]
+
+
+def test_directory_of_existing_transcriptions_is_filled_in(tmp_path):
+    conn = sqlite3.connect(tmp_path / "speechdown.db")
+    migrate(conn)
+    conn.execute("PRAGMA user_version = 7")
+    conn.execute("DROP INDEX idx_transcriptions_directory")
+    conn.execute("ALTER TABLE transcriptions DROP COLUMN directory")
+    conn.execute("INSERT INTO transcriptions (path) VALUES ('a.m4a'), ('notes/b.m4a')")
+    conn.commit()
+
+    assert migrate(conn) == 7
+
+    rows = conn.execute("SELECT path, directory FROM transcriptions ORDER BY path")
+    assert rows.fetchall() == [("a.m4a", "."), ("notes/b.m4a", "notes")]
+    conn.close()
+
+
+def test_migrating_an_up_to_date_database_does_nothing(tmp_path):
+    db_path = tmp_path / "speechdown.db"
+    initialize_database(db_path)
+
+    assert initialize_database(db_path) == SCHEMA_VERSION
+
+
+def test_best_transcription_lookup_uses_index(tmp_path):
+    conn = sqlite3.connect(tmp_path / "speechdown.db")
+    migrate(conn)
+
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM transcriptions WHERE path = ? "
+        "ORDER BY confidence DESC LIMIT 1",
+        ("a.m4a",),
+    ).fetchall()
+    conn.close()
+
+    assert "idx_transcriptions_path_confidence" in " ".join(str(row[-1]) for row in plan)
+
+
+def test_database_from_newer_version_is_rejected(tmp_path):
+    conn = sqlite3.connect(tmp_path / "speechdown.db")
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+
+    with pytest.raises(sqlite3.DatabaseError, match="newer"):
+        migrate(conn)
+    conn.close()
+
+
+def test_language_frequencies_lookup_uses_index(tmp_path):
+    conn = sqlite3.connect(tmp_path / "speechdown.db")
+    migrate(conn)
+
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT path, language_code FROM transcriptions WHERE directory = ? "
+        "ORDER BY path, confidence DESC",
+        ("notes",),
+    ).fetchall()
+    conn.close()
+
+    assert "idx_transcriptions_directory" in " ".join(str(row[-1]) for row in plan)
+
+
+def test_deferred_writes_join_the_next_transaction(tmp_path):
+    database = Database(tmp_path / "speechdown.db")
+    migrate(database.connection())
+    other = sqlite3.connect(tmp_path / "speechdown.db")
+
+    for path in ["a.m4a", "b.m4a"]:
+        database.defer(
+            "INSERT INTO metadata_timestamps (path, size, mtime_ns) VALUES (?, 1, 1)", (path,)
+        )
+    assert other.execute("SELECT COUNT(*) FROM metadata_timestamps").fetchone()[0] == 0
+
+    with database.transaction():
+        database.connection().execute("INSERT INTO transcriptions (path) VALUES ('a.m4a')")
+    assert other.execute("SELECT COUNT(*) FROM metadata_timestamps").fetchone()[0] == 2
+
+    database.defer(
+        "INSERT INTO metadata_timestamps (path, size, mtime_ns) VALUES (?, 1, 1)", ("c.m4a",)
+    )
+    database.close()
+    assert other.execute("SELECT COUNT(*) FROM metadata_timestamps").fetchone()[0] == 3
+    other.close()
+
+
+def test_failed_deferred_write_does_not_roll_back_the_transaction(tmp_path):
+    database = Database(tmp_path / "speechdown.db")
+    migrate(database.connection())
+    database.defer("INSERT INTO missing_table (path) VALUES (?)", ("a.m4a",))
+
+    with database.transaction():
+        database.connection().execute("INSERT INTO transcriptions (path) VALUES ('a.m4a')")
+
+    assert database.connection().execute("SELECT COUNT(*) FROM transcriptions").fetchone()[0] == 1
+    database.close()
@@ -0,0 +1,104 @@
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from speechdown.infrastructure.adapters.audio_file_adapter import AudioFileAdapter
+from speechdown.infrastructure.file_walker import (
+    IgnoreRules,
+    is_audio_file_name,
+    walk_audio_files,
+)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for name in [
+        "a.m4a",
+        "notes.txt",
+        "._a.m4a",
+        "2024/b.mp3",
+        "2024/drafts/c.wav",
+        "2024/d.tmp.m4a",
+        "archive/old/e.ogg",
+        ".speechdown/cache/f.m4a",
+        ".git/g.m4a",
+        "node_modules/pkg/h.mp3",
+        "transcripts/i.m4a",
+    ]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"audio")
+    return tmp_path
+
+
+def _walk(root, rules=None, threads=1):
+    paths = [path for path, _ in walk_audio_files(root, rules, threads)]
+    return sorted(str(Path(path).relative_to(root)) for path in paths)
+
+
+def test_is_audio_file_name():
+    assert is_audio_file_name("memo.M4A")
+    assert not is_audio_file_name("._memo.m4a")
+    assert not is_audio_file_name("notes.txt")
+
+
+def test_walk_prunes_hidden_and_tool_directories(tree):
+    rules = IgnoreRules.load(tree, excluded_paths=[tree / "transcripts"])
+
+    assert _walk(tree, rules) == [
+        "2024/b.mp3",
+        "2024/d.tmp.m4a",
+        "2024/drafts/c.wav",
+        "a.m4a",
+        "archive/old/e.ogg",
+    ]
+
+
+def test_walk_honours_sdignore(tree):
+    (tree / ".sdignore").write_text("# scratch recordings\n*.tmp.m4a\ndrafts/\n\narchive/old\n")
+
+    assert _walk(tree, IgnoreRules.load(tree, [tree / "transcripts"])) == [
+        "2024/b.mp3",
+        "a.m4a",
+    ]
+
+
+def test_directory_only_pattern_does_not_match_files(tree):
+    (tree / ".sdignore").write_text("a.m4a/\n")
+
+    assert "a.m4a" in _walk(tree)
+
+
+def test_threaded_walk_finds_the_same_files(tree):
+    rules = IgnoreRules.load(tree)
+
+    assert _walk(tree, rules, threads=4) == _walk(tree, rules)
+
+
+def test_walk_from_current_directory_gives_relative_paths(tree, monkeypatch):
+    monkeypatch.chdir(tree)
+
+    paths = sorted(path for path, _ in walk_audio_files(Path(".")))
+
+    assert "2024/b.mp3" in paths
+    assert "a.m4a" in paths
+
+
+def test_collect_audio_files_uses_walker_stat(tree):
+    timestamp_port = Mock()
+    timestamp_port.get_timestamp.return_value = datetime(2024, 1, 1)
+    adapter = AudioFileAdapter(timestamp_port, excluded_directories=[tree / "transcripts"])
+
+    audio_files = adapter.collect_audio_files(tree)
+
+    assert [audio_file.path.name for audio_file in audio_files] == [
+        "b.mp3",
+        "d.tmp.m4a",
+        "c.wav",
+        "a.m4a",
+        "e.ogg",
+    ]
+    assert all(audio_file.file_size == 5 for audio_file in audio_files)
+    assert adapter.collect_audio_files(tree, start_dt=datetime(2100, 1, 1)) == []
@@ -0,0 +1,114 @@
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from speechdown.infrastructure import inotify
+from speechdown.infrastructure.file_watcher import DirectoryWatcher, PendingFiles
+from speechdown.infrastructure.file_walker import IgnoreRules
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _pending_files(sizes):
+    clock = FakeClock()
+
+    def stat(path):
+        if path not in sizes:
+            raise FileNotFoundError(path)
+        return SimpleNamespace(st_size=sizes[path], st_mtime_ns=0)
+
+    return PendingFiles(quiet_seconds=2.0, clock=clock, stat=stat), clock
+
+
+def test_file_is_complete_after_two_quiet_checks_with_same_size():
+    sizes = {"a.m4a": 100}
+    pending, clock = _pending_files(sizes)
+    pending.touch("a.m4a")
+
+    clock.now = 1.0
+    assert pending.pop_completed() == []
+    clock.now = 2.0
+    assert pending.pop_completed() == []  # first check only takes a snapshot
+    assert pending.next_timeout() == 2.0
+    clock.now = 4.0
+    assert pending.pop_completed() == ["a.m4a"]
+    assert pending.next_timeout() is None
+
+
+def test_growing_file_is_not_complete():
+    sizes = {"a.m4a": 100}
+    pending, clock = _pending_files(sizes)
+    pending.touch("a.m4a")
+
+    clock.now = 2.0
+    pending.pop_completed()
+    sizes["a.m4a"] = 200
+    clock.now = 4.0
+    assert pending.pop_completed() == []
+    clock.now = 6.0
+    assert pending.pop_completed() == ["a.m4a"]
+
+
+def test_events_postpone_the_check_and_deleted_files_are_dropped():
+    sizes = {"a.m4a": 100}
+    pending, clock = _pending_files(sizes)
+    pending.touch("a.m4a")
+    pending.touch("b.m4a")
+
+    clock.now = 1.5
+    pending.touch("a.m4a")
+    clock.now = 2.0
+    assert pending.pop_completed() == []
+    assert pending.next_timeout() == 1.5
+    clock.now = 3.5
+    pending.pop_completed()
+    clock.now = 5.5
+    assert pending.pop_completed() == ["a.m4a"]
+
+
+needs_inotify = pytest.mark.skipif(not inotify.is_supported(), reason="requires Linux inotify")
+
+
+def _wait_for_files(watcher, expected_count=1, timeout=5.0):
+    found = []
+    deadline = time.monotonic() + timeout
+    while len(found) < expected_count and time.monotonic() < deadline:
+        found.extend(watcher.poll(timeout=0.1))
+    return found
+
+
+@needs_inotify
+def test_watcher_reports_new_audio_files(tmp_path):
+    (tmp_path / "transcripts").mkdir()
+    rules = IgnoreRules.load(tmp_path, [tmp_path / "transcripts"])
+    with DirectoryWatcher(tmp_path, rules, quiet_seconds=0.05) as watcher:
+        (tmp_path / "notes.txt").write_text("not audio")
+        (tmp_path / "transcripts" / "ignored.m4a").write_bytes(b"x")
+        (tmp_path / "memo.m4a").write_bytes(b"audio")
+
+        found = _wait_for_files(watcher)
+
+    assert found == [tmp_path / "memo.m4a"]
+
+
+@needs_inotify
+def test_watcher_follows_new_directories_and_renames(tmp_path):
+    with DirectoryWatcher(tmp_path, quiet_seconds=0.05) as watcher:
+        recordings = tmp_path / "2024" / "05"
+        recordings.mkdir(parents=True)
+        (recordings / "a.m4a").write_bytes(b"audio")
+        partial = tmp_path / "b.m4a.part"
+        partial.write_bytes(b"audio")
+        os.rename(partial, tmp_path / "b.m4a")
+
+        found = _wait_for_files(watcher, expected_count=2)
+
+    assert sorted(found) == [recordings / "a.m4a", tmp_path / "b.m4a"]
@@ -0,0 +1,55 @@
+import pytest
+
+from speechdown.infrastructure.vad import TrimmedAudio, split_on_silence, trim_silence
+
+
+def test_to_original_time_uses_offset_map():
+    trimmed = TrimmedAudio(audio=None, trimmed_seconds=8.0, offsets=[(0.0, 1.5), (2.0, 11.0)])
+
+    assert trimmed.to_original_time(0.5) == 2.0
+    assert trimmed.to_original_time(2.0) == 11.0
+    assert trimmed.to_original_time(3.25) == 12.25
+
+
+def test_trim_silence_drops_silent_regions_and_keeps_speech():
+    np = pytest.importorskip("numpy")
+    sample_rate = 16000
+    rng = np.random.default_rng(0)
+    speech = (0.3 * rng.standard_normal(2 * sample_rate)).astype(np.float32)
+    silence = np.zeros(5 * sample_rate, dtype=np.float32)
+    audio = np.concatenate([silence, speech, silence, speech, silence])
+
+    trimmed = trim_silence(audio)
+
+    # Each speech burst keeps 0.3 s of padding on both sides
+    assert trimmed.trimmed_seconds == pytest.approx(15 - 4 * 0.3, abs=0.1)
+    assert len(trimmed.audio) == len(audio) - round(trimmed.trimmed_seconds * sample_rate)
+    assert trimmed.to_original_time(0.3) == pytest.approx(5.0, abs=0.1)
+    assert trimmed.to_original_time(2.6 + 0.3) == pytest.approx(12.0, abs=0.1)
+
+
+def test_trim_silence_keeps_audio_without_speech_unchanged():
+    np = pytest.importorskip("numpy")
+    audio = np.zeros(16000, dtype=np.float32)
+
+    trimmed = trim_silence(audio)
+
+    assert trimmed.audio is audio
+    assert trimmed.trimmed_seconds == 0.0
+
+
+def test_split_on_silence_cuts_at_pauses():
+    np = pytest.importorskip("numpy")
+    sample_rate = 16000
+    rng = np.random.default_rng(0)
+    speech = (0.3 * rng.standard_normal(55 * sample_rate)).astype(np.float32)
+    pause = np.zeros(sample_rate, dtype=np.float32)
+    audio = np.concatenate([speech, pause, speech, pause, speech])
+
+    chunks = split_on_silence(audio, chunk_seconds=60)
+
+    assert len(chunks) == 3
+    assert sum(len(chunk) for chunk in chunks) == len(audio)
+    # Both cuts land inside the one-second pauses around 55 s and 111 s
+    assert 55 <= len(chunks[0]) / sample_rate <= 56
+    assert 111 <= (len(chunks[0]) + len(chunks[1])) / sample_rate <= 112
@@ -1,5 +1,8 @@
 import argparse
-from speechdown.presentation.cli.commands.common import add_common_arguments
+import io
+from pathlib import Path
+
+from speechdown.presentation.cli.commands.common import add_common_arguments, read_paths
 
 def test_add_common_arguments_directory_default():
     """Test that --directory defaults to '.' when not provided."""
@@ -37,3 +40,13 @@ def test_add_common_arguments_debug_provided():
     add_common_arguments(parser)
     args = parser.parse_args(["--debug"])
     assert args.debug is True
+
+
+def test_read_paths_newline_separated():
+    paths = read_paths(io.StringIO("a.m4a\nnotes/b 1.mp3\n\n"))
+    assert paths == [Path("a.m4a"), Path("notes/b 1.mp3")]
+
+
+def test_read_paths_nul_separated_allows_newlines_in_names():
+    paths = read_paths(io.StringIO("a.m4a\0odd\nname.m4a\0"))
+    assert paths == [Path("a.m4a"), Path("odd\nname.m4a")]
@@ -0,0 +1,35 @@
+import json
+import logging
+from unittest.mock import Mock
+
+import pytest
+
+from speechdown.infrastructure.adapters import whisper_model_adapter
+from speechdown.presentation.cli.commands.common import SpeechDownPaths
+from speechdown.presentation.cli.commands.transcribe import create_transcription_service
+
+
+@pytest.fixture
+def cascade_project(tmp_path, monkeypatch):
+    """A project with a model cascade; whisper is replaced, since no model is loaded."""
+    monkeypatch.setattr(whisper_model_adapter, "whisper", Mock())
+    (tmp_path / ".speechdown").mkdir()
+    config = {"languages": ["en"], "model_cascade": ["tiny", "small"], "audio_cache_mb": 64}
+    (tmp_path / ".speechdown" / "config.json").write_text(json.dumps(config))
+    return SpeechDownPaths.from_working_directory(tmp_path)
+
+
+def test_escalation_transcribers_share_the_audio_cache(cascade_project):
+    service, _ = create_transcription_service(cascade_project)
+
+    [escalation] = service._get_escalations()
+
+    assert escalation.audio_cache is not None
+    assert escalation.audio_cache is service.transcriber_port.audio_cache
+
+
+def test_cascade_in_long_file_mode_warns(cascade_project, caplog):
+    with caplog.at_level(logging.WARNING):
+        create_transcription_service(cascade_project, chunk_minutes=10)
+
+    assert "model cascade is not used in long-file mode" in caplog.text
@@ -0,0 +1,56 @@
+import importlib
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+# The commands package re-exports the `serve` function under the module's name
+serve_module = importlib.import_module("speechdown.presentation.cli.commands.serve")
+
+
+def test_daemon_uses_absolute_paths_and_restores_its_cwd(tmp_path, monkeypatch):
+    project = tmp_path / "proj"
+    (project / ".speechdown").mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+    created = {}
+
+    def create_transcription_service(speechdown_paths):
+        created["paths"] = speechdown_paths
+        return Mock(), Mock(load_count=1)
+
+    calls = []
+
+    def run_transcription(service, directory, **kwargs):
+        calls.append((os.getcwd(), directory))
+        return 2
+
+    responses = []
+
+    class FakeServer:
+        def __init__(self, socket, handle):
+            self.handle = handle
+
+        def start(self):
+            pass
+
+        def serve_forever(self):
+            os.chdir(project)
+            request = {"command": "transcribe", "cwd": str(tmp_path), "directory": "proj"}
+            responses.append(self.handle(request))
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(serve_module, "create_transcription_service", create_transcription_service)
+    monkeypatch.setattr(serve_module, "run_transcription", run_transcription)
+    monkeypatch.setattr(serve_module, "DaemonServer", FakeServer)
+
+    assert serve_module.serve(directory=project.relative_to(tmp_path)) == 0
+
+    paths = created["paths"]
+    assert all(
+        path.is_absolute()
+        for path in (paths.working_directory, paths.db, paths.config, paths.cache_dir)
+    )
+    assert responses[0]["status"] == "ok"
+    assert calls == [(str(tmp_path), Path("proj"))]
+    assert os.getcwd() == str(project)
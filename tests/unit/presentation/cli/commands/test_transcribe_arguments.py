@@ -1,5 +1,13 @@
 import argparse
-from speechdown.presentation.cli.commands.common import add_transcribe_arguments
+from pathlib import Path
+
+import pytest
+
+from speechdown.presentation.cli.commands.common import (
+    add_transcribe_arguments,
+    add_watch_arguments,
+)
+from speechdown.presentation.cli.commands.transcribe import select_audio_paths
 
 
 def test_within_hours_default_none():
@@ -14,3 +22,89 @@ def test_within_hours_parsed():
     add_transcribe_arguments(parser)
     args = parser.parse_args(["--within-hours", "12"])
     assert args.within_hours == 12.0
+
+
+def test_workers_default_one():
+    parser = argparse.ArgumentParser()
+    add_transcribe_arguments(parser)
+    args = parser.parse_args([])
+    assert args.workers == 1
+
+
+def test_workers_must_be_positive():
+    parser = argparse.ArgumentParser()
+    add_transcribe_arguments(parser)
+    assert parser.parse_args(["--workers", "4"]).workers == 4
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--workers", "0"])
+
+
+def test_prefetch_arguments():
+    parser = argparse.ArgumentParser()
+    add_transcribe_arguments(parser)
+    args = parser.parse_args(["--prefetch", "0", "--prefetch-max-mb", "64"])
+    assert args.prefetch == 0
+    assert args.prefetch_max_mb == 64
+
+
+def test_batch_size_argument():
+    parser = argparse.ArgumentParser()
+    add_transcribe_arguments(parser)
+    assert parser.parse_args([]).batch_size == 1
+    assert parser.parse_args(["--batch-size", "8"]).batch_size == 8
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--batch-size", "0"])
+
+
+def test_chunk_minutes_argument():
+    parser = argparse.ArgumentParser()
+    add_transcribe_arguments(parser)
+    assert parser.parse_args([]).chunk_minutes is None
+    assert parser.parse_args(["--chunk-minutes", "2.5"]).chunk_minutes == 2.5
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--chunk-minutes", "0"])
+
+
+def test_incremental_flag():
+    parser = argparse.ArgumentParser()
+    add_transcribe_arguments(parser)
+    assert parser.parse_args([]).incremental is False
+    assert parser.parse_args(["--incremental"]).incremental is True
+
+
+def test_watch_arguments():
+    parser = argparse.ArgumentParser()
+    add_watch_arguments(parser)
+    args = parser.parse_args([])
+    assert (args.quiet_seconds, args.catch_up_hours) == (2.0, 48.0)
+    assert parser.parse_args(["--catch-up-hours", "0"]).catch_up_hours == 0
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--quiet-seconds", "0"])
+
+
+def test_explicit_paths_and_stdin_flag():
+    parser = argparse.ArgumentParser()
+    add_transcribe_arguments(parser)
+    assert parser.parse_args([]).paths == []
+    args = parser.parse_args(["a.m4a", "notes/b.mp3", "--from-stdin"])
+    assert args.paths == [Path("a.m4a"), Path("notes/b.mp3")]
+    assert args.from_stdin is True
+
+
+def test_select_audio_paths_matches_scanned_form(tmp_path, monkeypatch):
+    (tmp_path / "notes").mkdir()
+    for name in ["notes/a.m4a", "notes/readme.txt"]:
+        (tmp_path / name).write_bytes(b"x")
+    monkeypatch.chdir(tmp_path)
+
+    selected = select_audio_paths(
+        [
+            tmp_path / "notes" / "a.m4a",
+            Path("./notes/a.m4a"),
+            Path("notes/readme.txt"),
+            Path("notes/missing.m4a"),
+        ],
+        Path("."),
+    )
+
+    assert selected == [Path("notes/a.m4a")]
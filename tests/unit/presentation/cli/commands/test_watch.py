@@ -0,0 +1,48 @@
+import importlib
+import logging
+from pathlib import Path
+from unittest.mock import Mock
+
+# The commands package re-exports the `watch` function under the module's name
+watch_module = importlib.import_module("speechdown.presentation.cli.commands.watch")
+
+
+def test_failed_batch_does_not_stop_the_watcher(tmp_path, monkeypatch, caplog):
+    (tmp_path / ".speechdown").mkdir()
+    service = Mock()
+    service.config_port.get_output_dir.return_value = None
+    batches = [[Path("gone.m4a")], [Path("next.m4a")]]
+
+    class FakeWatcher:
+        def __init__(self, directory, rules, quiet_seconds):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def iter_completed(self):
+            yield from batches
+
+    transcribed = []
+
+    def run_transcription_for_paths(transcription_service, paths):
+        if paths == batches[0]:
+            raise FileNotFoundError(paths[0])
+        transcribed.append(paths)
+        return len(paths)
+
+    monkeypatch.setattr(watch_module.inotify, "is_supported", lambda: True)
+    monkeypatch.setattr(
+        watch_module, "create_transcription_service", lambda paths: (service, Mock())
+    )
+    monkeypatch.setattr(watch_module, "DirectoryWatcher", FakeWatcher)
+    monkeypatch.setattr(watch_module, "run_transcription_for_paths", run_transcription_for_paths)
+
+    with caplog.at_level(logging.ERROR):
+        assert watch_module.watch(tmp_path, catch_up_hours=0) == 0
+
+    assert transcribed == [[Path("next.m4a")]]
+    assert "gone.m4a" in caplog.text